@@ -0,0 +1,59 @@
+"""Plumbing shared by the benchmarks: every sample runs in a fresh interpreter.
+
+A benchmark script supplies the function that takes one measurement and
+calls it through here:
+
+    parser = _harness.parser(__doc__)
+    args = parser.parse_args()
+    if _harness.child(args, measure):
+        return
+    samples = [_harness.run_child(__file__, 'mode') for _ in range(args.runs)]
+
+run_child() re-runs the script with a hidden ``--child`` option carrying the
+arguments as JSON; child() calls measure(*arguments) there and prints its
+JSON result for the parent to read.  Children use SDL's dummy video and
+audio drivers so they run headless.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+CHILD_ENV = {'SDL_VIDEODRIVER': 'dummy', 'SDL_AUDIODRIVER': 'dummy', 'PYGAME_HIDE_SUPPORT_PROMPT': '1'}
+
+
+def parser(doc) -> argparse.ArgumentParser:
+    """Argument parser described by doc's first line, with the hidden --child option."""
+    parser = argparse.ArgumentParser(description=doc.splitlines()[0])
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    return parser
+
+
+def child(args, measure) -> bool:
+    """If this is a child run, print measure(*arguments) as JSON and return True."""
+    if args.child is None:
+        return False
+    print(json.dumps(measure(*json.loads(args.child))))
+    return True
+
+
+def run_child(script, *arguments):
+    """Run script's measure(*arguments) in a fresh headless interpreter and return its result."""
+    out = subprocess.run(
+        [sys.executable, script, '--child', json.dumps(arguments)],
+        env=dict(os.environ, **CHILD_ENV), check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def use_disk_cache(cache_dir=None) -> None:
+    """Point the surface disk cache at cache_dir; None (the default) turns it off.
+
+    Call from measure(), so a benchmark never reads or fills the user's cache.
+    """
+    from game_screens import disk_cache
+    disk_cache._shared_cache = disk_cache.SurfaceDiskCache(cache_dir)
@@ -0,0 +1,61 @@
+"""Cold-load time of GameScreen's button sprites: sequential vs thread pool.
+
+Usage:
+    python benchmarks/asset_decode.py [--runs N]
+
+Each run starts a fresh interpreter so no sprite is cached and the OS file
+cache is the only thing shared between runs.  The measured span covers
+decoding, scaling and converting all 15 button PNGs at their on-screen
+sizes through sprite_cache.load_many().  SDL's dummy video driver is used so
+it runs headless.
+"""
+import os
+import statistics
+import time
+
+import _harness
+
+
+def cold_load_ms(mode: str) -> float:
+    import pygame
+    from game_screens import sprite_cache
+    from game_screens.display import GameScreen
+
+    # Cold means cold: no sprites from an earlier run's surface cache, and no writes to it
+    _harness.use_disk_cache(None)
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    requests = [
+        (os.path.join(GameScreen.ASSET_DIR, filename), GameScreen.button_size(name), True)
+        for name, filenames in GameScreen.BUTTON_FILES.items()
+        for filename in filenames
+    ]
+    executor = sprite_cache.decode_executor() if mode == 'threaded' else None
+    if executor is not None:
+        # Pool start-up isn't decode time; the game pays it once per process
+        executor.submit(int).result()
+
+    start = time.perf_counter()
+    sprite_cache.load_many(requests, executor)
+    elapsed = (time.perf_counter() - start) * 1000
+    pygame.quit()
+    return elapsed
+
+
+def main():
+    parser = _harness.parser(__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    if _harness.child(args, cold_load_ms):
+        return
+
+    print(f"cold sprite load over {args.runs} runs (ms)")
+    print(f"{'mode':<12}{'median':>10}{'min':>10}{'max':>10}")
+    for mode in ('sequential', 'threaded'):
+        samples = [_harness.run_child(__file__, mode) for _ in range(args.runs)]
+        print(f"{mode:<12}{statistics.median(samples):>10.1f}{min(samples):>10.1f}{max(samples):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Scheduling latency of button tones: input to sound start and flash to tone.
+
+Usage:
+    python benchmarks/audio_latency.py [--rounds N] [--preset NAME ...]
+
+Each mixer preset (default: every entry in audio.PRESETS) runs in a fresh
+interpreter, because pre_init only applies before pygame.init().  A
+GameScreen plays N rounds; a driver task answers every sequence with
+synthetic keypresses.  Timestamps are taken with perf_counter when:
+
+- a keypress is posted                       -> input to tone
+- the frame showing a flash is presented     -> flash to tone
+- the tone's Channel.play() returns
+
+Both are scheduling latencies.  The estimated A/V offset adds one mixer
+buffer, the least time a started sound takes to reach the device, to the
+worst flash-to-tone time.  It is checked against audio.AV_SYNC_TOLERANCE_MS.
+Display scan-out delay isn't measurable headless and isn't included.  SDL's
+dummy video and audio drivers are used so it runs anywhere, and NumPy must
+be installed for the tones.
+"""
+import asyncio
+import statistics
+import time
+
+import _harness
+from game_screens import audio
+
+
+def measure(preset: str, rounds: int) -> dict:
+    import pygame
+    from game_screens import render_target, sounds
+    from game_screens.display import GameScreen
+
+    # Keep benchmark runs out of the user's surface cache
+    _harness.use_disk_cache(None)
+    settings = audio.pre_init(preset)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    game_screen = GameScreen(screen, dirty_rects=True)
+    if not game_screen.tones:
+        raise SystemExit("no tones: NumPy missing or the mixer failed to start")
+    names = {tone: name for name, tone in game_screen.tones.items()}
+
+    inputs = {}      # button -> perf_counter when its keypress was posted
+    presented = {}   # (button, flash state) -> perf_counter of the latest frame showing it
+    input_ms, flash_ms = [], []
+
+    # Instrument the two calls the game makes around a tone
+    present = render_target.present
+
+    def timed_present(rects=None):
+        result = present(rects)
+        if game_screen.flash_button:
+            presented[(game_screen.flash_button, game_screen.flash_state)] = time.perf_counter()
+        return result
+
+    render_target.present = timed_present
+    manager = sounds.manager()
+    play_sound = manager.play_sound
+
+    def timed_play_sound(sound, priority=0):
+        channel = play_sound(sound, priority)
+        started, name = time.perf_counter(), names[sound]
+        state = 'pressed' if name in inputs else 'indicated'
+        flash_ms.append((started - presented[(name, state)]) * 1000)
+        if name in inputs:
+            input_ms.append((started - inputs.pop(name)) * 1000)
+        return channel
+
+    manager.play_sound = timed_play_sound
+
+    async def player():
+        while game_screen.score < rounds:
+            await asyncio.sleep(0.05)
+            if game_screen.state != 'input' or game_screen.flash_button or inputs:
+                continue
+            name = game_screen.sequence[game_screen.player_index]
+            inputs[name] = time.perf_counter()
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=GameScreen.BUTTON_KEYS[name], mod=0))
+
+    async def run():
+        game = asyncio.ensure_future(game_screen.run())
+        await player()
+        game.cancel()
+
+    asyncio.run(run())
+    pygame.quit()
+    return {
+        'buffer_ms':  audio.buffer_ms(settings),
+        'input_ms':   input_ms,
+        'flash_ms':   flash_ms,
+    }
+
+
+def main():
+    parser = _harness.parser(__doc__)
+    parser.add_argument('--rounds', type=int, default=8)
+    parser.add_argument('--preset', nargs='+', choices=list(audio.PRESETS), default=list(audio.PRESETS))
+    args = parser.parse_args()
+
+    if _harness.child(args, measure):
+        return
+
+    tolerance = audio.AV_SYNC_TOLERANCE_MS
+    print(f"tone scheduling latency over {args.rounds} rounds (ms); A/V tolerance {tolerance} ms")
+    print(f"{'preset':<12}{'buffer':>8}{'input p50':>11}{'input max':>11}"
+          f"{'flash p50':>11}{'flash max':>11}{'A/V est':>9}  ok")
+    for preset in args.preset:
+        result = _harness.run_child(__file__, preset, args.rounds)
+        inputs, flashes = result['input_ms'], result['flash_ms']
+        offset = max(flashes) + result['buffer_ms']
+        print(f"{preset:<12}{result['buffer_ms']:>8.1f}"
+              f"{statistics.median(inputs):>11.1f}{max(inputs):>11.1f}"
+              f"{statistics.median(flashes):>11.2f}{max(flashes):>11.2f}"
+              f"{offset:>9.1f}  {'yes' if offset <= tolerance else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
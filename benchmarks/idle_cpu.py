@@ -0,0 +1,60 @@
+"""CPU use of a paused GameScreen with and without adaptive frame pacing.
+
+Usage:
+    python benchmarks/idle_cpu.py [--seconds N]
+
+Each mode runs in a fresh interpreter: a GameScreen is started, paused with
+a synthetic P keypress and left running for N seconds (default 600, the
+10-minute idle run).  CPU use is process time over wall time, so 100% is
+one core pegged.  SDL's dummy video/audio drivers are used so it runs
+headless.
+"""
+import asyncio
+import time
+
+import _harness
+
+
+def idle_cpu_percent(mode: str, seconds: float) -> float:
+    import pygame
+    from game_screens.display import GameScreen
+    from game_screens.pacing import FramePacer
+    from game_screens.pause_overlay import PauseOverlay
+
+    # Keep benchmark runs out of the user's surface cache
+    _harness.use_disk_cache(None)
+    FramePacer.ADAPTIVE = mode == 'adaptive'
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    game_screen = GameScreen(screen, pause_overlay=PauseOverlay(screen, freeze=True), dirty_rects=True)
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p, mod=0))
+
+    async def run():
+        try:
+            await asyncio.wait_for(game_screen.run(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    asyncio.run(run())
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    pygame.quit()
+    return cpu / wall * 100
+
+
+def main():
+    parser = _harness.parser(__doc__)
+    parser.add_argument('--seconds', type=float, default=600)
+    args = parser.parse_args()
+
+    if _harness.child(args, idle_cpu_percent):
+        return
+
+    print(f"CPU use of a paused game over {args.seconds:g}s")
+    print(f"{'pacing':<10}{'cpu %':>10}")
+    for mode in ('fixed', 'adaptive'):
+        print(f"{mode:<10}{_harness.run_child(__file__, mode, args.seconds):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
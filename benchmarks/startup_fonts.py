@@ -0,0 +1,54 @@
+"""Time-to-first-frame with bundled vs system (SysFont) font loading.
+
+Usage:
+    python benchmarks/startup_fonts.py [--runs N]
+
+Each run starts a fresh interpreter so the system font scan SysFont triggers
+on first use is never pre-warmed.  The measured span covers importing
+pygame, opening the window, building a GameScreen and presenting its first
+frame.  SDL's dummy video/audio drivers are used so it runs headless.
+"""
+import statistics
+import time
+
+import _harness
+
+
+def first_frame_ms(mode: str) -> float:
+    start = time.perf_counter()
+
+    import pygame
+    from game_screens import fonts
+    from game_screens.display import GameScreen
+
+    # Cold means cold: no sprites from an earlier run's surface cache
+    _harness.use_disk_cache(None)
+    fonts.registry().set_mode(mode)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    game_screen = GameScreen(screen)
+    game_screen._draw()
+    pygame.display.flip()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    pygame.quit()
+    return elapsed
+
+
+def main():
+    parser = _harness.parser(__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    if _harness.child(args, first_frame_ms):
+        return
+
+    print(f"time-to-first-frame over {args.runs} cold runs (ms)")
+    print(f"{'mode':<10}{'median':>10}{'min':>10}{'max':>10}")
+    for mode in ('system', 'bundled'):
+        samples = [_harness.run_child(__file__, mode) for _ in range(args.runs)]
+        print(f"{mode:<10}{statistics.median(samples):>10.1f}{min(samples):>10.1f}{max(samples):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
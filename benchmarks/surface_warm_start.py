@@ -0,0 +1,73 @@
+"""Start-up cost of generated surfaces: cold build vs warm on-disk cache.
+
+Usage:
+    python benchmarks/surface_warm_start.py [--runs N]
+
+Each run starts a fresh interpreter, so only the on-disk surface cache
+carries over.  The measured span builds what the screens need before their
+first frame: the start and game over gradients, all 15 button sprites
+at their on-screen sizes and the countdown ring sheet.  "cold" points the
+cache at an empty directory; "warm" at one filled by an untimed run first.
+SDL's dummy video driver is used so it runs headless.
+"""
+import os
+import statistics
+import tempfile
+import time
+
+import _harness
+
+
+def build_ms(cache_dir: str) -> float:
+    import pygame
+    from game_screens import animation_utils, sprite_cache
+    from game_screens.countdown import CountdownWidget
+    from game_screens.display import GameScreen
+    from game_screens.gameover import GameOverScreen
+
+    _harness.use_disk_cache(cache_dir)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    gradients = [
+        ((25, 25, 112), (48, 25, 52)),   # start screen
+        (GameOverScreen.gradient_top, GameOverScreen.gradient_bottom),
+    ]
+    requests = [
+        (os.path.join(GameScreen.ASSET_DIR, filename), GameScreen.button_size(name), True)
+        for name, _, filename in GameScreen.sprite_files()
+    ]
+
+    start = time.perf_counter()
+    for top, bottom in gradients:
+        animation_utils.prepare_gradient(screen.get_size(), top, bottom)
+    sprite_cache.load_many(requests)
+    CountdownWidget()
+    elapsed = (time.perf_counter() - start) * 1000
+    pygame.quit()
+    return elapsed
+
+
+def main():
+    parser = _harness.parser(__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    if _harness.child(args, build_ms):
+        return
+
+    cold, warm = [], []
+    with tempfile.TemporaryDirectory() as warm_dir:
+        _harness.run_child(__file__, warm_dir)  # fill the warm cache
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as cold_dir:
+                cold.append(_harness.run_child(__file__, cold_dir))
+            warm.append(_harness.run_child(__file__, warm_dir))
+
+    print(f"generated surfaces over {args.runs} runs (ms)")
+    print(f"{'start':<8}{'median':>10}{'min':>10}{'max':>10}")
+    for mode, samples in (('cold', cold), ('warm', warm)):
+        print(f"{mode:<8}{statistics.median(samples):>10.1f}{min(samples):>10.1f}{max(samples):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,3 @@
 @echo off
+python tools\build_sprite_atlas.py
 pygbag --ume_block=0 .
@@ -1,58 +1,151 @@
-import pygame
+import io
 import math
+import os
+import pygame
+from . import disk_cache
+from . import fonts
+from . import quality
+from . import sounds
+from . import text_cache
+from .countdown import CountdownWidget
+from .glyph_atlas import GlyphAtlas
+from .surface_cache import SurfaceCache
 
-# Cache for pre-rendered gradient surfaces, keyed by (size, top_color, bottom_color)
-_gradient_cache = {}
+# Pre-rendered gradient surfaces, keyed by (size, top_color, bottom_color).
+# Bounded so animated theme gradients can't grow it without limit; a full
+# 800x600 gradient is ~1.9MB, so the default budget keeps a handful.
+GRADIENT_CACHE_BUDGET = 8 * 1024 * 1024
+_gradient_cache = SurfaceCache(GRADIENT_CACHE_BUDGET)
 
+# Shared glyph atlas for the per-character effects (wave_text, draw_animated_icons)
+_glyph_atlas = GlyphAtlas()
 
-def draw_gradient(screen, gradient_top=(25, 25, 112), gradient_bottom=(0, 0, 0)):
-    """Draw a vertical gradient from top to bottom.
+# CountdownWidgets behind draw_countdown_timer, keyed by (font, color)
+_countdown_widgets = {}
+
+# Preloaded music files, streamed from memory by play_music(); keyed by path
+_music_data = {}
+
+
+def gradient_cache() -> SurfaceCache:
+    """The cache behind get_gradient(); see SurfaceCache.stats()."""
+    return _gradient_cache
 
-    To avoid expensive per-frame drawing (one draw call per pixel row),
-    the gradient is pre-rendered into a cached Surface keyed by size and colors.
+
+def _gradient_column(height, gradient_top, gradient_bottom) -> bytes:
+    """RGB bytes for a 1-pixel-wide column blending top to bottom."""
+    column = bytearray(height * 3)
+    for y in range(height):
+        ratio = y / height
+        for c in range(3):
+            column[y * 3 + c] = int(gradient_top[c] * (1 - ratio) + gradient_bottom[c] * ratio)
+    return bytes(column)
+
+
+def get_gradient(size, gradient_top=(25, 25, 112), gradient_bottom=(0, 0, 0)):
+    """Return the cached vertical gradient surface for size and colors.
+
+    The gradient is computed once as a 1-pixel-wide column and stretched to
+    full width with ``transform.scale`` (nearest-neighbour, so every row stays
+    a solid color) — one scale call instead of one draw call per pixel row.
+    A gradient built here, mid-frame, isn't written to the disk cache; only
+    the ones prepared by gradient_steps() are.
     """
-    size = screen.get_size()
-    cache_key = (size, gradient_top, gradient_bottom)
+    cache_key = (tuple(size), tuple(gradient_top), tuple(gradient_bottom))
 
     gradient_surface = _gradient_cache.get(cache_key)
     if gradient_surface is None:
-        width, height = size
-        # Create a surface compatible with the display for fast blitting
-        gradient_surface = pygame.Surface(size).convert()
-        for y in range(height):
-            # Calculate the color at this y position
-            ratio = y / height
-            r = int(gradient_top[0] * (1 - ratio) + gradient_bottom[0] * ratio)
-            g = int(gradient_top[1] * (1 - ratio) + gradient_bottom[1] * ratio)
-            b = int(gradient_top[2] * (1 - ratio) + gradient_bottom[2] * ratio)
-            pygame.draw.line(gradient_surface, (r, g, b), (0, y), (width, y))
-        _gradient_cache[cache_key] = gradient_surface
-
-    screen.blit(gradient_surface, (0, 0))
+        gradient_surface = _stored_gradient(cache_key)
+        if gradient_surface is None:
+            column = _gradient_column(size[1], gradient_top, gradient_bottom)
+            gradient_surface = _stretch_gradient(column, cache_key, persist=False)
+        _gradient_cache.put(cache_key, gradient_surface)
+    return gradient_surface
+
+
+def gradient_steps(size, gradient_top=(25, 25, 112), gradient_bottom=(0, 0, 0)):
+    """Job for JobScheduler: build get_gradient()'s surface in two slices.
+
+    Submitted ahead of time (e.g. while the start screen runs) so the first
+    frame that needs the gradient finds it cached.  The result is also
+    written to the disk cache, so the next launch maps it instead.
+    """
+    cache_key = (tuple(size), tuple(gradient_top), tuple(gradient_bottom))
+    if cache_key in _gradient_cache:
+        return
+    stored = _stored_gradient(cache_key)
+    if stored is not None:
+        _gradient_cache.put(cache_key, stored)
+        return
+    column = _gradient_column(size[1], gradient_top, gradient_bottom)
+    yield 0.5
+    _gradient_cache.put(cache_key, _stretch_gradient(column, cache_key, persist=True))
+
+
+def prepare_gradient(size, gradient_top=(25, 25, 112), gradient_bottom=(0, 0, 0)):
+    """Run gradient_steps() to completion now, e.g. while a screen is being built.
+
+    For a gradient needed by the very first frame, which no background job
+    could prepare in time; returns the surface get_gradient() will serve.
+    """
+    for _ in gradient_steps(size, gradient_top, gradient_bottom):
+        pass
+    return get_gradient(size, gradient_top, gradient_bottom)
+
+
+def _stored_gradient(cache_key):
+    """The gradient from an earlier launch's disk cache, converted for the display, or None."""
+    stored = disk_cache.load(('gradient',) + cache_key)
+    return stored.convert() if stored is not None else None
+
+
+def _stretch_gradient(column, cache_key, persist):
+    width, height = cache_key[0]
+    strip = pygame.image.frombuffer(column, (1, height), 'RGB')
+    gradient = pygame.transform.scale(strip, (width, height))
+    if persist:
+        disk_cache.store(('gradient',) + cache_key, gradient, alpha=False)
+    # Convert to the display format for fast blitting
+    return gradient.convert()
+
+
+def draw_gradient(screen, gradient_top=(25, 25, 112), gradient_bottom=(0, 0, 0)):
+    """Draw a vertical gradient from top to bottom."""
+    screen.blit(get_gradient(screen.get_size(), gradient_top, gradient_bottom), (0, 0))
+
+
 def wave_text(screen, text, position=None, font_size=72, color=(255, 255, 255), bounce_height=15, wave_speed=0.3, font=None, font_name=None):
     """Draw text with each letter bouncing in a wave pattern"""
     if font is None:
-        font = pygame.font.SysFont(font_name, font_size) if font_name else pygame.font.Font(None, font_size)
+        font = fonts.get_font(font_size, font_name)
     if position is None:
         position = (screen.get_width() // 2, screen.get_height() // 2)
 
+    if not quality.enabled('wave_text'):
+        # Reduced quality: the whole title as one cached surface, no per-letter blits
+        surf = text_cache.render(font, text, color)
+        screen.blit(surf, surf.get_rect(center=position))
+        return
+
     # Calculate total width of text to center it
-    total_width = sum(font.size(char)[0] for char in text)
+    total_width = _glyph_atlas.text_width(font, text, color)
     current_x = position[0] - total_width // 2
 
-    # Draw each letter with its own bounce offset
+    # Each letter bounces with its own offset; all letters go out in one batched blit
+    blits = []
     for i, char in enumerate(text):
         # Each letter bounces with a time offset based on its position
         time_offset = i * wave_speed
         bounce = math.sin((pygame.time.get_ticks() / 500) + time_offset) * bounce_height
 
-        char_surface = font.render(char, True, color)
-        char_width = font.size(char)[0]
-        char_rect = char_surface.get_rect(center=(current_x + char_width // 2, position[1] + bounce))
-        screen.blit(char_surface, char_rect)
+        page, area, char_width = _glyph_atlas.glyph(font, char, color)
+        dest = (current_x + char_width // 2 - area[2] // 2, int(position[1] + bounce) - area[3] // 2)
+        blits.append((page, dest, area))
 
         current_x += char_width
 
+    screen.blits(blits, doreturn=False)
+
 
 def draw_animated_icons(screen, string="TYP0!", position=None, radius=100, font_size=48, color=(255, 255, 255), rotation_speed=2, font=None, font_name=None):
     """Draw animated icons around the title"""
@@ -65,33 +158,38 @@ def draw_animated_icons(screen, string="TYP0!", position=None, radius=100, font_
     angle = time * rotation_speed  # Rotate based on rotation_speed
     count = len(string)
     if font is None:
-        icon_font = pygame.font.SysFont(font_name, font_size) if font_name else pygame.font.Font(None, font_size)
+        icon_font = fonts.get_font(font_size, font_name)
     else:
         icon_font = font
+    blits = []
     for i in range(count):
         icon_x = position[0] + radius * math.cos(angle + i * (2 * math.pi / count))
         icon_y = position[1] + radius * math.sin(angle + i * (2 * math.pi / count))
         # Draw a letter from the string as an icon
-        icon_text = icon_font.render(string[i % len(string)], True, color)
-        icon_rect = icon_text.get_rect(center=(icon_x, icon_y))
-        screen.blit(icon_text, icon_rect)
+        page, area, _ = _glyph_atlas.glyph(icon_font, string[i % len(string)], color)
+        blits.append((page, (int(icon_x) - area[2] // 2, int(icon_y) - area[3] // 2), area))
+    screen.blits(blits, doreturn=False)
 
 
 def flashing_text(screen, text, position=None, font_size=36, color_on=(255, 255, 255), color_off=(100, 100, 100), flash_speed=500, font=None, font_name=None):
     """Draw flashing text at the bottom of the screen"""
     if font is None:
-        font = pygame.font.SysFont(font_name, font_size) if font_name else pygame.font.Font(None, font_size)
+        font = fonts.get_font(font_size, font_name)
     flash = (pygame.time.get_ticks() // flash_speed) % 2 == 0
     color = color_on if flash else color_off
-    text_surface = font.render(text, True, color)
+    text_surface = text_cache.render(font, text, color)
     if position is None:
         position = (screen.get_width() // 2, screen.get_height() - 30)
     text_rect = text_surface.get_rect(center=position)
     screen.blit(text_surface, text_rect)
 
 
-def loading_bar(screen, start_time, position=None, width=400, height=20, color=(255, 255, 255), load_time=5000):
-    """Draw a loading bar at the bottom of the screen"""
+def loading_bar(screen, start_time, position=None, width=400, height=20, color=(255, 255, 255), load_time=5000, progress=None):
+    """Draw a loading bar at the bottom of the screen.
+
+    progress (0-1) shows real work, e.g. JobScheduler.progress; without it the
+    bar fills over load_time ms from start_time.
+    """
     if position is None:
         position = (screen.get_width() // 2, screen.get_height() - 50)
 
@@ -99,18 +197,30 @@ def loading_bar(screen, start_time, position=None, width=400, height=20, color=(
     bar_y = position[1]
 
     pygame.draw.rect(screen, color, (bar_x, bar_y, width, height), 2)
-    # Calculate progress based on elapsed time
-    elapsed = pygame.time.get_ticks() - start_time
-    progress = min(elapsed / load_time, 1.0)
+    if progress is None:
+        # Calculate progress based on elapsed time
+        elapsed = pygame.time.get_ticks() - start_time
+        progress = elapsed / load_time
+    progress = min(progress, 1.0)
     fill_width = progress * width
     pygame.draw.rect(screen, color, (bar_x, bar_y, fill_width, height))
     return progress >= 1.0  # Return True when bar is full
 
-def play_music(file):
-    """Play background music"""
+def preload_music(file):
+    """Read a music file into memory so play_music() streams it without touching disk."""
+    with open(file, 'rb') as f:
+        _music_data[file] = f.read()
+
+
+def play_music(file, loops=-1):
+    """Play background music, looping indefinitely by default"""
+    data = _music_data.get(file)
     try:
-        pygame.mixer.music.load(file)
-        pygame.mixer.music.play(-1)  # Loop indefinitely
+        if data is not None:
+            pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(file)[1][1:])
+        else:
+            pygame.mixer.music.load(file)
+        pygame.mixer.music.play(loops)
         return True
     except pygame.error as exc:
         print(f"Warning: failed to load music {file}: {exc}")
@@ -120,40 +230,51 @@ def stop_music():
     """Stop background music"""
     pygame.mixer.music.stop()
 
-def play_sound(file):
-    """Play a one-shot sound effect"""
+def load_sound(file):
+    """Return the decoded Sound for file from the shared sound cache."""
+    return sounds.load(file)
+
+def play_sound(file, priority=0):
+    """Play a one-shot sound effect on the shared channel pool"""
     try:
-        sound = pygame.mixer.Sound(file)
-        sound.play()
+        return sounds.play(file, priority)
     except pygame.error as exc:
         print(f"Warning: failed to play sound {file}: {exc}")
+        return None
+
+
+def shadowed_text_blits(font, text, center, color=(255, 255, 255), shadow_color=(0, 0, 0), shadow_offset=1):
+    """Return the (surface, rect) blits for centered text with a drop shadow.
+
+    Suitable for Surface.blits or a DisplayList; the shadow comes first.
+    """
+    shadow_surf, text_surf = text_cache.render_shadowed(font, text, color, shadow_color)
+    return [
+        (shadow_surf, shadow_surf.get_rect(center=(center[0] + shadow_offset, center[1] + shadow_offset))),
+        (text_surf, text_surf.get_rect(center=center)),
+    ]
 
 
 def draw_shadowed_text(screen, font, text, center, color=(255, 255, 255), shadow_color=(0, 0, 0), shadow_offset=1):
     """Draw text centered at a position with a drop shadow."""
-    shadow_surf = font.render(text, True, shadow_color)
-    screen.blit(shadow_surf, shadow_surf.get_rect(center=(center[0] + shadow_offset, center[1] + shadow_offset)))
-    text_surf = font.render(text, True, color)
-    screen.blit(text_surf, text_surf.get_rect(center=center))
+    screen.blits(shadowed_text_blits(font, text, center, color, shadow_color, shadow_offset), doreturn=False)
 
 
 # Physical Countdown Timer
 def draw_countdown_timer(screen, time_left, position=None, font_size=48, color=(255, 255, 255), font=None, font_name=None):
-    """Draw a countdown timer with a circular progress bar"""
+    """Draw a countdown timer with a circular progress bar.
+
+    The ring is full at GameTimer.TIME_LIMIT; see CountdownWidget, which
+    this wraps with one shared widget per font and color.
+    """
     if font is None:
-        font = pygame.font.SysFont(font_name, font_size) if font_name else pygame.font.Font(None, font_size)
+        font = fonts.get_font(font_size, font_name)
     if position is None:
         position = (screen.get_width() // 2, screen.get_height() // 2)
 
-    # Draw circular progress bar
-    radius = 60
-    thickness = 10
-    end_angle = (time_left / 10000) * 360  # Assuming time_left is in milliseconds and max is 10 seconds
-    pygame.draw.circle(screen, (100, 100, 100), position, radius, thickness)  # Background circle
-    pygame.draw.arc(screen, (255, 255, 255), (position[0] - radius, position[1] - radius, radius * 2, radius * 2), -math.pi / 2, math.radians(end_angle - 90), thickness)
-
-    # Draw time left as text
-    seconds_left = max(0, int(time_left / 1000))
-    text_surf = font.render(str(seconds_left), True, color)
-    text_rect = text_surf.get_rect(center=position)
-    screen.blit(text_surf, text_rect)
\ No newline at end of file
+    key = (font, tuple(color))
+    widget = _countdown_widgets.get(key)
+    if widget is None:
+        widget = CountdownWidget(font=font, color=color)
+        _countdown_widgets[key] = widget
+    widget.draw(screen, time_left, position)
@@ -0,0 +1,44 @@
+import sys
+import pygame
+
+# Mixer settings per sys.platform, passed to pygame.mixer.pre_init().  ``buffer``
+# is in sample frames: one buffer is the floor on how long a play() takes to be
+# heard, so smaller is snappier, but too small underruns (crackles) on slow hosts.
+PRESETS = {
+    # pygame's own defaults, for platforms not listed
+    'default':    {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 512},
+    'linux':      {'frequency': 48000, 'size': -16, 'channels': 2, 'buffer': 256},
+    'darwin':     {'frequency': 48000, 'size': -16, 'channels': 2, 'buffer': 256},
+    # Shared-mode WASAPI mixes in ~10ms periods, so going below 512 frames gains nothing
+    'win32':      {'frequency': 48000, 'size': -16, 'channels': 2, 'buffer': 512},
+    # Web Audio runs SDL's callback on the main thread under pygbag, so stay at
+    # pygame's default; 1024 frames (23 ms) alone would exceed AV_SYNC_TOLERANCE_MS
+    'emscripten': {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 512},
+}
+
+# Largest accepted offset between a button lighting up and its tone being heard.
+# GameScreen starts tones right after presenting the flash, so the offset is the
+# mixer buffer plus scheduling delay, and every preset's buffer must fit inside
+# it; see benchmarks/audio_latency.py.
+AV_SYNC_TOLERANCE_MS = 20
+
+
+def preset_name(platform=None) -> str:
+    """The PRESETS entry for platform (default: this one)."""
+    platform = sys.platform if platform is None else platform
+    return platform if platform in PRESETS else 'default'
+
+
+def buffer_ms(settings) -> float:
+    """Duration of one mixer buffer for settings, in milliseconds."""
+    return settings['buffer'] / settings['frequency'] * 1000
+
+
+def pre_init(name=None) -> dict:
+    """Configure the mixer before pygame.init(); returns the settings used.
+
+    name picks a PRESETS entry, defaulting to the one for this platform.
+    """
+    settings = PRESETS[name or preset_name()]
+    pygame.mixer.pre_init(**settings)
+    return settings
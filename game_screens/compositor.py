@@ -0,0 +1,55 @@
+from . import animation_utils
+
+
+class LayerCompositor:
+    """Composes a screen from a cached static background plus animated layers.
+
+    Static layers are drawn once on top of a copy of the cached gradient from
+    animation_utils.get_gradient(); the result is kept as a single surface,
+    so each frame costs one full-screen blit followed by the animated layers.
+
+    Layers are callables taking the surface to draw on:
+
+        compositor = LayerCompositor(screen, top, bottom)
+        compositor.add_static(lambda surface: ...)    # drawn once
+        compositor.add_animated(lambda surface: ...)  # drawn every frame
+        compositor.draw()
+    """
+
+    def __init__(self, screen, gradient_top, gradient_bottom):
+        self.screen = screen
+        self.gradient_top = gradient_top
+        self.gradient_bottom = gradient_bottom
+        self.builds = 0
+        self._static = []
+        self._animated = []
+        self._composed = None  # gradient + static layers
+
+    def add_static(self, draw) -> None:
+        self._static.append(draw)
+        self.invalidate()
+
+    def add_animated(self, draw) -> None:
+        self._animated.append(draw)
+
+    def invalidate(self) -> None:
+        """Force the static layers to be re-composed, e.g. after a display mode change."""
+        self._composed = None
+
+    def composed(self):
+        """Return the cached static surface, composing it if needed."""
+        size = self.screen.get_size()
+        if self._composed is None or self._composed.get_size() != size:
+            # Copy so static layers never draw into the shared gradient cache
+            surface = animation_utils.get_gradient(size, self.gradient_top, self.gradient_bottom).copy()
+            for draw in self._static:
+                draw(surface)
+            self._composed = surface
+            self.builds += 1
+        return self._composed
+
+    def draw(self) -> None:
+        """Blit the static layers, then draw every animated layer on top."""
+        self.screen.blit(self.composed(), (0, 0))
+        for draw in self._animated:
+            draw(self.screen)
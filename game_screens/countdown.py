@@ -0,0 +1,111 @@
+import math
+import pygame
+from . import disk_cache
+from . import fonts
+from . import text_cache
+from .game_timer import GameTimer
+
+# Ring sprite sheets shared by every widget, keyed by (radius, thickness, steps, ring_color, track_color)
+_sheets = {}
+
+
+class CountdownWidget:
+    """Circular countdown drawn from pre-rendered sprites.
+
+    The ring is quantized to ``steps`` angle steps and rendered once into a
+    sprite sheet of ``steps + 1`` frames (frame 0 is the empty track, frame
+    ``steps`` the full ring); the digit for every whole second up to
+    ``max_time`` is rendered once too.  Drawing a frame is then a single
+    ``blits`` call of two items: the ring frame and the digit.
+
+    Sheets are shared between widgets with the same radius, thickness, step
+    count and colors, so rebuilding a widget is cheap.
+    """
+
+    STEPS = 36          # 10° per frame
+    SHEET_COLUMNS = 8   # frames per sheet row, keeps the sheet roughly square
+
+    def __init__(self, radius=60, thickness=10, steps=STEPS, max_time=GameTimer.TIME_LIMIT,
+                 ring_color=(255, 255, 255), track_color=(100, 100, 100),
+                 color=(255, 255, 255), font=None, font_size=48, font_name=None):
+        self.radius = radius
+        self.thickness = thickness
+        self.steps = steps
+        self.max_time = max_time  # milliseconds; the ring is full at this value
+        self.ring_color = tuple(ring_color)
+        self.track_color = tuple(track_color)
+        self.color = tuple(color)
+        self.font = font if font is not None else fonts.get_font(font_size, font_name)
+
+        self.sheet = self._sheet()
+        # Every whole second the countdown can show, rendered up front
+        self.digits = [
+            text_cache.render(self.font, str(seconds), self.color)
+            for seconds in range(self._seconds_left(max_time) + 1)
+        ]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def step(self, time_left) -> int:
+        """Index of the ring frame shown for time_left milliseconds."""
+        fraction = min(max(time_left / self.max_time, 0.0), 1.0)
+        return round(fraction * self.steps)
+
+    def frame_area(self, step):
+        """(x, y, w, h) of ring frame step inside the sheet."""
+        size = self.radius * 2
+        row, col = divmod(step, self.SHEET_COLUMNS)
+        return (col * size, row * size, size, size)
+
+    def blits(self, time_left, position):
+        """Return the (surface, dest[, area]) items for the ring and digit."""
+        ring_dest = (position[0] - self.radius, position[1] - self.radius)
+
+        digit = self.digits[min(self._seconds_left(time_left), len(self.digits) - 1)]
+        return [
+            (self.sheet, ring_dest, self.frame_area(self.step(time_left))),
+            (digit, digit.get_rect(center=position)),
+        ]
+
+    def draw(self, screen, time_left, position) -> None:
+        screen.blits(self.blits(time_left, position), doreturn=False)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _seconds_left(time_left) -> int:
+        return max(0, int(time_left / 1000))
+
+    def _sheet(self):
+        key = (self.radius, self.thickness, self.steps, self.ring_color, self.track_color)
+        sheet = _sheets.get(key)
+        if sheet is None:
+            # An earlier launch's sheet is used straight from the mapped file
+            name = ('countdown', self.SHEET_COLUMNS) + key
+            sheet = disk_cache.load(name)
+            if sheet is None:
+                sheet = self._render_sheet()
+                disk_cache.store(name, sheet)
+            _sheets[key] = sheet
+        return sheet
+
+    def _render_sheet(self):
+        size = self.radius * 2
+        frames = self.steps + 1
+        rows = math.ceil(frames / self.SHEET_COLUMNS)
+        sheet = pygame.Surface((min(frames, self.SHEET_COLUMNS) * size, rows * size), pygame.SRCALPHA)
+
+        for step in range(frames):
+            x, y, _, _ = self.frame_area(step)
+            center = (x + self.radius, y + self.radius)
+            pygame.draw.circle(sheet, self.track_color, center, self.radius, self.thickness)
+            if step:
+                # Clockwise from 12 o'clock, same geometry draw_countdown_timer always used
+                end_angle = step / self.steps * 360
+                pygame.draw.arc(sheet, self.ring_color, (x, y, size, size),
+                                -math.pi / 2, math.radians(end_angle - 90), self.thickness)
+        return sheet
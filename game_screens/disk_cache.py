@@ -0,0 +1,196 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+# Per-user cache directory; one .surf file per cached surface
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'typ0', 'surfaces',
+)
+
+# Bytes of .surf files kept on disk; store() prunes the least recently used beyond this
+DISK_CACHE_BUDGET = 32 * 1024 * 1024
+
+# Content digests of source files, keyed by (path, mtime_ns, size) so each file is hashed once per process
+_digests = {}
+
+
+def file_digest(path) -> str:
+    """SHA-256 of the file at path; raises OSError if it can't be read."""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(key)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        _digests[key] = digest
+    return digest
+
+
+class SurfaceDiskCache:
+    """Generated surfaces persisted across launches as raw pixel files.
+
+    Each entry is identified by a ``name`` tuple (what the surface is, e.g.
+    ``('gradient', size, top, bottom)``) and validated against ``inputs``
+    (what it was built from, e.g. the content digest of a source PNG).  The
+    file holds a small header — format version, a digest of name and
+    inputs, size and pixel format — followed by the pixels in
+    ``pygame.image.tobytes`` layout.
+
+    load() memory-maps the file and wraps the pixels with
+    ``pygame.image.frombuffer``, so nothing is decoded or copied on the way
+    in.  The mapping is copy-on-write and the surface keeps it alive, so it
+    can be drawn on or blitted from directly; callers that ``convert()`` the
+    result get their own copy in the display format instead.
+
+    An entry whose header doesn't match — a changed source file, different
+    parameters, or a cache written by another VERSION — counts as stale and
+    is rebuilt and overwritten by the caller.  Bump VERSION whenever a
+    generator's output changes for the same inputs.
+
+    The directory is bounded by ``budget`` bytes: after each store() the
+    least recently used files (by mtime, which load() refreshes on a hit)
+    are deleted until the rest fit.
+
+    Caching is best-effort: with ``cache_dir=None`` (the pygbag build has no
+    persistent disk) or on any I/O error, load() misses and store() does
+    nothing.
+    """
+
+    VERSION = 1
+    MAGIC = b'TYPS'
+    HEADER = struct.Struct('<4sH32sII4s')  # magic, version, digest, width, height, format
+
+    def __init__(self, cache_dir=CACHE_DIR, budget=DISK_CACHE_BUDGET):
+        self.cache_dir = cache_dir
+        self.budget = budget
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    def load(self, name, inputs=()):
+        """Return the stored surface for name, or None if it is missing or stale."""
+        if not self.enabled:
+            return None
+        path = self._path(name)
+        try:
+            with open(path, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            # Missing file, or an empty one (mmap can't map zero bytes)
+            self.misses += 1
+            return None
+
+        if mapping.size() < self.HEADER.size:
+            return self._reject(mapping)
+        magic, version, digest, width, height, fmt = self.HEADER.unpack_from(mapping)
+        fmt = fmt.rstrip(b'\0').decode('ascii', 'replace')
+        expected = len(fmt) * width * height
+        if (magic != self.MAGIC or version != self.VERSION or digest != self._digest(name, inputs)
+                or fmt not in ('RGB', 'RGBA') or mapping.size() - self.HEADER.size != expected):
+            return self._reject(mapping)
+
+        self.hits += 1
+        try:
+            os.utime(path)  # Mark as recently used for pruning
+        except OSError:
+            pass
+        return pygame.image.frombuffer(memoryview(mapping)[self.HEADER.size:], (width, height), fmt)
+
+    def store(self, name, surface, inputs=(), alpha=True) -> None:
+        """Write surface's pixels for name; alpha=False drops the alpha channel."""
+        if not self.enabled:
+            return
+        fmt = 'RGBA' if alpha else 'RGB'
+        width, height = surface.get_size()
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self._digest(name, inputs),
+                                  width, height, fmt.encode('ascii'))
+        path = self._path(name)
+        temp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp, 'wb') as f:
+                f.write(header)
+                f.write(pygame.image.tobytes(surface, fmt))
+            # Atomic, so a concurrent launch never maps a half-written file
+            os.replace(temp, path)
+        except OSError as exc:
+            print(f"Warning: failed to write surface cache {path}: {exc}")
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+        self._prune(keep=path)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'stale': self.stale}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _path(self, name) -> str:
+        slot = hashlib.sha256(repr(name).encode()).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{slot}.surf")
+
+    def _digest(self, name, inputs) -> bytes:
+        return hashlib.sha256(repr((self.VERSION, name, tuple(inputs))).encode()).digest()
+
+    def _prune(self, keep) -> None:
+        """Delete the least recently used entries until the directory fits the budget."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.surf'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return
+        used = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if used <= self.budget:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # Another launch got there first
+            used -= size
+
+    def _reject(self, mapping):
+        mapping.close()
+        self.stale += 1
+        return None
+
+
+# Process-wide cache; disabled where there is no persistent disk (pygbag)
+_shared_cache = SurfaceDiskCache(None if sys.platform == 'emscripten' else CACHE_DIR)
+
+
+def shared_cache() -> SurfaceDiskCache:
+    return _shared_cache
+
+
+def enabled() -> bool:
+    """Whether the shared disk cache is in use on this platform."""
+    return _shared_cache.enabled
+
+
+def load(name, inputs=()):
+    """Load a surface through the shared disk cache."""
+    return _shared_cache.load(name, inputs)
+
+
+def store(name, surface, inputs=(), alpha=True) -> None:
+    """Store a surface through the shared disk cache."""
+    _shared_cache.store(name, surface, inputs, alpha)
@@ -1,8 +1,18 @@
 import pygame
-import asyncio
 import random
 import os
 from . import animation_utils
+from . import fonts
+from . import pacing
+from . import quality
+from . import render_target
+from . import sounds
+from . import sprite_atlas
+from . import sprite_cache
+from . import text_cache
+from . import tones
+from . import window_monitor
+from .display_list import DisplayList
 from .event_bus import EventBus
 from .game_timer import GameTimer
 
@@ -17,6 +27,20 @@ class GameScreen:
         'space': pygame.K_SPACE,
     }
 
+    # Tone played when each button lights up or is pressed (Hz); synthesized, no audio files
+    BUTTON_TONES = {
+        'left':  261.63,  # C4
+        'up':    329.63,  # E4
+        'right': 392.00,  # G4
+        'down':  440.00,  # A4
+        'space': 523.25,  # C5
+    }
+    TONE_MS = 350
+    TONE_PRIORITY = 1  # above the default, so a button tone cuts off an older effect
+
+    # Sprite states, in the order their files are listed in BUTTON_FILES
+    BUTTON_STATES = ('normal', 'indicated', 'pressed')
+
     # (normal, indicated, pressed) paths relative to assets/Typo-buttons/
     BUTTON_FILES = {
         'left':  ('left.png',  'button-indicated/leftIndicate.png',  'button-pressed/leftPress.png'),
@@ -26,26 +50,60 @@ class GameScreen:
         'space': ('space.png', 'button-indicated/spaceIndicate.png', 'button-pressed/spacePress.png'),
     }
 
-    def __init__(self, screen, pause_overlay=None, score=0):
+    # On-screen button sizes; tools/build_sprite_atlas.py pre-scales sprites to these
+    ARROW_SIZE = 90
+    SPACE_SIZE = (220, 55)
+
+    BACKGROUND = (15, 15, 25)
+    DIM_ALPHA = 80  # opacity of inactive buttons during playback/transitions
+
+    ASSET_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'Typo-buttons')
+
+    @classmethod
+    def button_size(cls, name):
+        """(width, height) a button is drawn at."""
+        return cls.SPACE_SIZE if name == 'space' else (cls.ARROW_SIZE, cls.ARROW_SIZE)
+
+    @classmethod
+    def preload_sprites(cls):
+        """Job: decode and scale every button sprite into the shared sprite cache.
+
+        Sprites the atlas provides are skipped.  On desktop the rest decode
+        on the sprite pool while the job's slices convert them as they
+        finish; under pygbag each slice loads one.  A GameScreen built
+        afterwards finds everything in the cache.
+        """
+        atlas = sprite_atlas.load_atlas(os.path.join(cls.ASSET_DIR, sprite_atlas.MANIFEST_NAME))
+        requests = []
+        for name, state, filename in cls.sprite_files():
+            size = cls.button_size(name)
+            if atlas is None or atlas.get(name, state, size) is None:
+                requests.append((os.path.join(cls.ASSET_DIR, filename), size, True))
+        return sprite_cache.prefetch(requests, sprite_cache.decode_executor())
+
+    @classmethod
+    def sprite_files(cls):
+        """(name, state, filename) for every button sprite, in BUTTON_FILES order."""
+        return [
+            (name, state, filename)
+            for name, filenames in cls.BUTTON_FILES.items()
+            for state, filename in zip(cls.BUTTON_STATES, filenames)
+        ]
+
+    def __init__(self, screen, pause_overlay=None, score=0, dirty_rects=False):
         self.screen = screen
         self.pause_overlay = pause_overlay
         self.paused = False
+        # Dirty-rect mode redraws only the regions that changed; whether presenting
+        # them is partial too depends on the render target (SCALED uploads it all)
+        self.dirty_rects = dirty_rects
+        self.last_frame = {'rects': 0, 'pixels': 0}
         W, H = screen.get_width(), screen.get_height()
 
-        asset_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'Typo-buttons')
-
-        # Load all 3 sprite states per button
-        self.sprites = {}
-        for name, (normal_f, indicated_f, pressed_f) in self.BUTTON_FILES.items():
-            self.sprites[name] = {
-                'normal':    pygame.image.load(os.path.join(asset_dir, normal_f)).convert_alpha(),
-                'indicated': pygame.image.load(os.path.join(asset_dir, indicated_f)).convert_alpha(),
-                'pressed':   pygame.image.load(os.path.join(asset_dir, pressed_f)).convert_alpha(),
-            }
-
         # Button layout — tight d-pad cross centered slightly above mid, space below
         cx, cy = W // 2, H // 2 - 40
-        s = 90    # arrow button size
+        s = self.ARROW_SIZE
+        sw, sh = self.SPACE_SIZE
         gap = 100  # center-to-center distance (10px between buttons)
 
         self.button_rects = {
@@ -53,17 +111,39 @@ class GameScreen:
             'down':  pygame.Rect(cx - s // 2,       cy + gap - s // 2, s, s),
             'left':  pygame.Rect(cx - gap - s // 2, cy - s // 2,       s, s),
             'right': pygame.Rect(cx + gap - s // 2, cy - s // 2,       s, s),
-            'space': pygame.Rect(cx - 110,          cy + gap + 60,     220, 55),
+            'space': pygame.Rect(cx - sw // 2,      cy + gap + 60,     sw, sh),
         }
 
-        # Pre-scale every state to its rect size once
-        self.scaled = {}
+        # Timer bar track along the bottom edge; the bar grows from its left end
+        self.timer_rect = pygame.Rect(20, H - 20, W - 40, 10)
+
+        # Every state pre-scaled to its rect size.  Sliced from the build-time
+        # sprite atlas when it matches this layout, otherwise loaded per file;
+        # both go through the process-wide sprite cache so a retry neither
+        # touches disk nor resamples.
+        atlas = sprite_atlas.load_atlas(os.path.join(self.ASSET_DIR, sprite_atlas.MANIFEST_NAME))
+        self.scaled = {name: {} for name in self.button_rects}
+        fallback = []  # ((name, state), (path, size, alpha)) the atlas didn't provide
         for name, rect in self.button_rects.items():
             size = (rect.width, rect.height)
-            self.scaled[name] = {
-                state: pygame.transform.smoothscale(surf, size)
-                for state, surf in self.sprites[name].items()
-            }
+            for state, filename in zip(self.BUTTON_STATES, self.BUTTON_FILES[name]):
+                sprite = atlas.get(name, state, size) if atlas else None
+                if sprite is None:
+                    fallback.append(((name, state), (os.path.join(self.ASSET_DIR, filename), size, True)))
+                else:
+                    self.scaled[name][state] = sprite
+
+        # Individual PNGs decode in parallel on desktop; sequentially under pygbag
+        loaded = sprite_cache.load_many([request for _, request in fallback], sprite_cache.decode_executor())
+        for ((name, state), _), sprite in zip(fallback, loaded):
+            self.scaled[name][state] = sprite
+
+        for name in self.button_rects:
+            # Inactive buttons are drawn dimmed; precompute that variant once so
+            # _draw never copies a surface.  RLE speeds up blitting the alpha.
+            dimmed = self.scaled[name]['normal'].copy()
+            dimmed.set_alpha(self.DIM_ALPHA, pygame.RLEACCEL)
+            self.scaled[name]['dimmed'] = dimmed
 
         # Derive key labels from BUTTON_KEYS so they stay in sync if keys change
         self.key_labels = {
@@ -71,12 +151,24 @@ class GameScreen:
             for name, key in self.BUTTON_KEYS.items()
         }
 
-        self.font_small = pygame.font.SysFont(None, 32)
-        self.font_label = pygame.font.SysFont(None, 26)
+        self.font_small = fonts.get_font(32)
+        self.font_label = fonts.get_font(26)
+
+        # Empty without NumPy or a mixer; the game then runs silently
+        self.tones = tones.button_tones(self.BUTTON_TONES, self.TONE_MS)
+        self._pending_tones = []  # tones waiting for the frame that shows their flash
 
         self._reset()
         self.score = score 
 
+        # Retained scene (HUD text, buttons, labels), rebuilt only when its state changes
+        self._scene = DisplayList()
+        self._hud = {}  # HUD region -> (surface, rect) as last built into the scene
+
+        # Dirty-rect bookkeeping: region -> (content key, rect) as last presented
+        self._regions = {}
+        self._full_redraw = True
+
         self._bus = EventBus()
         self.game_timer = GameTimer(self._bus)
         self._bus.subscribe('timer_expired', self._on_timer_expired)
@@ -91,7 +183,12 @@ class GameScreen:
     # ------------------------------------------------------------------
 
     async def run(self):
-        clock = pygame.time.Clock()
+        pacer = pacing.shared_pacer()
+        pacer.reset()
+
+        # Built while minimized or unfocused: start paused, as if the event had just arrived
+        if window_monitor.monitor().should_pause and not self.paused:
+            self._set_paused(True)
 
         while True:
             now = pygame.time.get_ticks()
@@ -100,15 +197,17 @@ class GameScreen:
                 if event.type == pygame.QUIT:
                     return "quit"
 
+                if window_monitor.handle_event(event):
+                    # Minimized, hidden or unfocused: pause so the timer can't run out
+                    # unseen; the player resumes with P as usual
+                    if window_monitor.monitor().should_pause and not self.paused:
+                        self._set_paused(True)
+                    continue
+
                 if event.type == pygame.KEYDOWN:
                     # P always toggles pause regardless of game state
                     if event.key == pygame.K_p:
-                        self.paused = not self.paused
-                        now_tick = pygame.time.get_ticks()
-                        if self.paused:
-                            self._bus.emit('game_paused',  {'now': now_tick})
-                        else:
-                            self._bus.emit('game_resumed', {'now': now_tick})
+                        self._set_paused(not self.paused)
                         continue
 
                     # Ctrl+E jumps to game over (debug shortcut)
@@ -125,7 +224,7 @@ class GameScreen:
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if not self.paused and self.state == 'input':
                         for name, rect in self.button_rects.items():
-                            if rect.collidepoint(event.pos):
+                            if rect.collidepoint(render_target.to_logical(event.pos)):
                                 self._handle_input(name, now)
                                 break
 
@@ -135,20 +234,55 @@ class GameScreen:
 
             if not self.paused:
                 self._update(now)
-            self._draw()
 
-            # Pause overlay draws itself only when visible (driven by event bus)
-            if self.pause_overlay:
+            if window_monitor.suspended():
+                # Nothing is visible: skip drawing and presenting until the window returns
+                self._full_redraw = True
+                self._pending_tones.clear()
+                await pacer.tick(idle=True)
+                continue
+
+            overlay_visible = self.pause_overlay is not None and self.pause_overlay.visible
+            if overlay_visible and self.pause_overlay.frozen:
+                # Freeze-frame pause: the overlay holds the dimmed frame, so nothing is redrawn
                 self.pause_overlay.draw()
+                render_target.present()
+                self._full_redraw = True
+                rects = [self.screen.get_rect()]
+            elif self.dirty_rects and not overlay_visible:
+                rects = self._draw_dirty()
+                if rects:
+                    # Report what was uploaded, which may be the whole frame
+                    rects = render_target.present(rects)
+            else:
+                self._draw()
+
+                # Pause overlay draws itself only when visible (driven by event bus)
+                if self.pause_overlay:
+                    self.pause_overlay.draw()
 
-            pygame.display.flip()
-            clock.tick(60)
-            await asyncio.sleep(0)  # Required for pygbag
+                render_target.present()
+                # The overlay covered everything, so the next dirty frame starts from scratch
+                self._full_redraw = True
+                rects = [self.screen.get_rect()]
+
+            self._report_frame(rects)
+            # Tones start only once the frame showing their flash is presented
+            self._flush_tones()
+            await pacer.tick(*self._pacing())
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _set_paused(self, paused) -> None:
+        self.paused = paused
+        now_tick = pygame.time.get_ticks()
+        if paused:
+            self._bus.emit('game_paused',  {'now': now_tick})
+        else:
+            self._bus.emit('game_resumed', {'now': now_tick})
+
     def _reset(self):
         self.sequence     = []
         self.player_index = 0
@@ -170,6 +304,7 @@ class GameScreen:
         self.flash_button = name
         self.flash_state  = 'pressed'
         self.flash_end    = now + 400
+        self._play_tone(name)
 
         if name != expected:
             self.game_timer.stop()
@@ -212,6 +347,7 @@ class GameScreen:
                     self.flash_state  = 'indicated'
                     self.flash_end    = now + 600
                     self._showing_lit = True
+                    self._play_tone(self.flash_button)
             else:
                 # Lit phase — waiting for the lit period to end
                 if now >= self.flash_end:
@@ -228,62 +364,171 @@ class GameScreen:
                 self.flash_state  = 'normal'
             self.game_timer.update(now)
 
+    def _play_tone(self, name) -> None:
+        """Queue name's tone; _flush_tones() plays it after the flash is presented."""
+        tone = self.tones.get(name)
+        if tone is not None:
+            self._pending_tones.append(tone)
+
+    def _flush_tones(self) -> None:
+        for tone in self._pending_tones:
+            sounds.play_sound(tone, self.TONE_PRIORITY)
+        self._pending_tones.clear()
+
+    def _pacing(self):
+        """Return (idle, deadline) for the frame pacer.
+
+        Between state-machine deadlines the scene is static: the timer bar only
+        moves during 'input', and everything else changes at _next_time or
+        flash_end.  A paused game only changes on input.
+        """
+        if self.paused:
+            return True, None
+        if self.state == 'adding':
+            return True, self._next_time
+        if self.state == 'showing' and self._show_index < len(self.sequence):
+            return True, self.flash_end if self._showing_lit else self._next_time
+        if self.state == 'gameover':
+            return True, self.flash_end
+        return False, None
+
     def _on_timer_expired(self, data) -> None:
         if self.state == 'input':
             self.state            = 'gameover'
             self._gameover_reason = "Time's up!"
             self.flash_end        = data['now']
 
-    def _draw(self):
-        self.screen.fill((15, 15, 25))
+    def _status(self):
+        """Return (text, color) for the status line; text is empty when hidden."""
+        if self.state == 'showing':
+            return "Watch carefully...", (160, 160, 255)
+        if self.state == 'input':
+            remaining = len(self.sequence) - self.player_index
+            return f"Your turn!  ({remaining} left)", (160, 255, 160)
+        return "", (200, 200, 200)
 
+    def _hud_items(self):
+        """Return (region, surface, rect) for each HUD text line currently shown."""
         W = self.screen.get_width()
 
-        # HUD
-        score_surf = self.font_small.render(f"Score: {self.score}", True, (200, 200, 200))
-        self.screen.blit(score_surf, (20, 20))
-
-        round_surf = self.font_small.render(f"Round {len(self.sequence)}", True, (150, 150, 150))
-        self.screen.blit(round_surf, round_surf.get_rect(topright=(W - 20, 20)))
-
-
-        # Status message
-        if self.state == 'showing':
-            status_text  = "Watch carefully..."
-            status_color = (160, 160, 255)
-        elif self.state == 'input':
-            remaining    = len(self.sequence) - self.player_index
-            status_text  = f"Your turn!  ({remaining} left)"
-            status_color = (160, 255, 160)
-        else:
-            status_text  = ""
-            status_color = (200, 200, 200)
+        score_surf = text_cache.render(self.font_small, f"Score: {self.score}", (200, 200, 200))
+        round_surf = text_cache.render(self.font_small, f"Round {len(self.sequence)}", (150, 150, 150))
+        items = [
+            ('score', score_surf, score_surf.get_rect(topleft=(20, 20))),
+            ('round', round_surf, round_surf.get_rect(topright=(W - 20, 20))),
+        ]
 
+        status_text, status_color = self._status()
         if status_text:
-            s = self.font_small.render(status_text, True, status_color)
-            self.screen.blit(s, s.get_rect(center=(W // 2, 55)))
+            s = text_cache.render(self.font_small, status_text, status_color)
+            items.append(('status', s, s.get_rect(center=(W // 2, 55))))
+        return items
+
+    def _button_variant(self, name):
+        """Which sprite variant a button shows this frame."""
+        if name == self.flash_button:
+            # Active button: use whichever state is set (indicated or pressed)
+            return self.flash_state
+        if self.state in ('showing', 'adding', 'gameover') and quality.enabled('dim_buttons'):
+            # Dim non-active buttons during Simon playback / transition / wrong flash
+            return 'dimmed'
+        # Input state: all buttons fully visible at normal state
+        return 'normal'
+
+    def _timer_bar_width(self):
+        """Width of the timer bar; it only shows during the player's turn."""
+        if self.state != 'input':
+            return 0
+        return int(self.game_timer.fraction * self.timer_rect.width)
+
+    def _scene_key(self):
+        """Everything the retained scene depends on; any change triggers a rebuild."""
+        return (
+            self.score,
+            len(self.sequence),
+            self._status(),
+            tuple(self._button_variant(name) for name in self.button_rects),
+        )
+
+    def _build_scene(self, scene):
+        self._hud = {}
+        for region, surf, rect in self._hud_items():
+            scene.add(surf, rect)
+            self._hud[region] = (surf, rect)
 
-        # Draw buttons
         for name, rect in self.button_rects.items():
-            if name == self.flash_button:
-                # Active button: use whichever state is set (indicated or pressed)
-                self.screen.blit(self.scaled[name][self.flash_state], rect)
-            elif self.state in ('showing', 'adding', 'gameover'):
-                # Dim non-active buttons during Simon playback / transition / wrong flash
-                surf = self.scaled[name]['normal'].copy()
-                surf.set_alpha(80)
-                self.screen.blit(surf, rect)
-            else:
-                # Input state: all buttons fully visible at normal state
-                self.screen.blit(self.scaled[name]['normal'], rect)
-
+            scene.add(self.scaled[name][self._button_variant(name)], rect)
             # Key label centered on button
-            animation_utils.draw_shadowed_text(
-                self.screen, self.font_label, self.key_labels[name], rect.center
-            )
+            scene.extend(animation_utils.shadowed_text_blits(
+                self.font_label, self.key_labels[name], rect.center
+            ))
+
+    def _update_scene(self) -> None:
+        self._scene.rebuild(self._scene_key(), self._build_scene)
+
+    def _draw(self, area=None):
+        """Draw the frame; with area, only what overlaps it (the caller sets the clip)."""
+        self.screen.fill(self.BACKGROUND, area)
+
+        # HUD, buttons and labels in one batched blit
+        self._update_scene()
+        self._scene.submit(self.screen, area)
 
         # timer bar (only shows during player's turn)
-        if self.state == 'input':
-            H = self.screen.get_height()
-            bar_width = int(self.game_timer.fraction * (W - 40))
-            pygame.draw.rect(self.screen, (255, 100, 100), (20, H - 20, bar_width, 10))
+        bar_width = self._timer_bar_width()
+        if bar_width:
+            bar = self.timer_rect
+            pygame.draw.rect(self.screen, (255, 100, 100), (bar.x, bar.y, bar_width, bar.height))
+
+    # ------------------------------------------------------------------
+    # Dirty-rect rendering
+    # ------------------------------------------------------------------
+
+    def _regions_snapshot(self):
+        """Map each independently changing screen region to (content key, rect)."""
+        self._update_scene()
+        regions = dict(self._hud)
+        for name, rect in self.button_rects.items():
+            regions[name] = (self._button_variant(name), rect)
+        regions['timer'] = (self._timer_bar_width(), self.timer_rect)
+        return regions
+
+    def _draw_dirty(self):
+        """Redraw only regions whose content changed and return the rects to present.
+
+        Each dirty rect is repainted by _draw() clipped to that rect, filling
+        just the rect and blitting only the scene items that overlap it, so
+        overlapping regions still composite correctly.
+        """
+        regions = self._regions_snapshot()
+
+        if self._full_redraw:
+            self._full_redraw = False
+            self._regions = regions
+            self._draw()
+            return [self.screen.get_rect()]
+
+        dirty = []
+        for name, (key, rect) in regions.items():
+            old = self._regions.get(name)
+            if old is None:
+                dirty.append(rect)
+            elif old[0] != key or old[1] != rect:
+                dirty.append(rect.union(old[1]))
+        for name, (_, rect) in self._regions.items():
+            if name not in regions:
+                # Region disappeared (e.g. the status line); erase where it was
+                dirty.append(rect)
+        self._regions = regions
+
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self._draw(rect)
+        self.screen.set_clip(None)
+        return dirty
+
+    def _report_frame(self, rects) -> None:
+        """Record and emit how many pixels this frame presented."""
+        pixels = sum(rect.width * rect.height for rect in rects)
+        self.last_frame = {'rects': len(rects), 'pixels': pixels}
+        self._bus.emit('frame_presented', self.last_frame)
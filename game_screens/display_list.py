@@ -0,0 +1,67 @@
+class DisplayList:
+    """Retained list of blits submitted with a single ``Surface.blits`` call.
+
+    A screen rebuilds the list only when the state it depends on changes
+    (see rebuild()); every other frame costs one ``blits`` call no matter
+    how many items are on screen.  Items use the ``Surface.blits`` sequence
+    format: ``(source, dest)`` or ``(source, dest, area)``.
+    """
+
+    def __init__(self):
+        self.key = None        # state the current items were built for
+        self.rebuilds = 0
+        self._built = False
+        self._items = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def add(self, source, dest, area=None) -> None:
+        self._items.append((source, dest) if area is None else (source, dest, area))
+
+    def extend(self, items) -> None:
+        self._items.extend(items)
+
+    def clear(self) -> None:
+        """Empty the list and force the next rebuild() to run."""
+        self._items = []
+        self.key = None
+        self._built = False
+
+    def rebuild(self, key, build) -> bool:
+        """Re-run build(self) on an emptied list if key differs from the last build.
+
+        Returns True when the list was rebuilt.
+        """
+        if self._built and key == self.key:
+            return False
+        self._items = []
+        build(self)
+        self.key = key
+        self._built = True
+        self.rebuilds += 1
+        return True
+
+    def submit(self, target, area=None) -> None:
+        """Blit every item onto target in one call.
+
+        With area (an (x, y, w, h) rect, e.g. a dirty rect) only the items
+        overlapping it are blitted.
+        """
+        items = self._items if area is None else [item for item in self._items if _overlaps(item, area)]
+        if items:
+            target.blits(items, doreturn=False)
+
+
+def _overlaps(item, area) -> bool:
+    """Whether a blits item's destination rect intersects area."""
+    source, dest = item[0], item[1]
+    if len(item) > 2:
+        width, height = item[2][2], item[2][3]
+    else:
+        width, height = source.get_width(), source.get_height()
+    ax, ay, aw, ah = area
+    return dest[0] < ax + aw and ax < dest[0] + width and dest[1] < ay + ah and ay < dest[1] + height
@@ -0,0 +1,156 @@
+import os
+import pygame
+
+# Bundled TTF/OTF files, e.g. assets/fonts/PressStart2P-Regular.ttf
+FONT_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'fonts')
+FONT_EXTENSIONS = ('.ttf', '.otf')
+
+# Filename suffix -> (bold, italic)
+_STYLE_SUFFIXES = {
+    'regular':    (False, False),
+    'bold':       (True,  False),
+    'italic':     (False, True),
+    'oblique':    (False, True),
+    'bolditalic': (True,  True),
+    'boldoblique': (True, True),
+}
+
+
+def _normalize(name: str) -> str:
+    """Family names compare case- and separator-insensitively ("Press Start 2P" == "pressstart2p")."""
+    return ''.join(ch for ch in name.lower() if ch.isalnum())
+
+
+class FontIndex:
+    """Index of the bundled font directory, built once on first lookup.
+
+    Files are named ``<Family>-<Style>.ttf`` (``Style`` one of Regular, Bold,
+    Italic, BoldItalic; a bare ``<Family>.ttf`` counts as Regular).  Lookups
+    never touch the system font list, so there is no fontconfig scan.
+    """
+
+    def __init__(self, font_dir=FONT_DIR):
+        self.font_dir = font_dir
+        self._entries = None  # (family, bold, italic) -> path, built lazily
+
+    def find(self, name, bold=False, italic=False):
+        """Return (path, exact) for the bundled face of name, or (None, False) if it isn't bundled.
+
+        Falls back to the family's regular face when the requested style is
+        missing; ``exact`` is then False and the caller applies synthetic
+        bold/italic.
+        """
+        entries = self._build()
+        family = _normalize(name)
+        path = entries.get((family, bold, italic))
+        if path:
+            return path, True
+        return entries.get((family, False, False)), False
+
+    def families(self):
+        return sorted({family for family, _, _ in self._build()})
+
+    def invalidate(self) -> None:
+        """Force the directory to be rescanned on the next lookup."""
+        self._entries = None
+
+    def _build(self):
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            filenames = sorted(os.listdir(self.font_dir))
+        except OSError:
+            return self._entries
+
+        for filename in filenames:
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() not in FONT_EXTENSIONS:
+                continue
+            family, _, style = stem.rpartition('-')
+            if not family or _normalize(style) not in _STYLE_SUFFIXES:
+                family, style = stem, 'regular'
+            bold, italic = _STYLE_SUFFIXES[_normalize(style)]
+            self._entries[(_normalize(family), bold, italic)] = os.path.join(self.font_dir, filename)
+        return self._entries
+
+
+class FontRegistry:
+    """Process-wide cache of Font objects keyed by (name, size, bold, italic).
+
+    Two loading modes:
+
+    - ``'bundled'`` (default): named fonts resolve through a FontIndex of the
+      bundled font directory and ``name=None`` uses pygame's built-in default
+      font via ``pygame.font.Font(None, size)``.  Names that aren't bundled
+      also fall back to the default font.  ``pygame.font.SysFont`` is never
+      called, so startup never pays for a system font scan.
+    - ``'system'``: every lookup goes through ``pygame.font.SysFont``, the
+      original behaviour.  On Linux the first call enumerates fonts through
+      fontconfig.
+
+    ``hits`` and ``misses`` count lookups; once every screen has been shown,
+    ``misses`` should stop growing — a later miss means a font was created
+    mid-game.
+    """
+
+    MODES = ('bundled', 'system')
+
+    def __init__(self, mode='bundled', index=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown font mode {mode!r}; expected one of {self.MODES}")
+        self.mode = mode
+        self.index = index if index is not None else FontIndex()
+        self.hits = 0
+        self.misses = 0
+        self._fonts = {}  # (name, size, bold, italic) -> Font
+
+    def get(self, size: int, name=None, bold=False, italic=False):
+        """Return the shared Font for (name, size, bold, italic), creating it on first use."""
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        if self.mode == 'system':
+            font = pygame.font.SysFont(name, size, bold, italic)
+        else:
+            path, exact = self.index.find(name, bold, italic) if name else (None, False)
+            font = pygame.font.Font(path, size)
+            if not exact:
+                # Synthesize the style no bundled file provides
+                font.set_bold(bold)
+                font.set_italic(italic)
+        self._fonts[key] = font
+        return font
+
+    def set_mode(self, mode: str) -> None:
+        """Switch loading mode and drop cached fonts; Font objects already handed out keep their face."""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown font mode {mode!r}; expected one of {self.MODES}")
+        if mode != self.mode:
+            self.mode = mode
+            self.clear()
+
+    def stats(self) -> dict:
+        return {'fonts': len(self._fonts), 'hits': self.hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        """Forget every font, e.g. after pygame.font.quit()."""
+        self._fonts = {}
+
+
+# Process-wide registry shared by every screen and animation helper
+_registry = FontRegistry()
+
+
+def registry() -> FontRegistry:
+    return _registry
+
+
+def get_font(size: int, name=None, bold=False, italic=False):
+    """Look up a font in the shared registry."""
+    return _registry.get(size, name, bold, italic)
@@ -3,71 +3,92 @@
 # testing option - ctrl + e to jump to this screen
 
 import pygame
-import asyncio
 from . import animation_utils
+from . import fonts
+from . import pacing
+from . import render_target
+from . import text_cache
+from . import window_monitor
+from .compositor import LayerCompositor
 
 class GameOverScreen:
+    gradient_top = (80, 10, 10)     # Dark red
+    gradient_bottom = (20, 0, 0)    # Near black
+    MUSIC = "assets/gameover.ogg"
+
     def __init__(self, screen, score, reason):
         self.screen = screen
         self.score = score
         self.reason = reason
-        self.gradient_top = (80, 10, 10)     # Dark red
-        self.gradient_bottom = (20, 0, 0)    # Near black
         self.running = True
-        try:
-            pygame.mixer.music.load("assets/gameover.ogg")
-            pygame.mixer.music.play(0)  # 2Play once, no loop
-        except pygame.error as exc:
-            print(f"Warning: failed to load music assets/gameover.ogg: {exc}")
+        self.score_font = fonts.get_font(56)
+        self.reason_font = fonts.get_font(36)
+        animation_utils.play_music(self.MUSIC, loops=0)  # Play once, no loop
+
+        # Gradient, score and reason never change: compose them once.
+        # Only the wave title and the flashing prompt are redrawn each frame.
+        self.compositor = LayerCompositor(screen, self.gradient_top, self.gradient_bottom)
+        self.compositor.add_static(self._draw_score)
+        self.compositor.add_static(self._draw_reason)
+        self.compositor.add_animated(self._draw_title)
+        self.compositor.add_animated(self._draw_prompt)
 
     async def run(self):
-        clock = pygame.time.Clock()
+        pacer = pacing.shared_pacer()
+        pacer.reset()
 
         while self.running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return "quit"
+                window_monitor.handle_event(event)
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
                         return "retry"
                     if event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
                         return "quit"
 
-            # Draw gradient background
-            animation_utils.draw_gradient(self.screen, self.gradient_top, self.gradient_bottom)
+            if window_monitor.suspended():
+                # Minimized or hidden: don't draw or present until the window returns
+                await pacer.tick(idle=True)
+                continue
+
+            self.compositor.draw()
 
-            # Draw animated "GAME OVER" title with wave effect
-            animation_utils.wave_text(
-                self.screen,
-                "GAME OVER",
-                (self.screen.get_width() // 2, 150),
-                font_size=96,
-                color=(255, 50, 50),
-                bounce_height=10,
-                wave_speed=0.4,
-            )
+            render_target.present()
+            # Title and prompt animate every frame, so this screen never idles
+            await pacer.tick()
 
-            # Display score
-            score_font = pygame.font.Font(None, 56)
-            score_surface = score_font.render(f"Score: {self.score}", True, (255, 255, 255))
-            score_rect = score_surface.get_rect(center=(self.screen.get_width() // 2, 280))
-            self.screen.blit(score_surface, score_rect)
+        return "quit"
 
-            # Display reason for loss
-            reason_font = pygame.font.Font(None, 36)
-            reason_surface = reason_font.render(self.reason, True, (200, 200, 200))
-            reason_rect = reason_surface.get_rect(center=(self.screen.get_width() // 2, 350))
-            self.screen.blit(reason_surface, reason_rect)
+    # ------------------------------------------------------------------
+    # Layers
+    # ------------------------------------------------------------------
 
-            # Flashing prompt text
-            animation_utils.flashing_text(
-                self.screen,
-                "Press R to Retry  |  Q to Quit",
-                (self.screen.get_width() // 2, self.screen.get_height() - 80),
-            )
+    def _draw_score(self, surface):
+        score_surface = text_cache.render(self.score_font, f"Score: {self.score}", (255, 255, 255))
+        surface.blit(score_surface, score_surface.get_rect(center=(surface.get_width() // 2, 280)))
 
-            pygame.display.flip()
-            clock.tick(60)
-            await asyncio.sleep(0)  # Required for pygbag
+    def _draw_reason(self, surface):
+        reason_surface = text_cache.render(self.reason_font, self.reason, (200, 200, 200))
+        surface.blit(reason_surface, reason_surface.get_rect(center=(surface.get_width() // 2, 350)))
 
-        return "quit"
+    def _draw_title(self, surface):
+        # Animated "GAME OVER" title with wave effect
+        animation_utils.wave_text(
+            surface,
+            "GAME OVER",
+            (surface.get_width() // 2, 150),
+            font_size=96,
+            color=(255, 50, 50),
+            bounce_height=10,
+            wave_speed=0.4,
+        )
+
+    def _draw_prompt(self, surface):
+        # Flashing prompt text
+        animation_utils.flashing_text(
+            surface,
+            "Press R to Retry  |  Q to Quit",
+            (surface.get_width() // 2, surface.get_height() - 80),
+        )
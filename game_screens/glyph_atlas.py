@@ -0,0 +1,101 @@
+import pygame
+
+
+class GlyphAtlas:
+    """Shared atlas of pre-rasterized glyphs for per-character text effects.
+
+    Each (font, color, char) is rendered once with ``font.render`` and packed
+    into a shared SRCALPHA page using a simple shelf packer.  A Font object is
+    built for a single size, so the font identity already covers the size.
+
+    Lookups return ``(page, area, advance)`` where ``area`` is the glyph's
+    (x, y, w, h) rectangle inside ``page`` and ``advance`` is the horizontal
+    distance to the next character, so callers can blit straight from the atlas:
+
+        page, area, advance = atlas.glyph(font, 'A', (255, 255, 255))
+        screen.blit(page, dest, area)
+    """
+
+    PAGE_SIZE = (1024, 512)
+    PADDING = 1  # transparent gutter between glyphs so neighbours never bleed
+
+    def __init__(self, page_size=PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = []
+        self.hits = 0
+        self.misses = 0
+        self._glyphs = {}  # (font, color, char) -> (page, area, advance)
+        self._page = None  # page currently being packed
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_h = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def glyph(self, font, char, color):
+        """Return (page, area, advance) for a single character, rasterizing it on first use."""
+        key = (font, tuple(color), char)
+        entry = self._glyphs.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        surf = font.render(char, True, color)
+        w, h = surf.get_width(), surf.get_height()
+        advance = font.size(char)[0]
+
+        page, x, y = self._allocate(w, h)
+        # BLEND_RGBA_MAX onto the zeroed page copies the glyph's pixels verbatim;
+        # a normal alpha blit would darken the antialiased edges.
+        page.blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+        entry = (page, (x, y, w, h), advance)
+        self._glyphs[key] = entry
+        return entry
+
+    def text_width(self, font, text, color):
+        """Total advance width of ``text``, rasterizing any glyphs not yet in the atlas."""
+        return sum(self.glyph(font, char, color)[2] for char in text)
+
+    def clear(self) -> None:
+        """Drop every page and glyph; they are re-rasterized lazily on next use."""
+        self.pages = []
+        self._glyphs = {}
+        self._page = None
+        self._shelf_x = self._shelf_y = self._shelf_h = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _new_page(self, size):
+        page = pygame.Surface(size, pygame.SRCALPHA)
+        self.pages.append(page)
+        return page
+
+    def _allocate(self, w, h):
+        """Reserve a w x h slot and return (page, x, y)."""
+        page_w, page_h = self.page_size
+        pad = self.PADDING
+
+        if w > page_w or h > page_h:
+            # Oversized glyph: give it a page of its own and keep packing the current one
+            return self._new_page((w, h)), 0, 0
+
+        if self._page is not None and self._shelf_x + w > page_w:
+            # Current shelf is full — open a new one underneath
+            self._shelf_y += self._shelf_h + pad
+            self._shelf_x = 0
+            self._shelf_h = 0
+
+        if self._page is None or self._shelf_y + h > page_h:
+            self._page = self._new_page(self.page_size)
+            self._shelf_x = self._shelf_y = self._shelf_h = 0
+
+        x, y = self._shelf_x, self._shelf_y
+        self._shelf_x += w + pad
+        self._shelf_h = max(self._shelf_h, h)
+        return self._page, x, y
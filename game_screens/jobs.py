@@ -0,0 +1,115 @@
+import time
+from collections import deque
+
+
+class Job:
+    """A long piece of work split into slices by a generator.
+
+    Each ``next()`` on the generator runs one slice; the value it yields is
+    the job's progress (0–1), or None to leave progress unchanged.  The
+    generator's return value becomes ``result``.  Keep slices short — a
+    slice can't be interrupted, so the longest slice bounds how far a frame
+    can overrun its budget.
+
+    A slice that raises ends the job: the exception is reported and kept in
+    ``error``, and the job counts as done, so one broken background task
+    can't take down the screen loop that runs it.
+    """
+
+    def __init__(self, steps, name=None):
+        self.name = name
+        self.progress = 0.0
+        self.done = False
+        self.result = None
+        self.error = None
+        self._steps = steps
+
+    def step(self) -> None:
+        """Run one slice."""
+        try:
+            progress = next(self._steps)
+        except StopIteration as stop:
+            self.done = True
+            self.progress = 1.0
+            self.result = stop.value
+            return
+        except Exception as exc:
+            print(f"Warning: background job {self.name or self._steps!r} failed: {exc!r}")
+            self.done = True
+            self.progress = 1.0
+            self.error = exc
+            return
+        if progress is not None:
+            self.progress = min(max(progress, 0.0), 1.0)
+
+
+class JobScheduler:
+    """Runs queued jobs cooperatively, a few slices per frame.
+
+    The web build has no threads, so long one-off work (building a gradient,
+    decoding and scaling sprites) is written as a generator and submitted
+    here.  Once per frame, after drawing, run_slices() keeps running slices
+    of the oldest job until ``budget_ms`` is used up; a frame therefore
+    spends at most the budget plus one slice on background work.
+
+    ``progress`` covers every job submitted since the queue was last empty,
+    so a loading bar can show it directly.
+    """
+
+    BUDGET_MS = 4
+
+    def __init__(self, budget_ms=BUDGET_MS, clock=time.perf_counter):
+        self.budget_ms = budget_ms
+        self._clock = clock
+        self._queue = deque()
+        self._batch = []  # every job submitted since the queue was last empty
+
+    def submit(self, steps, name=None) -> Job:
+        """Queue a generator as a job and return it."""
+        if not self._queue:
+            self._batch = []
+        job = Job(steps, name)
+        self._queue.append(job)
+        self._batch.append(job)
+        return job
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._queue)
+
+    @property
+    def progress(self) -> float:
+        """Mean progress of the current batch; 1.0 when nothing was submitted."""
+        if not self._batch:
+            return 1.0
+        return sum(job.progress for job in self._batch) / len(self._batch)
+
+    def run_slices(self, budget_ms=None) -> int:
+        """Run slices until the budget is spent or the queue is empty; returns the slice count."""
+        budget = (self.budget_ms if budget_ms is None else budget_ms) / 1000
+        start = self._clock()
+        slices = 0
+        while self._queue and self._clock() - start < budget:
+            job = self._queue[0]
+            job.step()
+            slices += 1
+            if job.done:
+                self._queue.popleft()
+        return slices
+
+    def run_all(self) -> None:
+        """Finish every queued job now, ignoring the budget."""
+        self.run_slices(float('inf'))
+
+
+# Process-wide scheduler; the frame pacer runs it at the end of every frame
+_shared_scheduler = JobScheduler()
+
+
+def shared_scheduler() -> JobScheduler:
+    return _shared_scheduler
+
+
+def submit(steps, name=None) -> Job:
+    """Queue a job on the shared scheduler."""
+    return _shared_scheduler.submit(steps, name)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from collections import deque
+import pygame
+from . import jobs
+from . import quality
+from . import render_target
+
+
+class FramePacer:
+    """Async frame scheduler: ends each frame by sleeping in the event loop.
+
+    Screens call ``await pacer.tick(idle, deadline)`` once per frame.  Rather
+    than blocking inside SDL with ``clock.tick``, the pacer works out when the
+    next frame is due and awaits ``asyncio.sleep`` for the rest of the frame,
+    so background tasks (asset loading, telemetry, network) run in the gaps.
+
+    - Active frames keep a fixed ``active_fps`` cadence.  Their build time,
+      less the time spent in ``render_target.present()``, is reported to the
+      quality manager and how late each wake-up is against
+      its deadline is recorded as jitter.  A frame that overruns its slot by
+      more than a whole frame counts as missed and restarts the cadence from
+      now instead of bursting to catch up.
+    - Idle frames (the screen promises the next frame would be identical)
+      sleep until ``deadline`` (in ``get_ticks`` ms) or ``idle_timeout_ms``,
+      checking for input every active frame period so a keypress still gets
+      a prompt response.
+
+    Active frames also run the shared JobScheduler's slices between drawing
+    and sleeping; a screen with jobs queued is never treated as idle.
+    """
+
+    ACTIVE_FPS = 60
+    IDLE_TIMEOUT_MS = 250
+    JITTER_WINDOW = 240        # frames of jitter history kept for stats()
+    ADAPTIVE = True            # False ticks every frame at ACTIVE_FPS (benchmarks/idle_cpu.py)
+
+    def __init__(self, active_fps=ACTIVE_FPS):
+        self.period = 1 / active_fps
+        self.frames = 0
+        self.idle_frames = 0
+        self.missed_frames = 0
+        self.jitter = deque(maxlen=self.JITTER_WINDOW)  # ms each wake-up landed after its deadline
+        self._frame_start = None  # perf_counter() when the current frame began
+        self._next_frame = None   # perf_counter() deadline of the next active frame
+
+    async def tick(self, idle=False, deadline=None) -> None:
+        """Finish the frame; see the class docstring for what idle and deadline mean."""
+        now = time.perf_counter()
+        # Presenting can block in the driver; it isn't part of the build time
+        present_seconds = render_target.take_present_time()
+        self.frames += 1
+        scheduler = jobs.shared_scheduler()
+        if idle and self.ADAPTIVE and not scheduler.pending:
+            self.idle_frames += 1
+            await self._idle(deadline)
+            # The cadence restarts when the screen becomes active again
+            self._next_frame = None
+        else:
+            if self._frame_start is not None:
+                quality.record((now - self._frame_start - present_seconds) * 1000)
+            # Background jobs get the first few ms of the frame's spare time
+            scheduler.run_slices()
+            await self._wait_for_next_frame(time.perf_counter())
+        self._frame_start = time.perf_counter()
+
+    def reset(self) -> None:
+        """Start a fresh cadence, e.g. when a new screen starts running."""
+        self._frame_start = None
+        self._next_frame = None
+
+    def stats(self) -> dict:
+        jitter = list(self.jitter)
+        return {
+            'frames':          self.frames,
+            'idle_frames':     self.idle_frames,
+            'missed_frames':   self.missed_frames,
+            'jitter_mean_ms':  sum(jitter) / len(jitter) if jitter else 0.0,
+            'jitter_max_ms':   max(jitter, default=0.0),
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _wait_for_next_frame(self, now) -> None:
+        target = self._next_frame
+        if target is None or now - target > self.period:
+            # First frame, or more than a whole frame behind: don't try to catch up
+            if target is not None:
+                self.missed_frames += 1
+            target = now + self.period
+        await asyncio.sleep(max(0.0, target - now))
+        self.jitter.append(max(0.0, time.perf_counter() - target) * 1000)
+        self._next_frame = target + self.period
+
+    async def _idle(self, deadline) -> None:
+        timeout = self.IDLE_TIMEOUT_MS
+        if deadline is not None:
+            timeout = max(0, min(timeout, deadline - pygame.time.get_ticks()))
+        end = time.perf_counter() + timeout / 1000
+        while True:
+            remaining = end - time.perf_counter()
+            # peek() also pumps SDL, so window and input events keep arriving
+            if remaining <= 0 or pygame.event.peek():
+                break
+            await asyncio.sleep(min(self.period, remaining))
+
+
+# Process-wide pacer: screens share one cadence and one set of pacing stats
+_shared_pacer = FramePacer()
+
+
+def shared_pacer() -> FramePacer:
+    return _shared_pacer
@@ -1,14 +1,29 @@
 import pygame
+from . import fonts
 
 
 class PauseOverlay:
-    """Reusable pause overlay that can be drawn on any screen."""
+    """Reusable pause overlay that can be drawn on any screen.
 
-    def __init__(self, screen):
+    With ``freeze=True`` the overlay works in freeze-frame mode: the first
+    draw() after ``game_paused`` snapshots the screen, dims it and renders
+    the text onto the snapshot once.  Every later draw() is a single blit of
+    that cached frame, so the game loop can stop redrawing the scene
+    entirely until ``game_resumed``.
+    """
+
+    def __init__(self, screen, freeze=False):
         self.screen = screen
         self.visible = False
-        self.font_large = pygame.font.Font(None, 96)
-        self.font_small = pygame.font.Font(None, 36)
+        self.freeze = freeze
+        self.font_large = fonts.get_font(96)
+        self.font_small = fonts.get_font(36)
+        self._frozen = None  # snapshot + dim + text, freeze mode only
+
+    @property
+    def frozen(self) -> bool:
+        """True while the overlay is presenting a cached freeze-frame."""
+        return self.freeze and self.visible
 
     def subscribe(self, event_bus) -> None:
         """Attach to an EventBus so visibility is driven by game_paused/game_resumed events."""
@@ -20,23 +35,38 @@ class PauseOverlay:
 
     def _on_resumed(self, _) -> None:
         self.visible = False
+        self._frozen = None
 
     def draw(self) -> None:
         """Draw the overlay if currently visible."""
         if not self.visible:
             return
 
-        overlay = pygame.Surface(self.screen.get_size())
+        if self.freeze:
+            self.screen.blit(self._freeze_frame(), (0, 0))
+        else:
+            self._compose(self.screen)
+
+    def _freeze_frame(self):
+        """Return the cached paused frame, snapshotting the screen on first use."""
+        if self._frozen is None or self._frozen.get_size() != self.screen.get_size():
+            frame = self.screen.copy()
+            self._compose(frame)
+            self._frozen = frame
+        return self._frozen
+
+    def _compose(self, target) -> None:
+        overlay = pygame.Surface(target.get_size())
         overlay.set_alpha(128)
         overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        target.blit(overlay, (0, 0))
 
         paused_text = self.font_large.render("PAUSED", True, (255, 255, 255))
-        self.screen.blit(paused_text, paused_text.get_rect(
-            center=(self.screen.get_width() // 2, self.screen.get_height() // 2 - 50)
+        target.blit(paused_text, paused_text.get_rect(
+            center=(target.get_width() // 2, target.get_height() // 2 - 50)
         ))
 
         instruction_text = self.font_small.render("Press P to Resume", True, (200, 200, 200))
-        self.screen.blit(instruction_text, instruction_text.get_rect(
-            center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 50)
+        target.blit(instruction_text, instruction_text.get_rect(
+            center=(target.get_width() // 2, target.get_height() // 2 + 50)
         ))
@@ -0,0 +1,99 @@
+import pygame
+from . import animation_utils
+from . import fonts
+from . import jobs
+from . import tones
+from .display import GameScreen
+from .gameover import GameOverScreen
+
+# Every size the screens pass to fonts.get_font(), including the animation_utils defaults
+FONT_SIZES = (26, 32, 36, 48, 56, 96, 128)
+
+# One-shot sound effects, decoded up front so the first play() doesn't stall a frame.
+# Button feedback is synthesized (see the 'tones' entry), so none ship as files yet.
+SOUNDS = ()
+
+
+def game_manifest(screen_size):
+    """Every asset the game loads after the start screen, as (kind, *args) entries.
+
+    Built from the screens' own tables (GameScreen.BUTTON_FILES, the game
+    over gradient and music), so the manifest can't drift from what they
+    draw.  The start screen's music isn't listed: it is already playing
+    from disk by the time the preloader runs.
+    """
+    manifest = [('font', size) for size in FONT_SIZES]
+    manifest.append(('sprites',))
+    manifest.append(('gradient', tuple(screen_size), GameOverScreen.gradient_top, GameOverScreen.gradient_bottom))
+    manifest.append(('tones', GameScreen.BUTTON_TONES, GameScreen.TONE_MS))
+    manifest += [('sound', path) for path in SOUNDS]
+    manifest.append(('music', GameOverScreen.MUSIC))
+    return manifest
+
+
+class AssetPreloader:
+    """Loads a manifest of assets as a JobScheduler job, one slice at a time.
+
+    Each kind warms the cache its screen reads from:
+
+    - ``font``:     size -> fonts registry
+    - ``sprites``:  every button sprite the atlas lacks -> sprite cache, see GameScreen.preload_sprites()
+    - ``gradient``: size, top, bottom -> gradient cache
+    - ``tones``:    frequencies, duration -> synthesized Sounds, see tones.ToneSynth
+    - ``sound``:    path -> decoded Sound, see animation_utils.load_sound()
+    - ``music``:    path -> file bytes, see animation_utils.preload_music()
+
+    A loader that returns a job generator of its own (sprites, gradient) is
+    run inside this job, one of its slices per slice, with its progress
+    folded into the total.  An asset that fails to load is reported and
+    listed in ``failed`` rather than raised; the screen that needs it falls
+    back to loading it itself.
+    """
+
+    def __init__(self, manifest):
+        self.manifest = list(manifest)
+        self.loaded = 0
+        self.failed = []
+
+    def steps(self):
+        """Job generator: load each entry in turn, yielding overall progress."""
+        total = len(self.manifest)
+        for done, (kind, *args) in enumerate(self.manifest, start=1):
+            try:
+                steps = getattr(self, f'_load_{kind}')(*args)
+                for progress in steps or ():
+                    yield (done - 1 + (progress or 0)) / total
+                self.loaded += 1
+            except (pygame.error, OSError) as exc:
+                label = f"{kind} {args[0]}" if args else kind
+                print(f"Warning: failed to preload {label}: {exc}")
+                self.failed.append((kind, *args))
+            yield done / total
+        return self
+
+    # ------------------------------------------------------------------
+    # Loaders, one per manifest kind
+    # ------------------------------------------------------------------
+
+    def _load_font(self, size) -> None:
+        fonts.get_font(size)
+
+    def _load_sprites(self):
+        return GameScreen.preload_sprites()
+
+    def _load_gradient(self, size, top, bottom):
+        return animation_utils.gradient_steps(size, top, bottom)
+
+    def _load_tones(self, frequencies, duration_ms) -> None:
+        tones.button_tones(frequencies, duration_ms)
+
+    def _load_sound(self, path) -> None:
+        animation_utils.load_sound(path)
+
+    def _load_music(self, path) -> None:
+        animation_utils.preload_music(path)
+
+
+def preload(screen_size) -> jobs.Job:
+    """Queue the whole game manifest on the shared scheduler; the job's result is the preloader."""
+    return jobs.submit(AssetPreloader(game_manifest(screen_size)).steps(), 'assets')
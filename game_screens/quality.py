@@ -0,0 +1,97 @@
+from collections import deque
+from .event_bus import EventBus
+
+
+class QualityManager:
+    """Steps rendering quality down and up based on measured frame times.
+
+    Screen loops report how long each frame took to build (``record()``,
+    fed by FramePacer from ``perf_counter``, excluding the pacing sleep and
+    the time spent presenting).
+    Once a full window of samples is in, the rolling mean is compared with
+    the frame budget: well over it steps one tier down, well under it steps
+    one tier back up.  Samples are discarded after every change, so each
+    decision is made on frames rendered at the current tier.
+
+    Drawing code asks ``enabled(feature)`` rather than checking tier names:
+
+    - ``wave_text``:   per-letter wave animation; off draws the title as one cached surface
+    - ``dim_buttons``: alpha-dimmed inactive buttons; off draws them at normal opacity
+
+    Emits:
+        quality_changed — data = {'tier': name, 'previous': name, 'frame_ms': rolling mean}
+    """
+
+    # Ordered best-first: tier -> feature flags
+    TIERS = {
+        'high':   {'wave_text': True,  'dim_buttons': True},
+        'medium': {'wave_text': False, 'dim_buttons': True},
+        'low':    {'wave_text': False, 'dim_buttons': False},
+    }
+
+    BUDGET_MS = 1000 / 60
+    DOWNGRADE_RATIO = 1.2  # step down when the mean exceeds the budget by 20%
+    UPGRADE_RATIO = 0.5    # step up when the mean is under half the budget
+
+    def __init__(self, event_bus, budget_ms=BUDGET_MS, window=60):
+        self._bus = event_bus
+        self.budget_ms = budget_ms
+        self._names = list(self.TIERS)
+        self._index = 0
+        self._samples = deque(maxlen=window)
+
+    @property
+    def tier(self) -> str:
+        return self._names[self._index]
+
+    def enabled(self, feature: str) -> bool:
+        return self.TIERS[self.tier][feature]
+
+    def record(self, frame_ms) -> None:
+        """Add one frame's build time and change tier if the window says so."""
+        self._samples.append(frame_ms)
+        if len(self._samples) < self._samples.maxlen:
+            return
+
+        mean = sum(self._samples) / len(self._samples)
+        if mean > self.budget_ms * self.DOWNGRADE_RATIO and self._index < len(self._names) - 1:
+            self._set_tier(self._index + 1, mean)
+        elif mean < self.budget_ms * self.UPGRADE_RATIO and self._index > 0:
+            self._set_tier(self._index - 1, mean)
+
+    def set_tier(self, name: str) -> None:
+        """Force a tier, e.g. from a settings menu or a test."""
+        if name not in self.TIERS:
+            raise ValueError(f"Unknown quality tier {name!r}; expected one of {self._names}")
+        index = self._names.index(name)
+        if index != self._index:
+            self._set_tier(index, None)
+
+    def _set_tier(self, index, frame_ms) -> None:
+        previous = self.tier
+        self._index = index
+        self._samples.clear()
+        self._bus.emit('quality_changed', {'tier': self.tier, 'previous': previous, 'frame_ms': frame_ms})
+
+
+# Process-wide manager shared by every screen loop; subscribe to bus() for tier changes
+_bus = EventBus()
+_manager = QualityManager(_bus)
+
+
+def manager() -> QualityManager:
+    return _manager
+
+
+def bus() -> EventBus:
+    return _bus
+
+
+def enabled(feature: str) -> bool:
+    """Whether feature is on at the shared manager's current tier."""
+    return _manager.enabled(feature)
+
+
+def record(frame_ms) -> None:
+    """Report a frame's build time to the shared manager."""
+    _manager.record(frame_ms)
@@ -0,0 +1,192 @@
+import sys
+import time
+import pygame
+from . import animation_utils
+from . import sprite_cache
+
+
+class RenderTarget:
+    """Fixed-size logical surface presented to a window of any size.
+
+    Screens always draw into ``surface``, which is ``logical_size`` pixels no
+    matter how big the window is, so layout, caches and per-frame cost stay
+    the same on an 800x600 window and a 4K kiosk display.
+
+    Three presentation modes:
+
+    - ``'direct'``: a plain window exactly ``logical_size`` big, which is
+      the display surface screens draw into.  Nothing is scaled, and
+      present(rects) uploads only rects with ``display.update``.
+    - ``'scaled'``: ``pygame.SCALED`` lets SDL stretch the logical surface
+      on the GPU in a resizable window.  SDL also maps mouse positions back
+      to logical coordinates and handles HiDPI.  ``surface`` is the display
+      surface itself.
+    - ``'manual'``: a plain resizable window; present() scales the logical
+      surface into it with one ``transform.scale``, letterboxed to keep the
+      aspect ratio.  For platforms where SCALED isn't available; the scale
+      cost grows with the window size.
+
+    Only direct mode can present part of a frame: SCALED goes through SDL's
+    renderer, which re-uploads the full texture even for
+    ``display.update(rects)``, and manual mode rescales the whole viewport.
+    present() returns the rects it actually showed for callers that report
+    frame cost.  Without an explicit mode, default_mode() uses direct
+    wherever the window is the logical size anyway: a desktop window and
+    the pygbag canvas.  Only fullscreen scales.
+
+    vsync is off by default: the FramePacer sets the frame rate by sleeping
+    in the event loop, and a vsync'd flip would block inside SDL instead.
+    Only scaled mode can turn it on; SDL needs its renderer for that.
+    """
+
+    LOGICAL_SIZE = (800, 600)
+    MODES = ('direct', 'scaled', 'manual')
+
+    def __init__(self, logical_size=LOGICAL_SIZE, mode=None, fullscreen=False, vsync=False):
+        mode = self.default_mode(fullscreen) if mode is None else mode
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown render mode {mode!r}; expected one of {self.MODES}")
+        self.logical_size = tuple(logical_size)
+        self.mode = mode
+        self.fullscreen = fullscreen
+        self.vsync = vsync
+        self.surface = None   # what screens draw into
+        self.window = None    # the display surface
+        self.viewport = None  # Rect of the window the logical surface is scaled into (manual mode)
+        self._window_size = None
+        self._format = None   # bitsize the caches were last synced for
+
+    @staticmethod
+    def default_mode(fullscreen=False) -> str:
+        """'direct' unless the window has to be scaled to the screen, i.e. fullscreen on desktop."""
+        if sys.platform == 'emscripten':
+            return 'direct'  # The page scales pygbag's canvas itself
+        return 'scaled' if fullscreen else 'direct'
+
+    def open(self):
+        """Create the window and return the logical surface to draw into."""
+        if self.mode == 'direct':
+            flags = pygame.FULLSCREEN if self.fullscreen else 0
+            self.window = pygame.display.set_mode(self.logical_size, flags)
+            self.surface = self.window
+        elif self.mode == 'scaled':
+            flags = pygame.SCALED | (pygame.FULLSCREEN if self.fullscreen else pygame.RESIZABLE)
+            self.window = pygame.display.set_mode(self.logical_size, flags, vsync=1 if self.vsync else 0)
+            self.surface = self.window
+        else:
+            flags = pygame.FULLSCREEN if self.fullscreen else pygame.RESIZABLE
+            self.window = pygame.display.set_mode((0, 0) if self.fullscreen else self.logical_size, flags)
+            self.surface = pygame.Surface(self.logical_size).convert()
+        self._sync_window()
+        return self.surface
+
+    def present(self, rects=None):
+        """Show the logical surface; returns the logical rects uploaded.
+
+        rects narrows the upload only in direct mode; the scaled modes
+        always upload, and return, the whole frame (see the class docstring).
+        """
+        if self.mode == 'direct' and rects is not None:
+            pygame.display.update(rects)
+            return rects
+        if self.mode == 'manual':
+            self._sync_window()
+            pygame.transform.scale(self.surface, self.viewport.size, self.window.subsurface(self.viewport))
+        pygame.display.flip()
+        return [self.surface.get_rect()]
+
+    def to_logical(self, pos):
+        """Map a window position (e.g. event.pos) to logical coordinates."""
+        if self.mode != 'manual':
+            return pos  # The window is the logical size, or SDL already maps coordinates
+        vx, vy, vw, vh = self.viewport
+        lw, lh = self.logical_size
+        return ((pos[0] - vx) * lw // vw, (pos[1] - vy) * lh // vh)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _sync_window(self) -> None:
+        """Pick up window resizes and pixel-format changes."""
+        window = pygame.display.get_surface()
+        if window is not None:
+            self.window = window
+
+        if self.mode == 'manual':
+            window_size = self.window.get_size()
+            if window_size != self._window_size:
+                self._window_size = window_size
+                self.viewport = self._letterbox(window_size)
+                # Bars outside the viewport are never drawn again
+                self.window.fill((0, 0, 0))
+
+        # Converted sprites and gradients are tied to the display format, not
+        # the window size: they are drawn at logical size either way.
+        bitsize = self.window.get_bitsize()
+        if bitsize != self._format:
+            if self._format is not None:
+                animation_utils.gradient_cache().clear()
+            self._format = bitsize
+        sprite_cache.shared_cache().sync_display(self.surface)
+
+    def _letterbox(self, window_size):
+        lw, lh = self.logical_size
+        ww, wh = window_size
+        scale = min(ww / lw, wh / lh)
+        w, h = max(1, int(lw * scale)), max(1, int(lh * scale))
+        return pygame.Rect((ww - w) // 2, (wh - h) // 2, w, h)
+
+
+# The target created by main(); None until create() is called
+_active = None
+
+# Seconds spent in present() since take_present_time() was last called
+_present_seconds = 0.0
+
+
+def create(logical_size=RenderTarget.LOGICAL_SIZE, mode=None, fullscreen=False, vsync=False):
+    """Open the process-wide render target and return its logical surface."""
+    global _active
+    _active = RenderTarget(logical_size, mode, fullscreen, vsync)
+    return _active.open()
+
+
+def active():
+    return _active
+
+
+def present(rects=None):
+    """Present the frame through the active target, or straight to the display if none is open.
+
+    Returns the rects actually uploaded: rects itself when presenting to a
+    plain window (direct mode, or no target), the whole frame otherwise.
+    """
+    global _present_seconds
+    start = time.perf_counter()
+    try:
+        if _active is not None:
+            return _active.present(rects)
+        if rects is None:
+            pygame.display.flip()
+            return [pygame.display.get_surface().get_rect()]
+        pygame.display.update(rects)
+        return rects
+    finally:
+        _present_seconds += time.perf_counter() - start
+
+
+def take_present_time() -> float:
+    """Seconds spent presenting since the last call, which resets the count.
+
+    The frame pacer subtracts this from a frame's build time, so time
+    blocked in the driver isn't mistaken for rendering cost.
+    """
+    global _present_seconds
+    seconds, _present_seconds = _present_seconds, 0.0
+    return seconds
+
+
+def to_logical(pos):
+    """Map a window position to logical coordinates (unchanged when no target is open)."""
+    return _active.to_logical(pos) if _active is not None else pos
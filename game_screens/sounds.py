@@ -0,0 +1,129 @@
+import time
+import pygame
+from .surface_cache import ByteBudgetLRU
+
+# Decoded PCM is large (a 30s stereo effect is ~5MB), so the cache is bounded by bytes
+SOUND_CACHE_BUDGET = 16 * 1024 * 1024
+
+
+def sound_bytes(sound) -> int:
+    """Approximate PCM memory held by a decoded Sound at the mixer's current format."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    frequency, size, channels = init
+    return int(sound.get_length() * frequency) * (abs(size) // 8) * channels
+
+
+class SoundManager:
+    """Plays sound effects from a decoded-sound cache on a reserved channel pool.
+
+    Each file is decoded into a ``mixer.Sound`` once and kept in an LRU
+    cache bounded by ``budget`` bytes of PCM, so replaying an effect is just
+    a channel lookup and ``Channel.play``.
+
+    The first ``channels`` mixer channels are reserved for effects played
+    through here (``set_reserved``), so nothing else can take them.  A play
+    goes to a free pool channel when there is one; otherwise it steals the
+    channel whose sound has the lowest priority, the oldest one among
+    equals, as long as that priority is not above its own.  A play that
+    outranks nothing is dropped.
+    """
+
+    CHANNELS = 4
+
+    def __init__(self, channels=CHANNELS, budget=SOUND_CACHE_BUDGET, clock=time.perf_counter):
+        self.channel_count = channels
+        self.cache = ByteBudgetLRU(budget, sound_bytes)
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+        self._clock = clock
+        self._channels = None  # reserved Channels, claimed once the mixer is initialized
+        self._owners = {}      # pool index -> (priority, started) of the sound it last played
+
+    def load(self, file):
+        """Return the decoded Sound for file, decoding it on first use."""
+        sound = self.cache.get(file)
+        if sound is None:
+            sound = pygame.mixer.Sound(file)
+            self.cache.put(file, sound)
+        return sound
+
+    def play(self, file, priority=0):
+        """Play file once; returns the Channel, or None if the mixer is off or the play was dropped."""
+        return self.play_sound(self.load(file), priority)
+
+    def play_sound(self, sound, priority=0):
+        """Play an already built Sound (e.g. a synthesized tone) on the pool; see play()."""
+        index = self._pick_channel(priority)
+        if index is None:
+            return None
+        channel = self._channels[index]
+        channel.play(sound)
+        self._owners[index] = (priority, self._clock())
+        self.played += 1
+        return channel
+
+    def stop(self) -> None:
+        """Silence every pool channel."""
+        for channel in self._channels or ():
+            channel.stop()
+        self._owners.clear()
+
+    def stats(self) -> dict:
+        return {
+            'sounds':  len(self.cache),
+            'bytes':   self.cache.bytes_used,
+            'played':  self.played,
+            'stolen':  self.stolen,
+            'dropped': self.dropped,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _pick_channel(self, priority):
+        if self._channels is None:
+            if not pygame.mixer.get_init():
+                return None
+            if pygame.mixer.get_num_channels() < self.channel_count:
+                pygame.mixer.set_num_channels(self.channel_count)
+            pygame.mixer.set_reserved(self.channel_count)
+            self._channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+
+        for index, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                return index
+
+        # Every channel is busy: take the lowest-priority, oldest sound if we outrank or tie it
+        victim = min(self._owners, key=self._owners.get, default=None)
+        if victim is None or self._owners[victim][0] > priority:
+            self.dropped += 1
+            return None
+        self.stolen += 1
+        return victim
+
+
+# Process-wide manager; the mixer and its channels are shared by every screen
+_manager = SoundManager()
+
+
+def manager() -> SoundManager:
+    return _manager
+
+
+def load(file):
+    """Decode file into the shared sound cache."""
+    return _manager.load(file)
+
+
+def play(file, priority=0):
+    """Play file through the shared manager."""
+    return _manager.play(file, priority)
+
+
+def play_sound(sound, priority=0):
+    """Play a Sound object through the shared manager."""
+    return _manager.play_sound(sound, priority)
@@ -0,0 +1,61 @@
+import json
+import os
+from . import sprite_cache
+
+# Written next to the button PNGs by tools/build_sprite_atlas.py
+MANIFEST_NAME = 'atlas.json'
+MANIFEST_VERSION = 1
+
+# Parsed manifests, keyed by path; the atlas image itself lives in the sprite cache
+_manifests = {}
+
+
+class SpriteAtlas:
+    """Button sprites sliced out of a single pre-scaled atlas image.
+
+    The atlas and its manifest are produced at build time by
+    tools/build_sprite_atlas.py, which packs every button state at the exact
+    size GameScreen draws it.  At runtime that means one decode (and one
+    fetch on the pygbag web build) instead of one per PNG, and no smoothscale.
+
+    Manifest format::
+
+        {"version": 1, "image": "atlas.png",
+         "sprites": {"up": {"normal": [x, y, w, h], ...}, ...}}
+    """
+
+    def __init__(self, image, rects):
+        self.image = image
+        self.rects = rects  # name -> state -> (x, y, w, h)
+
+    def get(self, name, state, size=None):
+        """Return the sprite as a subsurface, or None if absent or baked at a different size."""
+        rect = self.rects.get(name, {}).get(state)
+        if rect is None:
+            return None
+        if size is not None and tuple(rect[2:]) != tuple(size):
+            # Layout changed since the atlas was built; caller falls back to the source PNG
+            return None
+        return self.image.subsurface(rect)
+
+
+def load_atlas(manifest_path):
+    """Load the atlas described by manifest_path, or return None if it hasn't been built.
+
+    The image goes through the shared sprite cache, so it is decoded once per
+    display mode and released with the rest of the cache on invalidation.
+    """
+    manifest = _manifests.get(manifest_path)
+    if manifest is None:
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('version') != MANIFEST_VERSION:
+            print(f"Warning: ignoring sprite atlas {manifest_path}: unsupported version {manifest.get('version')}")
+            return None
+        _manifests[manifest_path] = manifest
+
+    image_path = os.path.join(os.path.dirname(manifest_path), manifest['image'])
+    return SpriteAtlas(sprite_cache.load(image_path), manifest['sprites'])
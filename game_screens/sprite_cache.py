@@ -0,0 +1,213 @@
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import pygame
+from . import disk_cache
+
+# Longest a prefetch() slice blocks waiting for the pool to finish a decode
+PREFETCH_WAIT_S = 0.001
+
+
+class SpriteCache:
+    """Process-wide cache of decoded, converted and scaled sprites.
+
+    Keyed by (path, size, alpha): ``size`` is the target size passed to
+    ``smoothscale`` (None for the image as decoded) and ``alpha`` selects
+    ``convert_alpha()`` over ``convert()``.  When a scaled sprite is requested
+    the decoded source is only kept long enough to scale it, so a cache
+    that serves GameScreen holds just the variants it actually draws.
+
+    Converted surfaces are tied to the display format, so the cache must be
+    invalidated when the display mode changes — call sync_display() after
+    every ``pygame.display.set_mode``.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._sprites = {}        # (path, size, alpha) -> Surface
+        self._display_key = None  # (size, bitsize) of the display the sprites were converted for
+
+    def load(self, path, size=None, alpha=True):
+        """Return the sprite at path, converted for the display and scaled to size."""
+        key = (path, size, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = _load_stored(key)
+        if sprite is None:
+            source = self._sprites.get((path, None, alpha))
+            if source is None:
+                image = pygame.image.load(path)
+                source = image.convert_alpha() if alpha else image.convert()
+            sprite = pygame.transform.smoothscale(source, size) if size is not None else source
+            _store(key, sprite)
+        self._sprites[key] = sprite
+        return sprite
+
+    def load_many(self, requests, executor=None):
+        """Load every (path, size, alpha) in requests; returns the sprites in order.
+
+        Without an executor this is just load() in a loop.  With one (see
+        decode_executor()) the sprites not yet cached are decoded and scaled
+        on the pool — both release the GIL for most of their work — and only
+        the display-dependent convert runs here on the calling thread.
+        Scaling happens before converting on that path, so pixels can differ
+        from load()'s by rounding.
+        """
+        requests = [(path, size, alpha) for path, size, alpha in requests]
+        fresh = {}
+        if executor is not None:
+            # Sprites whose unscaled source is cached are cheaper through load()
+            missing = list(dict.fromkeys(
+                key for key in requests
+                if key not in self._sprites and (key[0], None, key[2]) not in self._sprites
+            ))
+            # Sprites stored by an earlier launch are mapped straight from disk
+            for key in missing:
+                sprite = _load_stored(key)
+                if sprite is not None:
+                    self.misses += 1
+                    self._sprites[key] = fresh[key] = sprite
+            missing = [key for key in missing if key not in fresh]
+            decoded = executor.map(lambda key: _decode(key[0], key[1]), missing)
+            for key, image in zip(missing, decoded):
+                fresh[key] = self._add_decoded(key, image)
+        return [fresh[key] if key in fresh else self.load(*key) for key in requests]
+
+    def prefetch(self, requests, executor=None):
+        """Job generator: warm the cache with every (path, size, alpha), yielding progress.
+
+        Without an executor (pygbag) each slice load()s one sprite.  With one
+        the first slice hands every sprite that needs decoding to the pool,
+        as load_many() does, and later slices convert whichever decodes have
+        finished, so the frames keep running while the pool works.  A slice
+        with nothing finished waits at most PREFETCH_WAIT_S for one.
+        """
+        requests = list(dict.fromkeys((path, size, alpha) for path, size, alpha in requests))
+        total = len(requests)
+        if executor is None:
+            for done, key in enumerate(requests, start=1):
+                self.load(*key)
+                yield done / total
+            return
+
+        pending = {}  # Future -> key
+        for key in requests:
+            if key in self._sprites or (key[0], None, key[2]) in self._sprites:
+                self.load(*key)
+                continue
+            sprite = _load_stored(key)
+            if sprite is not None:
+                self.misses += 1
+                self._sprites[key] = sprite
+            else:
+                pending[executor.submit(_decode, key[0], key[1])] = key
+        yield 1 - len(pending) / total if total else 1.0
+
+        while pending:
+            finished, _ = wait(pending, timeout=PREFETCH_WAIT_S, return_when=FIRST_COMPLETED)
+            for future in finished:
+                self._add_decoded(pending.pop(future), future.result())
+            yield 1 - len(pending) / total
+
+    def sync_display(self, display) -> None:
+        """Invalidate if display no longer matches the mode sprites were converted for."""
+        display_key = (display.get_size(), display.get_bitsize())
+        if display_key != self._display_key:
+            self.invalidate()
+            self._display_key = display_key
+
+    def invalidate(self) -> None:
+        """Drop every sprite; the next load() decodes from disk again."""
+        self._sprites = {}
+
+    def stats(self) -> dict:
+        return {'sprites': len(self._sprites), 'hits': self.hits, 'misses': self.misses}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _add_decoded(self, key, image):
+        """Store, convert and cache an image decoded off the main thread; returns the sprite."""
+        self.misses += 1
+        _store(key, image)
+        sprite = image.convert_alpha() if key[2] else image.convert()
+        self._sprites[key] = sprite
+        return sprite
+
+
+def _decode(path, size):
+    """Decode and optionally scale an image; safe to run off the main thread."""
+    image = pygame.image.load(path)
+    return pygame.transform.smoothscale(image, size) if size is not None else image
+
+
+def _load_stored(key):
+    """The sprite for (path, size, alpha) from the disk cache, converted, or None.
+
+    Entries are validated against the source file's content digest, so an
+    edited PNG is decoded again.
+    """
+    if not disk_cache.enabled():
+        return None
+    path, size, alpha = key
+    try:
+        stored = disk_cache.load(('sprite',) + key, (disk_cache.file_digest(path),))
+    except OSError:
+        return None  # Missing source; the decode that follows reports it
+    if stored is None:
+        return None
+    return stored.convert_alpha() if alpha else stored.convert()
+
+
+def _store(key, sprite) -> None:
+    if not disk_cache.enabled():
+        return
+    path, size, alpha = key
+    try:
+        disk_cache.store(('sprite',) + key, sprite, (disk_cache.file_digest(path),), alpha)
+    except OSError:
+        pass  # Source vanished after decoding; nothing worth caching
+
+
+# Decode pool for load_many(), created on first use
+_executor = None
+
+
+def decode_executor():
+    """Thread pool for parallel decoding, or None where threads aren't available (pygbag)."""
+    global _executor
+    if sys.platform == 'emscripten':
+        return None
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                       thread_name_prefix='sprite-decode')
+    return _executor
+
+
+# Process-wide cache that survives GameScreen being rebuilt on every retry
+_shared_cache = SpriteCache()
+
+
+def shared_cache() -> SpriteCache:
+    return _shared_cache
+
+
+def load(path, size=None, alpha=True):
+    """Load a sprite through the shared cache."""
+    return _shared_cache.load(path, size, alpha)
+
+
+def load_many(requests, executor=None):
+    """Load several sprites through the shared cache; see SpriteCache.load_many()."""
+    return _shared_cache.load_many(requests, executor)
+
+
+def prefetch(requests, executor=None):
+    """Job generator warming the shared cache; see SpriteCache.prefetch()."""
+    return _shared_cache.prefetch(requests, executor)
@@ -1,36 +1,53 @@
 import pygame
-import asyncio
 from . import animation_utils
+from . import jobs
+from . import pacing
+from . import render_target
+from . import window_monitor
+from .compositor import LayerCompositor
 
 class StartScreen:
+    MUSIC = "assets/startscreen.ogg"
+
     def __init__(self, screen):
         self.screen = screen
         self.gradient_top = (25, 25, 112)  # Midnight blue
         self.gradient_bottom = (48, 25, 52)  # Dark purple
         self.running = True
         self.start_time = pygame.time.get_ticks()
-        animation_utils.play_music("assets/startscreen.ogg") # Play music when start screen is initialized
+        animation_utils.play_music(self.MUSIC) # Play music when start screen is initialized
+
+        # Only the gradient is static; the title, loading bar and prompt animate on top.
+        # The first frame needs it, so build it here, where it is also saved to disk
+        animation_utils.prepare_gradient(screen.get_size(), self.gradient_top, self.gradient_bottom)
+        self.compositor = LayerCompositor(screen, self.gradient_top, self.gradient_bottom)
+        self.compositor.add_animated(self._draw_title)
 
 
     async def run(self):
-        clock = pygame.time.Clock()
+        pacer = pacing.shared_pacer()
+        pacer.reset()
 
         while self.running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return "quit"
+                window_monitor.handle_event(event)
 
-            # Draw gradient background
-            animation_utils.draw_gradient(self.screen, self.gradient_top, self.gradient_bottom)
+            if window_monitor.suspended():
+                # Minimized or hidden: don't draw or present until the window returns
+                await pacer.tick(idle=True)
+                continue
 
-            # Draw the wave title text
-            animation_utils.wave_text(self.screen, "TYP0!", (self.screen.get_width() // 2, 200), font_size=128)
+            # Cached gradient plus the wave title
+            self.compositor.draw()
 
-            # Draw loading bar and check if complete
+            # Draw loading bar and check if complete: it tracks the queued
+            # preload jobs, so the prompt appears as soon as the assets are in
             loading_complete = animation_utils.loading_bar(
                 self.screen,
                 self.start_time,
-                load_time=4000,
+                progress=jobs.shared_scheduler().progress,
             )
             # Draw flashing text
             if not loading_complete:
@@ -43,8 +60,12 @@ class StartScreen:
                     return "start"
                 
 
-            pygame.display.flip()
-            clock.tick(60)
-            await asyncio.sleep(0)  # Required for pygbag
+            render_target.present()
+            # Title and prompt animate every frame, so this screen never idles
+            await pacer.tick()
+
+        return "quit"
 
-        return "quit"
\ No newline at end of file
+    def _draw_title(self, surface):
+        # Draw the wave title text
+        animation_utils.wave_text(surface, "TYP0!", (surface.get_width() // 2, 200), font_size=128)
@@ -0,0 +1,106 @@
+from collections import OrderedDict
+
+
+def surface_bytes(surface) -> int:
+    """Approximate pixel memory held by a Surface."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class ByteBudgetLRU:
+    """Least-recently-used cache bounded by a byte budget.
+
+    Entries are evicted oldest-first once their total size exceeds
+    ``max_bytes``.  The most recently added entry is always kept, so a single
+    value larger than the whole budget still works — it just evicts
+    everything else.
+
+    Each value's size comes from the ``nbytes`` passed to put(), or else
+    from ``sizeof(value)``; without a sizeof, put() requires nbytes.
+    """
+
+    def __init__(self, max_bytes: int, sizeof=None):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes), oldest first
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key, default=None):
+        """Return the cached value for key and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, nbytes=None) -> None:
+        """Store value under key, evicting old entries to stay within budget."""
+        if nbytes is None:
+            if self._sizeof is None:
+                raise TypeError("put() needs nbytes when the cache has no sizeof")
+            nbytes = self._sizeof(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        self._entries[key] = (value, nbytes)
+        self.bytes_used += nbytes
+        self._evict()
+
+    def get_or_create(self, key, factory, nbytes=None):
+        """Return the cached value for key, building it with factory() on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value, nbytes(value) if nbytes else None)
+        return value
+
+    def set_budget(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting immediately if it shrank."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry; stats are kept."""
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> dict:
+        return {
+            'entries':   len(self._entries),
+            'bytes':     self.bytes_used,
+            'max_bytes': self.max_bytes,
+            'hits':      self.hits,
+            'misses':    self.misses,
+            'evictions': self.evictions,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _evict(self) -> None:
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.bytes_used -= nbytes
+            self.evictions += 1
+
+
+class SurfaceCache(ByteBudgetLRU):
+    """ByteBudgetLRU of Surfaces, each sized by its pixel memory."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(max_bytes, surface_bytes)
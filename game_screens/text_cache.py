@@ -0,0 +1,52 @@
+from .surface_cache import SurfaceCache, surface_bytes
+
+
+class TextCache(SurfaceCache):
+    """LRU cache of rendered text surfaces.
+
+    Keyed by (font, text, color, antialias, shadow_color).  A Font object is
+    built for a single size, so the font identity already covers the size.
+    With the cache in place a steady-state frame does no ``font.render`` calls
+    unless the text actually changed.
+    """
+
+    DEFAULT_BUDGET = 4 * 1024 * 1024  # bytes of pixel data
+
+    def __init__(self, max_bytes: int = DEFAULT_BUDGET):
+        super().__init__(max_bytes)
+
+    def render(self, font, text, color, antialias=True):
+        """Cached equivalent of ``font.render(text, antialias, color)``."""
+        key = (font, text, tuple(color), antialias, None)
+        surface = self.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self.put(key, surface)
+        return surface
+
+    def render_shadowed(self, font, text, color, shadow_color, antialias=True):
+        """Return a cached (shadow_surface, text_surface) pair for drop-shadowed text."""
+        key = (font, text, tuple(color), antialias, tuple(shadow_color))
+        pair = self.get(key)
+        if pair is None:
+            pair = (font.render(text, antialias, shadow_color), font.render(text, antialias, color))
+            self.put(key, pair, surface_bytes(pair[0]) + surface_bytes(pair[1]))
+        return pair
+
+
+# Process-wide cache shared by every screen and animation helper
+_shared_cache = TextCache()
+
+
+def shared_cache() -> TextCache:
+    return _shared_cache
+
+
+def render(font, text, color, antialias=True):
+    """Render text through the shared cache."""
+    return _shared_cache.render(font, text, color, antialias)
+
+
+def render_shadowed(font, text, color, shadow_color, antialias=True):
+    """Render drop-shadowed text through the shared cache."""
+    return _shared_cache.render_shadowed(font, text, color, shadow_color, antialias)
@@ -0,0 +1,114 @@
+import pygame
+
+try:
+    import numpy
+except ImportError:  # Optional: without NumPy the game runs without button tones
+    numpy = None
+
+# (attack_ms, decay_ms, sustain_level, release_ms); sustain lasts whatever the duration leaves
+DEFAULT_ENVELOPE = (5, 60, 0.6, 120)
+VOLUME = 0.4
+
+# Mixer sample size (pygame.mixer.get_init()[1]) -> numpy dtype and full-scale amplitude
+_SAMPLE_FORMATS = {
+    8:   ('uint8', 127),
+    -8:  ('int8', 127),
+    16:  ('uint16', 32767),
+    -16: ('int16', 32767),
+    32:  ('float32', 1.0),
+    -32: ('int32', 2 ** 31 - 1),
+}
+
+
+def envelope_gain(envelope, count, sample_rate):
+    """Per-sample ADSR gain (0–1) for a tone count samples long."""
+    attack_ms, decay_ms, sustain, release_ms = envelope
+    attack, decay, release = (int(ms * sample_rate / 1000) for ms in (attack_ms, decay_ms, release_ms))
+    # Short tones squeeze the sustain first, then the release
+    release = min(release, count)
+    attack = min(attack, count - release)
+    decay = min(decay, count - release - attack)
+    hold = count - attack - decay - release
+    return numpy.concatenate([
+        numpy.linspace(0.0, 1.0, attack, endpoint=False),
+        numpy.linspace(1.0, sustain, decay, endpoint=False),
+        numpy.full(hold, sustain),
+        numpy.linspace(sustain, 0.0, release),
+    ])
+
+
+def tone_samples(frequency, duration_ms, envelope, sample_rate):
+    """Mono float samples in [-1, 1]: a sine at frequency shaped by envelope."""
+    count = int(sample_rate * duration_ms / 1000)
+    t = numpy.arange(count) / sample_rate
+    return numpy.sin(2 * numpy.pi * frequency * t) * envelope_gain(envelope, count, sample_rate)
+
+
+class ToneSynth:
+    """Generates short feedback tones in memory with NumPy and pygame.sndarray.
+
+    Tones are sine waves shaped by an ADSR envelope, converted to the
+    mixer's sample format and channel count, and wrapped as ``mixer.Sound``
+    with ``sndarray.make_sound`` — no files involved.  Each Sound is cached
+    by (frequency, duration, envelope), so a tone is synthesized once per
+    process however many screens ask for it.
+
+    Without NumPy or an initialized mixer ``available`` is False and every
+    lookup returns None; callers simply play nothing.
+    """
+
+    def __init__(self, volume=VOLUME):
+        self.volume = volume
+        self._tones = {}  # (frequency, duration_ms, envelope) -> Sound
+
+    @property
+    def available(self) -> bool:
+        return numpy is not None and bool(pygame.mixer.get_init())
+
+    def tone(self, frequency, duration_ms, envelope=DEFAULT_ENVELOPE):
+        """Return the Sound for a tone, synthesizing it on first use; None if unavailable."""
+        key = (frequency, duration_ms, tuple(envelope))
+        sound = self._tones.get(key)
+        if sound is None:
+            if not self.available:
+                return None
+            sound = pygame.sndarray.make_sound(self._pcm(frequency, duration_ms, envelope))
+            self._tones[key] = sound
+        return sound
+
+    def button_tones(self, frequencies, duration_ms, envelope=DEFAULT_ENVELOPE) -> dict:
+        """Map each name in frequencies (name -> Hz) to its tone; empty if unavailable."""
+        if not self.available:
+            return {}
+        return {name: self.tone(hz, duration_ms, envelope) for name, hz in frequencies.items()}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _pcm(self, frequency, duration_ms, envelope):
+        sample_rate, size, channels = pygame.mixer.get_init()
+        dtype, full_scale = _SAMPLE_FORMATS[size]
+        wave = tone_samples(frequency, duration_ms, envelope, sample_rate) * self.volume
+        if dtype.startswith('uint'):
+            # Unsigned formats are centred on half scale
+            pcm = (wave * full_scale + full_scale + 1).astype(dtype)
+        else:
+            pcm = (wave * full_scale).astype(dtype)
+        if channels > 1:
+            # make_sound wants (samples, channels) for multi-channel mixers
+            pcm = numpy.ascontiguousarray(numpy.repeat(pcm[:, None], channels, axis=1))
+        return pcm
+
+
+# Process-wide synth; tones are shared by every GameScreen
+_synth = ToneSynth()
+
+
+def synth() -> ToneSynth:
+    return _synth
+
+
+def button_tones(frequencies, duration_ms, envelope=DEFAULT_ENVELOPE) -> dict:
+    """Tones for a screen's buttons from the shared synth."""
+    return _synth.button_tones(frequencies, duration_ms, envelope)
@@ -0,0 +1,62 @@
+import pygame
+
+
+class WindowMonitor:
+    """Tracks window visibility and focus from SDL window events.
+
+    Every screen loop passes its events through handle_event(); the state
+    lives here rather than in a screen because it outlives them — a
+    GameScreen built while the window is minimized starts out suspended.
+
+    - ``suspended``: minimized or hidden (a background browser tab under
+      pygbag).  Nothing is visible, so screens skip drawing and presenting
+      and idle until the window comes back.
+    - ``should_pause``: suspended or unfocused.  GameScreen auto-pauses so
+      the timer can't run out while the player isn't looking.
+    """
+
+    def __init__(self):
+        self.hidden = False
+        self.focused = True
+
+    @property
+    def suspended(self) -> bool:
+        return self.hidden
+
+    @property
+    def should_pause(self) -> bool:
+        return self.hidden or not self.focused
+
+    def handle_event(self, event) -> bool:
+        """Update state from event; returns True if it was a visibility or focus event."""
+        if event.type in (pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED):
+            self.hidden = True
+        elif event.type in (pygame.WINDOWSHOWN, pygame.WINDOWRESTORED,
+                            pygame.WINDOWMAXIMIZED, pygame.WINDOWEXPOSED):
+            # SDL can restore a minimized window by maximizing or just exposing it
+            self.hidden = False
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        else:
+            return False
+        return True
+
+
+# Process-wide monitor; the window is shared by every screen
+_monitor = WindowMonitor()
+
+
+def monitor() -> WindowMonitor:
+    return _monitor
+
+
+def handle_event(event) -> bool:
+    """Feed an event to the shared monitor."""
+    return _monitor.handle_event(event)
+
+
+def suspended() -> bool:
+    """Whether the window is currently minimized or hidden."""
+    return _monitor.suspended
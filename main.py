@@ -1,4 +1,7 @@
 # /// script
+# dependencies = [
+#     "numpy",  # button tones, see game_screens/tones.py
+# ]
 # [pygbag]
 # autorun = true
 # width = 800
@@ -12,12 +15,22 @@ from game_screens.display import GameScreen
 from game_screens.gameover import GameOverScreen
 from Keybinds import KeybindManager
 from game_screens.pause_overlay import PauseOverlay
+from game_screens import audio, preloader, render_target
 
 async def main():
+    # Small mixer buffers so button tones follow their flashes; must precede init()
+    audio.pre_init()
     pygame.init()
-    screen = pygame.display.set_mode((800, 600))
+    # Screens draw into a fixed 800x600 logical surface; the window is that size, so
+    # dirty rects upload only what changed.  The render target also keeps the sprite
+    # cache in sync with the display format
+    screen = render_target.create((800, 600))
     pygame.display.set_caption("TYP0")
 
+    # Load every asset the game needs in the start screen's spare frame time;
+    # its loading bar follows this job
+    preloader.preload(screen.get_size())
+
     # Show start screen
     start_screen = StartScreen(screen)
     result = await start_screen.run()
@@ -27,10 +40,10 @@ async def main():
         return
 
     if result == "start":
-        pause_overlay = PauseOverlay(screen)
+        pause_overlay = PauseOverlay(screen, freeze=True)
 
         while True:
-            game_screen = GameScreen(screen, pause_overlay=pause_overlay)
+            game_screen = GameScreen(screen, pause_overlay=pause_overlay, dirty_rects=True)
             result = await game_screen.run()
 
             if result == "quit":
@@ -0,0 +1,14 @@
+import sys
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_disk_cache(monkeypatch):
+    """Keep tests off the user's surface cache; tests that want one build their own.
+
+    Only applies once a test module has imported game_screens (with pygame
+    mocked); pure-Python tests never load it.
+    """
+    disk_cache = sys.modules.get('game_screens.disk_cache')
+    if disk_cache is not None:
+        monkeypatch.setattr(disk_cache, '_shared_cache', disk_cache.SurfaceDiskCache(None))
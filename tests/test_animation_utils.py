@@ -0,0 +1,250 @@
+"""Tests for the gradient and audio helpers in animation_utils."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import animation_utils
+from game_screens.animation_utils import _gradient_column, draw_gradient, get_gradient, gradient_steps
+
+
+@pytest.fixture(autouse=True)
+def clear_gradient_cache():
+    """Each test starts with an empty gradient cache and fresh stats."""
+    cache = animation_utils.gradient_cache()
+    cache.clear()
+    cache.hits = cache.misses = cache.evictions = 0
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def mock_pygame():
+    """Mock pygame so scaled gradients report their real size."""
+    with patch('game_screens.animation_utils.pygame') as mock_pg:
+        def scale(column, size):
+            scaled = Mock()
+            converted = scaled.convert.return_value
+            converted.get_width.return_value = size[0]
+            converted.get_height.return_value = size[1]
+            converted.get_bytesize.return_value = 4
+            return scaled
+
+        mock_pg.transform.scale.side_effect = scale
+        yield mock_pg
+
+
+class TestGradientColumn:
+    """Tests for the vectorized column builder."""
+
+    def test_column_is_one_rgb_triplet_per_row(self):
+        """The column should hold 3 bytes per pixel row."""
+        assert len(_gradient_column(600, (25, 25, 112), (0, 0, 0))) == 600 * 3
+
+    def test_column_matches_per_row_blend(self):
+        """Every row should match the original per-row interpolation."""
+        top, bottom, height = (255, 100, 0), (0, 50, 200), 37
+        column = _gradient_column(height, top, bottom)
+
+        for y in range(height):
+            ratio = y / height
+            expected = tuple(int(top[c] * (1 - ratio) + bottom[c] * ratio) for c in range(3))
+            assert tuple(column[y * 3:y * 3 + 3]) == expected
+
+    def test_first_row_is_top_color(self):
+        """Row 0 should be exactly the top color."""
+        assert tuple(_gradient_column(10, (80, 10, 10), (20, 0, 0))[:3]) == (80, 10, 10)
+
+
+class TestGetGradient:
+    """Tests for get_gradient() and its bounded cache."""
+
+    def test_builds_by_stretching_a_column(self, mock_pygame):
+        """A gradient should be one frombuffer column scaled to full width, not per-row lines."""
+        get_gradient((800, 600), (25, 25, 112), (0, 0, 0))
+
+        mock_pygame.image.frombuffer.assert_called_once()
+        args = mock_pygame.image.frombuffer.call_args[0]
+        assert args[1:] == ((1, 600), 'RGB')
+        mock_pygame.transform.scale.assert_called_once_with(mock_pygame.image.frombuffer.return_value, (800, 600))
+        mock_pygame.draw.line.assert_not_called()
+
+    def test_cached_per_size_and_colors(self, mock_pygame):
+        """The same size and colors should reuse the cached surface."""
+        first = get_gradient((800, 600), (25, 25, 112), (0, 0, 0))
+        second = get_gradient((800, 600), [25, 25, 112], [0, 0, 0])
+
+        assert first is second
+        assert mock_pygame.transform.scale.call_count == 1
+        assert animation_utils.gradient_cache().stats()['hits'] == 1
+
+    def test_different_colors_build_new_gradient(self, mock_pygame):
+        """A different color pair should build a separate surface."""
+        first = get_gradient((800, 600), (25, 25, 112), (0, 0, 0))
+        second = get_gradient((800, 600), (80, 10, 10), (20, 0, 0))
+
+        assert first is not second
+        assert len(animation_utils.gradient_cache()) == 2
+
+    def test_cache_is_bounded(self, mock_pygame):
+        """Many color pairs should evict old gradients instead of growing without limit."""
+        for shade in range(50):
+            get_gradient((800, 600), (shade, 0, 0), (0, 0, 0))
+
+        stats = animation_utils.gradient_cache().stats()
+        assert stats['bytes'] <= animation_utils.GRADIENT_CACHE_BUDGET
+        assert stats['evictions'] > 0
+        assert stats['entries'] == animation_utils.GRADIENT_CACHE_BUDGET // (800 * 600 * 4)
+
+    def test_draw_gradient_blits_cached_surface(self, mock_pygame):
+        """draw_gradient should blit the cached gradient for the screen size."""
+        screen = Mock()
+        screen.get_size.return_value = (800, 600)
+
+        draw_gradient(screen, (25, 25, 112), (0, 0, 0))
+
+        screen.blit.assert_called_once_with(get_gradient((800, 600), (25, 25, 112), (0, 0, 0)), (0, 0))
+
+
+class TestGradientSteps:
+    """Tests for the sliced gradient job."""
+
+    def test_builds_in_two_slices(self, mock_pygame):
+        """The column and the scale should run in separate slices."""
+        steps = gradient_steps((800, 600), (80, 10, 10), (20, 0, 0))
+
+        assert next(steps) == 0.5
+        mock_pygame.transform.scale.assert_not_called()
+        with pytest.raises(StopIteration):
+            next(steps)
+        mock_pygame.transform.scale.assert_called_once()
+
+    def test_result_served_by_get_gradient(self, mock_pygame):
+        """After the job, get_gradient should hit the cache."""
+        for _ in gradient_steps((800, 600), (80, 10, 10), (20, 0, 0)):
+            pass
+
+        get_gradient((800, 600), (80, 10, 10), (20, 0, 0))
+
+        assert mock_pygame.transform.scale.call_count == 1
+        assert animation_utils.gradient_cache().stats()['hits'] == 1
+
+    def test_cached_gradient_is_noop(self, mock_pygame):
+        """A gradient already cached should finish without any slices."""
+        get_gradient((800, 600), (80, 10, 10), (20, 0, 0))
+
+        assert list(gradient_steps((800, 600), (80, 10, 10), (20, 0, 0))) == []
+
+
+class TestGradientDiskCache:
+    """Tests for gradients restored from the on-disk surface cache."""
+
+    @pytest.fixture
+    def stored(self):
+        with patch('game_screens.animation_utils.disk_cache') as mock_disk:
+            mock_disk.load.return_value = None
+            yield mock_disk
+
+    @staticmethod
+    def stored_gradient(size=(800, 600)):
+        image = Mock()
+        converted = image.convert.return_value
+        converted.get_width.return_value = size[0]
+        converted.get_height.return_value = size[1]
+        converted.get_bytesize.return_value = 4
+        return image
+
+    def test_stored_gradient_skips_build(self, mock_pygame, stored):
+        """A disk hit is converted and cached without building a column."""
+        image = self.stored_gradient()
+        stored.load.return_value = image
+
+        assert get_gradient((800, 600), (80, 10, 10), (20, 0, 0)) is image.convert.return_value
+        stored.load.assert_called_once_with(('gradient', (800, 600), (80, 10, 10), (20, 0, 0)))
+        mock_pygame.transform.scale.assert_not_called()
+
+    def test_miss_while_drawing_is_not_stored(self, mock_pygame, stored):
+        """A gradient built by get_gradient() mid-frame stays off the disk."""
+        get_gradient((800, 600), (80, 10, 10), (20, 0, 0))
+
+        stored.store.assert_not_called()
+
+    def test_job_stores_gradient_without_alpha(self, mock_pygame, stored):
+        """A gradient built by the job is written back as RGB before converting."""
+        list(gradient_steps((800, 600), (80, 10, 10), (20, 0, 0)))
+
+        name, surface = stored.store.call_args.args
+        assert name == ('gradient', (800, 600), (80, 10, 10), (20, 0, 0))
+        assert stored.store.call_args.kwargs == {'alpha': False}
+        assert animation_utils.gradient_cache().get(name[1:]) is surface.convert.return_value
+
+    def test_prepare_gradient_stores_and_returns(self, mock_pygame, stored):
+        """prepare_gradient builds the gradient the way the job does, up front."""
+        gradient = animation_utils.prepare_gradient((800, 600), (80, 10, 10), (20, 0, 0))
+
+        stored.store.assert_called_once()
+        assert gradient is animation_utils.gradient_cache().get(((800, 600), (80, 10, 10), (20, 0, 0)))
+
+    def test_job_finishes_without_slices_on_disk_hit(self, mock_pygame, stored):
+        """gradient_steps loads a stored gradient without yielding."""
+        stored.load.return_value = self.stored_gradient()
+
+        assert list(gradient_steps((800, 600), (80, 10, 10), (20, 0, 0))) == []
+        assert ((800, 600), (80, 10, 10), (20, 0, 0)) in animation_utils.gradient_cache()
+
+
+class TestAudioCache:
+    """Tests for preloaded music and the sound effect helpers."""
+
+    @pytest.fixture(autouse=True)
+    def clear_audio(self):
+        animation_utils._music_data.clear()
+        yield
+        animation_utils._music_data.clear()
+
+    @pytest.fixture
+    def mock_mixer(self):
+        with patch('game_screens.animation_utils.pygame') as mock_pg:
+            mock_pg.error = type('error', (Exception,), {})
+            yield mock_pg
+
+    def test_play_music_streams_preloaded_bytes(self, tmp_path, mock_mixer):
+        """Preloaded music is loaded from memory with its format as the name hint."""
+        path = tmp_path / 'theme.ogg'
+        path.write_bytes(b'OggS-data')
+        animation_utils.preload_music(str(path))
+
+        assert animation_utils.play_music(str(path), loops=0) is True
+        source, hint = mock_mixer.mixer.music.load.call_args.args
+        assert source.read() == b'OggS-data'
+        assert hint == 'ogg'
+        mock_mixer.mixer.music.play.assert_called_once_with(0)
+
+    def test_play_music_falls_back_to_disk(self, mock_mixer):
+        """Music that wasn't preloaded is loaded by path and loops by default."""
+        animation_utils.play_music('assets/startscreen.ogg')
+
+        mock_mixer.mixer.music.load.assert_called_once_with('assets/startscreen.ogg')
+        mock_mixer.mixer.music.play.assert_called_once_with(-1)
+
+    def test_play_music_reports_load_failure(self, mock_mixer):
+        """A music file the mixer can't load is a warning, not a crash."""
+        mock_mixer.mixer.music.load.side_effect = mock_mixer.error('no mixer')
+
+        assert animation_utils.play_music('assets/missing.ogg') is False
+        mock_mixer.mixer.music.play.assert_not_called()
+
+    def test_load_sound_uses_shared_manager(self):
+        """load_sound goes through the shared sound cache."""
+        with patch('game_screens.animation_utils.sounds') as mock_sounds:
+            assert animation_utils.load_sound('assets/correct.ogg') is mock_sounds.load.return_value
+        mock_sounds.load.assert_called_once_with('assets/correct.ogg')
+
+    def test_play_sound_reports_decode_failure(self, mock_mixer):
+        """A sound the mixer can't decode is a warning, not a crash."""
+        with patch('game_screens.animation_utils.sounds') as mock_sounds:
+            mock_sounds.play.side_effect = mock_mixer.error('bad file')
+            assert animation_utils.play_sound('assets/missing.ogg', priority=2) is None
+        mock_sounds.play.assert_called_once_with('assets/missing.ogg', 2)
@@ -0,0 +1,46 @@
+"""Tests for the mixer presets."""
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import audio
+
+
+class TestPresets:
+    """Tests for choosing and applying mixer presets."""
+
+    @pytest.mark.parametrize('platform', ['linux', 'darwin', 'win32', 'emscripten'])
+    def test_known_platforms_have_presets(self, platform):
+        """Each supported platform gets its own entry."""
+        assert audio.preset_name(platform) == platform
+
+    def test_unknown_platform_uses_default(self):
+        """Anything else falls back to pygame's defaults."""
+        assert audio.preset_name('sunos5') == 'default'
+
+    @pytest.mark.parametrize('name', list(audio.PRESETS))
+    def test_buffers_fit_tolerance(self, name):
+        """One mixer buffer leaves room in the A/V sync tolerance on every platform."""
+        assert audio.buffer_ms(audio.PRESETS[name]) < audio.AV_SYNC_TOLERANCE_MS
+
+    def test_buffer_ms(self):
+        """Buffer duration is frames over sample rate."""
+        assert audio.buffer_ms({'frequency': 48000, 'buffer': 480}) == 10
+
+    def test_pre_init_applies_platform_preset(self):
+        """pre_init passes this platform's settings to the mixer."""
+        with patch('game_screens.audio.pygame') as mock_pg, \
+                patch.object(audio.sys, 'platform', 'linux'):
+            settings = audio.pre_init()
+
+        assert settings is audio.PRESETS['linux']
+        mock_pg.mixer.pre_init.assert_called_once_with(**audio.PRESETS['linux'])
+
+    def test_pre_init_named_preset(self):
+        """An explicit preset overrides the platform's, e.g. for benchmarks."""
+        with patch('game_screens.audio.pygame') as mock_pg:
+            audio.pre_init('emscripten')
+        mock_pg.mixer.pre_init.assert_called_once_with(**audio.PRESETS['emscripten'])
@@ -0,0 +1,111 @@
+"""Comprehensive tests for LayerCompositor."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch, call
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.compositor import LayerCompositor
+
+
+@pytest.fixture
+def mock_screen():
+    screen = Mock()
+    screen.get_size.return_value = (800, 600)
+    return screen
+
+
+@pytest.fixture
+def mock_gradient():
+    """Mock the gradient cache; each copy reports the requested size."""
+    with patch('game_screens.compositor.animation_utils') as mock_utils:
+        def get_gradient(size, top, bottom):
+            gradient = Mock()
+            gradient.copy.side_effect = lambda: Mock(get_size=Mock(return_value=size))
+            return gradient
+
+        mock_utils.get_gradient.side_effect = get_gradient
+        yield mock_utils
+
+
+class TestLayerCompositor:
+    """Test suite for the LayerCompositor class."""
+
+    def test_composes_static_layers_once(self, mock_screen, mock_gradient):
+        """Static layers should be drawn once and reused across frames."""
+        compositor = LayerCompositor(mock_screen, (80, 10, 10), (20, 0, 0))
+        static = Mock()
+        compositor.add_static(static)
+
+        for _ in range(10):
+            compositor.draw()
+
+        static.assert_called_once()
+        assert compositor.builds == 1
+
+    def test_builds_on_gradient_cache(self, mock_screen, mock_gradient):
+        """The static surface should start from a copy of the cached gradient."""
+        compositor = LayerCompositor(mock_screen, (80, 10, 10), (20, 0, 0))
+
+        composed = compositor.composed()
+
+        mock_gradient.get_gradient.assert_called_once_with((800, 600), (80, 10, 10), (20, 0, 0))
+        static_target = composed
+        assert static_target.get_size() == (800, 600)
+
+    def test_static_layers_draw_on_composed_surface(self, mock_screen, mock_gradient):
+        """Static layers should draw onto the cached surface, not the screen."""
+        compositor = LayerCompositor(mock_screen, (0, 0, 0), (0, 0, 0))
+        static = Mock()
+        compositor.add_static(static)
+
+        composed = compositor.composed()
+
+        static.assert_called_once_with(composed)
+
+    def test_animated_layers_draw_every_frame(self, mock_screen, mock_gradient):
+        """Animated layers should be drawn on the screen every frame."""
+        compositor = LayerCompositor(mock_screen, (0, 0, 0), (0, 0, 0))
+        animated = Mock()
+        compositor.add_animated(animated)
+
+        compositor.draw()
+        compositor.draw()
+
+        assert animated.call_args_list == [call(mock_screen), call(mock_screen)]
+
+    def test_draw_blits_composed_then_animates(self, mock_screen, mock_gradient):
+        """Each frame should be one background blit followed by the animated layers."""
+        compositor = LayerCompositor(mock_screen, (0, 0, 0), (0, 0, 0))
+        order = []
+        mock_screen.blit.side_effect = lambda *args: order.append('blit')
+        compositor.add_animated(lambda surface: order.append('animated'))
+
+        compositor.draw()
+
+        assert order == ['blit', 'animated']
+        mock_screen.blit.assert_called_once_with(compositor.composed(), (0, 0))
+
+    def test_invalidate_recomposes(self, mock_screen, mock_gradient):
+        """invalidate() should force the static layers to be redrawn."""
+        compositor = LayerCompositor(mock_screen, (0, 0, 0), (0, 0, 0))
+        static = Mock()
+        compositor.add_static(static)
+        compositor.draw()
+
+        compositor.invalidate()
+        compositor.draw()
+
+        assert static.call_count == 2
+
+    def test_screen_resize_recomposes(self, mock_screen, mock_gradient):
+        """A different screen size should recompose at the new size."""
+        compositor = LayerCompositor(mock_screen, (0, 0, 0), (0, 0, 0))
+        compositor.draw()
+
+        mock_screen.get_size.return_value = (1024, 768)
+        compositor.draw()
+
+        assert compositor.builds == 2
+        assert compositor.composed().get_size() == (1024, 768)
@@ -0,0 +1,153 @@
+"""Tests for CountdownWidget."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import countdown
+from game_screens.countdown import CountdownWidget
+from game_screens.game_timer import GameTimer
+
+
+@pytest.fixture(autouse=True)
+def clear_sheets():
+    """Each test renders its own sprite sheets."""
+    countdown._sheets.clear()
+    yield
+    countdown._sheets.clear()
+
+
+@pytest.fixture
+def mock_pygame():
+    with patch('game_screens.countdown.pygame') as mock_pg:
+        mock_pg.Surface.side_effect = lambda *args: Mock()
+        yield mock_pg
+
+
+@pytest.fixture
+def mock_font():
+    """A font whose renders are distinct surfaces carrying the rendered text."""
+    font = Mock()
+
+    def render(text, antialias, color):
+        surf = Mock()
+        surf.text = text
+        surf.get_width.return_value = 20 * len(text)
+        surf.get_height.return_value = 30
+        surf.get_bytesize.return_value = 4
+        surf.get_rect.side_effect = lambda **kw: kw
+        return surf
+
+    font.render.side_effect = render
+    return font
+
+
+class TestCountdownWidget:
+    """Test suite for the CountdownWidget class."""
+
+    def test_max_time_defaults_to_game_timer_limit(self, mock_pygame, mock_font):
+        """The ring should be full at GameTimer.TIME_LIMIT, not a hardcoded 10 seconds."""
+        widget = CountdownWidget(font=mock_font)
+
+        assert widget.max_time == GameTimer.TIME_LIMIT
+        assert widget.step(GameTimer.TIME_LIMIT) == widget.steps
+
+    def test_sheet_has_one_frame_per_step(self, mock_pygame, mock_font):
+        """The sheet should hold steps + 1 ring frames, each drawn once."""
+        CountdownWidget(font=mock_font, steps=12)
+
+        assert mock_pygame.draw.circle.call_count == 13
+        # Frame 0 is the empty track, with no arc
+        assert mock_pygame.draw.arc.call_count == 12
+
+    def test_sheet_size_fits_grid(self, mock_pygame, mock_font):
+        """The sheet should be SHEET_COLUMNS frames wide and as many rows as needed."""
+        CountdownWidget(font=mock_font, radius=60, steps=36)
+
+        size = mock_pygame.Surface.call_args[0][0]
+        assert size == (8 * 120, 5 * 120)
+
+    def test_sheet_shared_between_widgets(self, mock_pygame, mock_font):
+        """Widgets with the same geometry and colors should share one sheet."""
+        first = CountdownWidget(font=mock_font)
+        second = CountdownWidget(font=mock_font)
+
+        assert first.sheet is second.sheet
+        assert mock_pygame.Surface.call_count == 1
+
+    def test_different_colors_get_own_sheet(self, mock_pygame, mock_font):
+        """A different ring color should render a separate sheet."""
+        first = CountdownWidget(font=mock_font)
+        second = CountdownWidget(font=mock_font, ring_color=(255, 0, 0))
+
+        assert first.sheet is not second.sheet
+
+    def test_digits_prerendered(self, mock_pygame, mock_font):
+        """Every whole second up to max_time should be rendered up front."""
+        widget = CountdownWidget(font=mock_font, max_time=5000)
+
+        assert [digit.text for digit in widget.digits] == ['0', '1', '2', '3', '4', '5']
+
+    def test_step_quantizes_and_clamps(self, mock_pygame, mock_font):
+        """time_left should map to the nearest frame, clamped to the sheet."""
+        widget = CountdownWidget(font=mock_font, steps=10, max_time=1000)
+
+        assert widget.step(0) == 0
+        assert widget.step(480) == 5
+        assert widget.step(1000) == 10
+        assert widget.step(-50) == 0
+        assert widget.step(5000) == 10
+
+    def test_frame_area_walks_grid(self, mock_pygame, mock_font):
+        """Frames should be laid out row by row in the sheet."""
+        widget = CountdownWidget(font=mock_font, radius=10)
+
+        assert widget.frame_area(0) == (0, 0, 20, 20)
+        assert widget.frame_area(3) == (60, 0, 20, 20)
+        assert widget.frame_area(CountdownWidget.SHEET_COLUMNS + 1) == (20, 20, 20, 20)
+
+    def test_draw_is_one_blits_call_of_two_items(self, mock_pygame, mock_font):
+        """A frame should be the ring frame plus the digit in one blits call."""
+        widget = CountdownWidget(font=mock_font, radius=60, steps=10, max_time=5000)
+        screen = Mock()
+        mock_font.render.reset_mock()
+
+        widget.draw(screen, 2500, (400, 300))
+
+        screen.blits.assert_called_once()
+        items = screen.blits.call_args[0][0]
+        assert items[0] == (widget.sheet, (340, 240), widget.frame_area(5))
+        assert items[1][0].text == '2'
+        assert items[1][1] == {'center': (400, 300)}
+        mock_font.render.assert_not_called()
+        mock_pygame.draw.arc.reset_mock()
+        widget.draw(screen, 2000, (400, 300))
+        mock_pygame.draw.arc.assert_not_called()
+
+
+class TestCountdownDiskCache:
+    """Tests for ring sheets restored from the on-disk surface cache."""
+
+    def test_stored_sheet_is_used_directly(self, mock_pygame, mock_font):
+        """A disk hit becomes the sheet as-is, with nothing rendered."""
+        sheet = Mock()
+        with patch('game_screens.countdown.disk_cache') as mock_disk:
+            mock_disk.load.return_value = sheet
+            widget = CountdownWidget(font=mock_font)
+
+        assert widget.sheet is sheet
+        mock_pygame.Surface.assert_not_called()
+        mock_disk.store.assert_not_called()
+
+    def test_rendered_sheet_is_stored(self, mock_pygame, mock_font):
+        """A freshly rendered sheet is written back under its layout and colors."""
+        with patch('game_screens.countdown.disk_cache') as mock_disk:
+            mock_disk.load.return_value = None
+            widget = CountdownWidget(radius=40, font=mock_font)
+
+        name, surface = mock_disk.store.call_args.args
+        assert surface is widget.sheet
+        assert name == ('countdown', CountdownWidget.SHEET_COLUMNS, 40, 10, CountdownWidget.STEPS,
+                        (255, 255, 255), (100, 100, 100))
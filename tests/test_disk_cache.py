@@ -0,0 +1,180 @@
+"""Tests for the persistent on-disk surface cache."""
+import os
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.disk_cache import SurfaceDiskCache, file_digest
+
+
+@pytest.fixture
+def mock_pygame():
+    """Mock pygame so tobytes returns real pixels and frombuffer records what it wraps."""
+    with patch('game_screens.disk_cache.pygame') as mock_pg:
+        mock_pg.image.tobytes.side_effect = lambda surface, fmt: bytes(range(len(fmt) * 2))
+        mock_pg.wrapped = []
+
+        def frombuffer(buffer, size, fmt):
+            mock_pg.wrapped.append((bytes(buffer), size, fmt))
+            return Mock()
+
+        mock_pg.image.frombuffer.side_effect = frombuffer
+        yield mock_pg
+
+
+def make_surface(size=(2, 1)):
+    surface = Mock()
+    surface.get_size.return_value = size
+    return surface
+
+
+class TestSurfaceDiskCache:
+    """Tests for SurfaceDiskCache."""
+
+    def test_round_trip_wraps_stored_pixels(self, tmp_path, mock_pygame):
+        """A stored surface comes back as frombuffer over the same pixels."""
+        cache = SurfaceDiskCache(str(tmp_path))
+        cache.store(('gradient', (2, 1)), make_surface(), alpha=False)
+
+        assert cache.load(('gradient', (2, 1))) is not None
+        assert mock_pygame.wrapped == [(bytes(range(6)), (2, 1), 'RGB')]
+        assert cache.stats() == {'hits': 1, 'misses': 0, 'stale': 0}
+
+    def test_alpha_surfaces_keep_rgba(self, tmp_path, mock_pygame):
+        """alpha=True stores and restores RGBA pixels."""
+        cache = SurfaceDiskCache(str(tmp_path))
+        cache.store(('sheet',), make_surface())
+
+        cache.load(('sheet',))
+        mock_pygame.image.tobytes.assert_called_once()
+        assert mock_pygame.image.tobytes.call_args.args[1] == 'RGBA'
+        assert mock_pygame.wrapped[0][2] == 'RGBA'
+
+    def test_missing_entry_misses(self, tmp_path, mock_pygame):
+        """A name never stored is a miss, not an error."""
+        cache = SurfaceDiskCache(str(tmp_path))
+        assert cache.load(('nothing',)) is None
+        assert cache.misses == 1
+
+    def test_changed_inputs_are_stale(self, tmp_path, mock_pygame):
+        """An entry built from different inputs is rejected."""
+        cache = SurfaceDiskCache(str(tmp_path))
+        cache.store(('sprite', 'up.png'), make_surface(), inputs=('old-digest',))
+
+        assert cache.load(('sprite', 'up.png'), inputs=('new-digest',)) is None
+        assert cache.stale == 1
+        mock_pygame.image.frombuffer.assert_not_called()
+
+    def test_other_version_is_stale(self, tmp_path, mock_pygame):
+        """Files written under another VERSION are ignored."""
+        SurfaceDiskCache(str(tmp_path)).store(('sheet',), make_surface())
+
+        with patch.object(SurfaceDiskCache, 'VERSION', SurfaceDiskCache.VERSION + 1):
+            assert SurfaceDiskCache(str(tmp_path)).load(('sheet',)) is None
+
+    def test_truncated_file_is_stale(self, tmp_path, mock_pygame):
+        """A file shorter than its header promises is rejected."""
+        cache = SurfaceDiskCache(str(tmp_path))
+        cache.store(('sheet',), make_surface())
+        path = cache._path(('sheet',))
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 1)
+
+        assert cache.load(('sheet',)) is None
+        assert cache.stale == 1
+
+    def test_restore_overwrites_stale_entry(self, tmp_path, mock_pygame):
+        """Storing again after a stale load makes the entry valid for the new inputs."""
+        cache = SurfaceDiskCache(str(tmp_path))
+        cache.store(('sprite',), make_surface(), inputs=('a',))
+        cache.store(('sprite',), make_surface(), inputs=('b',))
+
+        assert cache.load(('sprite',), inputs=('b',)) is not None
+        assert os.listdir(tmp_path) == [os.path.basename(cache._path(('sprite',)))]
+
+    def test_disabled_cache_does_nothing(self, tmp_path, mock_pygame):
+        """cache_dir=None never touches disk."""
+        cache = SurfaceDiskCache(None)
+        cache.store(('sheet',), make_surface())
+
+        assert cache.load(('sheet',)) is None
+        assert not cache.enabled
+        mock_pygame.image.tobytes.assert_not_called()
+
+    def test_write_failure_is_a_warning(self, tmp_path, mock_pygame, capsys):
+        """An unwritable cache directory doesn't raise."""
+        blocker = tmp_path / 'file'
+        blocker.write_bytes(b'')
+        cache = SurfaceDiskCache(str(blocker / 'cache'))
+
+        cache.store(('sheet',), make_surface())
+        assert 'failed to write surface cache' in capsys.readouterr().out
+
+
+class TestSurfaceDiskCacheBudget:
+    """Tests for pruning the cache directory to its byte budget."""
+
+    @staticmethod
+    def entry_size(tmp_path):
+        cache = SurfaceDiskCache(str(tmp_path / 'probe'))
+        cache.store(('probe',), make_surface())
+        return os.path.getsize(cache._path(('probe',)))
+
+    def test_store_prunes_oldest_first(self, tmp_path, mock_pygame):
+        """Beyond the budget, the entries used longest ago are deleted."""
+        size = self.entry_size(tmp_path)
+        cache = SurfaceDiskCache(str(tmp_path / 'cache'), budget=2 * size)
+        for age, name in enumerate(['old', 'mid']):
+            cache.store((name,), make_surface())
+            os.utime(cache._path((name,)), ns=(age * 10 ** 9, age * 10 ** 9))
+
+        cache.store(('new',), make_surface())
+
+        assert not os.path.exists(cache._path(('old',)))
+        assert os.path.exists(cache._path(('mid',)))
+        assert os.path.exists(cache._path(('new',)))
+
+    def test_load_refreshes_entry(self, tmp_path, mock_pygame):
+        """A hit counts as a use, so a recently loaded entry outlives newer unused ones."""
+        size = self.entry_size(tmp_path)
+        cache = SurfaceDiskCache(str(tmp_path / 'cache'), budget=2 * size)
+        for age, name in enumerate(['used', 'unused']):
+            cache.store((name,), make_surface())
+            os.utime(cache._path((name,)), ns=(age * 10 ** 9, age * 10 ** 9))
+        cache.load(('used',))
+
+        cache.store(('new',), make_surface())
+
+        assert os.path.exists(cache._path(('used',)))
+        assert not os.path.exists(cache._path(('unused',)))
+
+    def test_entry_just_stored_is_kept(self, tmp_path, mock_pygame):
+        """An entry larger than the whole budget is still kept until the next store."""
+        cache = SurfaceDiskCache(str(tmp_path), budget=0)
+
+        cache.store(('sheet',), make_surface())
+
+        assert os.listdir(tmp_path) == [os.path.basename(cache._path(('sheet',)))]
+
+
+class TestFileDigest:
+    """Tests for file_digest()."""
+
+    def test_digest_follows_content(self, tmp_path):
+        """Different contents give different digests; the same path is hashed once."""
+        path = tmp_path / 'up.png'
+        path.write_bytes(b'one')
+        first = file_digest(str(path))
+        assert file_digest(str(path)) == first
+
+        path.write_bytes(b'other')
+        assert file_digest(str(path)) != first
+
+    def test_missing_file_raises(self, tmp_path):
+        """Callers decide what a missing source means."""
+        with pytest.raises(OSError):
+            file_digest(str(tmp_path / 'missing.png'))
+
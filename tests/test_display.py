@@ -8,25 +8,90 @@ from unittest.mock import Mock, MagicMock, patch, call, AsyncMock
 sys.modules['pygame'] = MagicMock()
 
 from game_screens.display import GameScreen
+from game_screens import sprite_cache
+from game_screens import quality
+
+
+@pytest.fixture(autouse=True)
+def clear_sprite_cache():
+    """Each test starts with an empty process-wide sprite cache."""
+    sprite_cache.shared_cache().invalidate()
+    yield
+    sprite_cache.shared_cache().invalidate()
+
+
+@pytest.fixture(autouse=True)
+def no_tones():
+    """GameScreen tests run silently; TestGameScreenTones sets tones explicitly."""
+    with patch('game_screens.display.tones.button_tones', return_value={}) as button_tones:
+        yield button_tones
+
+
+class FakeRect:
+    """Minimal stand-in for pygame.Rect used by the dirty-rect tests."""
+
+    def __init__(self, x, y, width, height):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+    @classmethod
+    def anchored(cls, width, height, topleft=None, topright=None, center=None):
+        if topright is not None:
+            return cls(topright[0] - width, topright[1], width, height)
+        if center is not None:
+            return cls(center[0] - width // 2, center[1] - height // 2, width, height)
+        x, y = topleft or (0, 0)
+        return cls(x, y, width, height)
+
+    @property
+    def center(self):
+        return (self.x + self.width // 2, self.y + self.height // 2)
+
+    def union(self, other):
+        x, y = min(self.x, other.x), min(self.y, other.y)
+        right = max(self.x + self.width, other.x + other.width)
+        bottom = max(self.y + self.height, other.y + other.height)
+        return FakeRect(x, y, right - x, bottom - y)
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.width, self.height)[index]
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.width, self.height))
+
+    def collidepoint(self, pos):
+        return self.x <= pos[0] < self.x + self.width and self.y <= pos[1] < self.y + self.height
+
+    def __eq__(self, other):
+        return isinstance(other, FakeRect) and \
+            (self.x, self.y, self.width, self.height) == (other.x, other.y, other.width, other.height)
+
+    def __repr__(self):
+        return f"FakeRect({self.x}, {self.y}, {self.width}, {self.height})"
 
 
 @pytest.fixture
 def mock_pygame():
     """Mock pygame modules and functions."""
-    with patch('game_screens.display.pygame') as mock_pg:
+    with patch('game_screens.display.pygame') as mock_pg, \
+            patch('game_screens.sprite_cache.pygame', mock_pg):
         # Mock screen
         mock_screen = Mock()
         mock_screen.get_width.return_value = 800
         mock_screen.get_height.return_value = 600
 
-        # Mock image loading
-        mock_image = Mock()
-        mock_image.convert_alpha.return_value = Mock()
-        mock_pg.image.load.return_value = mock_image
+        # Mock image loading - each file loads as its own surface
+        mock_pg.image.load.side_effect = lambda path: Mock()
+
+        # Mock font - rendered surfaces report a real size for the text cache
+        def create_text_surface(*args):
+            surf = Mock()
+            surf.get_width.return_value = 100
+            surf.get_height.return_value = 20
+            surf.get_bytesize.return_value = 4
+            return surf
 
-        # Mock font
         mock_font = Mock()
-        mock_font.render.return_value = Mock()
+        mock_font.render.side_effect = create_text_surface
         mock_pg.font.SysFont.return_value = mock_font
 
         # Mock key names
@@ -87,6 +152,15 @@ def mock_os_path_dirname():
         yield mock_dirname
 
 
+@pytest.fixture
+def mock_fonts(mock_pygame):
+    """Route the shared font registry to the mocked pygame font."""
+    mock_pg, _ = mock_pygame
+    with patch('game_screens.display.fonts') as mock_registry:
+        mock_registry.get_font.return_value = mock_pg.font.SysFont.return_value
+        yield mock_registry
+
+
 @pytest.fixture
 def mock_animation_utils():
     """Mock animation_utils module."""
@@ -95,7 +169,7 @@ def mock_animation_utils():
 
 
 @pytest.fixture
-def game_screen(mock_pygame, mock_os_path, mock_os_path_dirname, mock_animation_utils):
+def game_screen(mock_pygame, mock_os_path, mock_os_path_dirname, mock_animation_utils, mock_fonts):
     """Create a GameScreen instance with mocked dependencies."""
     mock_pg, mock_screen = mock_pygame
     return GameScreen(mock_screen)
@@ -139,18 +213,109 @@ class TestGameScreenInit:
 
     def test_init_loads_button_sprites(self, game_screen):
         """Should load sprites for all buttons."""
-        assert 'left' in game_screen.sprites
-        assert 'right' in game_screen.sprites
-        assert 'up' in game_screen.sprites
-        assert 'down' in game_screen.sprites
-        assert 'space' in game_screen.sprites
+        assert 'left' in game_screen.scaled
+        assert 'right' in game_screen.scaled
+        assert 'up' in game_screen.scaled
+        assert 'down' in game_screen.scaled
+        assert 'space' in game_screen.scaled
 
     def test_init_loads_three_states_per_button(self, game_screen):
         """Each button should have normal, indicated, and pressed states."""
         for button_name in ['left', 'right', 'up', 'down', 'space']:
-            assert 'normal' in game_screen.sprites[button_name]
-            assert 'indicated' in game_screen.sprites[button_name]
-            assert 'pressed' in game_screen.sprites[button_name]
+            assert 'normal' in game_screen.scaled[button_name]
+            assert 'indicated' in game_screen.scaled[button_name]
+            assert 'pressed' in game_screen.scaled[button_name]
+
+    def test_init_releases_source_sprites(self, game_screen):
+        """Unscaled source surfaces should not be kept once scaled variants exist."""
+        assert not hasattr(game_screen, 'sprites')
+        assert all(size is not None for _, size, _ in sprite_cache.shared_cache()._sprites)
+
+    def test_init_slices_sprites_from_atlas(self, mock_pygame, mock_os_path,
+                                            mock_os_path_dirname, mock_animation_utils):
+        """A built sprite atlas should be used instead of loading individual PNGs."""
+        mock_pg, mock_screen = mock_pygame
+        atlas = Mock()
+        with patch('game_screens.display.sprite_atlas.load_atlas', return_value=atlas):
+            gs = GameScreen(mock_screen)
+
+        mock_pg.image.load.assert_not_called()
+        mock_pg.transform.smoothscale.assert_not_called()
+        atlas.get.assert_any_call('space', 'pressed', (220, 55))
+        assert gs.scaled['up']['normal'] is atlas.get.return_value
+
+    def test_init_falls_back_when_atlas_is_stale(self, mock_pygame, mock_os_path,
+                                                 mock_os_path_dirname, mock_animation_utils):
+        """Sprites missing from the atlas should be loaded from their PNGs."""
+        mock_pg, mock_screen = mock_pygame
+        atlas = Mock()
+        atlas.get.return_value = None
+        with patch('game_screens.display.sprite_atlas.load_atlas', return_value=atlas):
+            GameScreen(mock_screen)
+
+        assert mock_pg.image.load.call_count == 15
+
+    def test_retry_reuses_cached_sprites(self, game_screen, mock_pygame):
+        """A second GameScreen should neither load nor rescale any image."""
+        mock_pg, mock_screen = mock_pygame
+        mock_pg.image.load.reset_mock()
+        mock_pg.transform.smoothscale.reset_mock()
+
+        retry = GameScreen(mock_screen)
+
+        mock_pg.image.load.assert_not_called()
+        mock_pg.transform.smoothscale.assert_not_called()
+        assert retry.scaled['left']['normal'] is game_screen.scaled['left']['normal']
+
+    def test_preload_sprites_yields_progress(self, mock_pygame):
+        """Without a decode pool (pygbag) preload_sprites loads one sprite per slice."""
+        mock_pg, _ = mock_pygame
+
+        with patch('game_screens.display.sprite_cache.decode_executor', return_value=None):
+            progress = list(GameScreen.preload_sprites())
+
+        assert len(progress) == 15
+        assert progress[-1] == 1.0
+        assert progress == sorted(progress)
+        assert mock_pg.image.load.call_count == 15
+
+    def test_preload_sprites_decodes_on_pool(self, mock_pygame):
+        """On desktop the first slice hands every decode to the pool."""
+        mock_pg, _ = mock_pygame
+        executor = Mock()
+        executor.submit.side_effect = lambda fn, *args: Mock()
+
+        with patch('game_screens.display.sprite_cache.decode_executor', return_value=executor):
+            next(GameScreen.preload_sprites())
+
+        assert executor.submit.call_count == 15
+        mock_pg.image.load.assert_not_called()
+
+    def test_preload_sprites_skips_atlas_sprites(self, mock_pygame):
+        """Sprites the atlas provides at the drawn size aren't loaded."""
+        mock_pg, _ = mock_pygame
+        atlas = Mock()
+        atlas.get.side_effect = lambda name, state, size: None if name == 'space' else Mock()
+
+        with patch('game_screens.display.sprite_atlas.load_atlas', return_value=atlas), \
+                patch('game_screens.display.sprite_cache.decode_executor', return_value=None):
+            list(GameScreen.preload_sprites())
+
+        assert mock_pg.image.load.call_count == 3
+
+    def test_preloaded_sprites_skip_loading_in_init(self, mock_pygame, mock_os_path,
+                                                    mock_os_path_dirname, mock_animation_utils):
+        """A GameScreen built after the preload job should find every sprite cached."""
+        mock_pg, mock_screen = mock_pygame
+        for _ in GameScreen.preload_sprites():
+            pass
+        mock_pg.image.load.reset_mock()
+        mock_pg.transform.smoothscale.reset_mock()
+
+        GameScreen(mock_screen)
+
+        mock_pg.image.load.assert_not_called()
+        mock_pg.transform.smoothscale.assert_not_called()
 
     def test_init_creates_button_rects(self, game_screen):
         """Should create rects for all buttons."""
@@ -163,7 +328,14 @@ class TestGameScreenInit:
     def test_init_creates_scaled_sprites(self, game_screen):
         """Should create scaled versions of sprites."""
         assert 'left' in game_screen.scaled
-        assert len(game_screen.scaled['left']) == 3  # normal, indicated, pressed
+        assert len(game_screen.scaled['left']) == 4  # normal, indicated, pressed, dimmed
+
+    def test_init_precomputes_dimmed_variants(self, game_screen, mock_pygame):
+        """Each button should get a dimmed copy with RLE-accelerated alpha."""
+        mock_pg, _ = mock_pygame
+        for name in GameScreen.BUTTON_FILES:
+            dimmed = game_screen.scaled[name]['dimmed']
+            dimmed.set_alpha.assert_called_with(GameScreen.DIM_ALPHA, mock_pg.RLEACCEL)
 
     def test_init_with_pause_overlay_subscribes(self, mock_pygame, mock_os_path,
                                                 mock_os_path_dirname, mock_animation_utils):
@@ -174,6 +346,11 @@ class TestGameScreenInit:
 
         mock_overlay.subscribe.assert_called_once_with(gs._bus)
 
+    def test_init_uses_shared_font_registry(self, game_screen, mock_fonts):
+        """Fonts should come from the shared registry, not be constructed directly."""
+        mock_fonts.get_font.assert_any_call(32)
+        mock_fonts.get_font.assert_any_call(26)
+
     def test_init_calls_reset(self, game_screen):
         """Should initialize game state via _reset."""
         assert game_screen.sequence == []
@@ -455,7 +632,7 @@ class TestGameScreenDraw:
     def test_draw_fills_screen(self, game_screen):
         """_draw should fill screen with dark color."""
         game_screen._draw()
-        game_screen.screen.fill.assert_called_once_with((15, 15, 25))
+        game_screen.screen.fill.assert_called_once_with((15, 15, 25), None)
 
     def test_draw_renders_score(self, game_screen):
         """_draw should render current score."""
@@ -492,12 +669,102 @@ class TestGameScreenDraw:
         calls = [str(call) for call in game_screen.font_small.render.call_args_list]
         assert any('Your turn' in str(call) for call in calls)
 
+    def test_draw_steady_state_does_not_render_text(self, game_screen):
+        """Redrawing an unchanged frame should not call font.render again."""
+        game_screen.state = 'input'
+        game_screen.sequence = ['left', 'right']
+        game_screen._draw()
+        game_screen.font_small.render.reset_mock()
+
+        game_screen._draw()
+        game_screen._draw()
+
+        game_screen.font_small.render.assert_not_called()
+
+    def test_draw_rerenders_changed_text(self, game_screen):
+        """Changing the HUD text should render only the new string."""
+        game_screen._draw()
+        game_screen.font_small.render.reset_mock()
+
+        game_screen.score = 7
+        game_screen._draw()
+
+        game_screen.font_small.render.assert_called_once_with("Score: 7", True, (200, 200, 200))
+
+    def test_draw_steady_state_does_not_copy_surfaces(self, game_screen):
+        """Dimmed buttons should be drawn without allocating surfaces."""
+        for state in ('showing', 'adding', 'gameover', 'input'):
+            game_screen.state = state
+            for variants in game_screen.scaled.values():
+                for surf in variants.values():
+                    surf.copy.reset_mock()
+
+            game_screen._draw()
+            game_screen._draw()
+
+            for variants in game_screen.scaled.values():
+                for surf in variants.values():
+                    surf.copy.assert_not_called()
+
+    def test_draw_blits_dimmed_variant_when_showing(self, game_screen):
+        """Non-active buttons should use the precomputed dimmed variant."""
+        game_screen.state = 'showing'
+        game_screen.flash_button = 'left'
+        game_screen.flash_state = 'indicated'
+
+        game_screen._draw()
+
+        blitted = [item[0] for item in game_screen.screen.blits.call_args.args[0]]
+        assert game_screen.scaled['right']['dimmed'] in blitted
+        assert game_screen.scaled['left']['indicated'] in blitted
+
+    def test_low_quality_skips_dimming(self, game_screen):
+        """With dim_buttons off, inactive buttons should use the normal sprite."""
+        game_screen.state = 'showing'
+        game_screen.flash_button = 'left'
+        game_screen.flash_state = 'indicated'
+        quality.manager().set_tier('low')
+        try:
+            game_screen._draw()
+        finally:
+            quality.manager().set_tier('high')
+
+        blitted = [item[0] for item in game_screen.screen.blits.call_args.args[0]]
+        assert game_screen.scaled['right']['normal'] in blitted
+        assert game_screen.scaled['right']['dimmed'] not in blitted
+
     def test_draw_blits_buttons(self, game_screen):
         """_draw should blit all button sprites."""
         game_screen._draw()
 
         # Should blit at least once per button (5 buttons)
-        assert game_screen.screen.blit.call_count >= 5
+        assert len(game_screen.screen.blits.call_args.args[0]) >= 5
+
+    def test_draw_submits_one_batched_blit(self, game_screen):
+        """The whole scene should go out in a single Surface.blits call."""
+        game_screen._draw()
+
+        game_screen.screen.blits.assert_called_once()
+        assert game_screen.screen.blits.call_args.kwargs == {'doreturn': False}
+        game_screen.screen.blit.assert_not_called()
+
+    def test_draw_reuses_scene_when_state_unchanged(self, game_screen):
+        """The retained scene should only be rebuilt when its state changes."""
+        game_screen._draw()
+        game_screen._draw()
+        game_screen._draw()
+
+        assert game_screen._scene.rebuilds == 1
+
+    def test_draw_rebuilds_scene_on_state_change(self, game_screen):
+        """Lighting a button should rebuild the scene."""
+        game_screen._draw()
+
+        game_screen.flash_button = 'up'
+        game_screen.flash_state = 'indicated'
+        game_screen._draw()
+
+        assert game_screen._scene.rebuilds == 2
 
     def test_draw_timer_bar_in_input_state(self, game_screen, mock_pygame):
         """_draw should render timer bar during input state."""
@@ -511,6 +778,295 @@ class TestGameScreenDraw:
         assert mock_pg.draw.rect.called
 
 
+@pytest.fixture
+def dirty_screen(mock_pygame, mock_os_path, mock_os_path_dirname, mock_animation_utils, mock_fonts):
+    """GameScreen in dirty-rect mode with geometry-aware rects."""
+    mock_pg, mock_screen = mock_pygame
+    mock_pg.Rect = FakeRect
+    mock_screen.get_rect.return_value = FakeRect(0, 0, 800, 600)
+
+    def create_text_surface(text, antialias, color):
+        surf = Mock()
+        surf.get_width.return_value = 10 * len(text)
+        surf.get_height.return_value = 20
+        surf.get_bytesize.return_value = 4
+        surf.get_rect.side_effect = lambda **kw: FakeRect.anchored(10 * len(text), 20, **kw)
+        return surf
+
+    mock_fonts.get_font.return_value.render.side_effect = create_text_surface
+    game_screen = GameScreen(mock_screen, dirty_rects=True)
+    # Button sprites sized to their rects, so scene items can be matched to dirty rects
+    for name, rect in game_screen.button_rects.items():
+        for state in game_screen.scaled[name]:
+            sprite = Mock()
+            sprite.get_width.return_value, sprite.get_height.return_value = rect.width, rect.height
+            game_screen.scaled[name][state] = sprite
+    return game_screen
+
+
+class TestGameScreenDirtyRects:
+    """Tests for dirty-rect rendering mode."""
+
+    def test_dirty_rects_off_by_default(self, game_screen):
+        """Full-frame flips should remain the default."""
+        assert game_screen.dirty_rects is False
+
+    def test_first_frame_is_full(self, dirty_screen):
+        """The first dirty frame should repaint and present the whole screen."""
+        rects = dirty_screen._draw_dirty()
+
+        assert rects == [FakeRect(0, 0, 800, 600)]
+        dirty_screen.screen.fill.assert_called_once_with((15, 15, 25), None)
+
+    def test_unchanged_frame_presents_nothing(self, dirty_screen):
+        """A frame with no visible change should present no rects and draw nothing."""
+        dirty_screen._draw_dirty()
+        dirty_screen.screen.reset_mock()
+
+        assert dirty_screen._draw_dirty() == []
+        dirty_screen.screen.fill.assert_not_called()
+        dirty_screen.screen.blits.assert_not_called()
+
+    def test_button_change_marks_only_that_button(self, dirty_screen):
+        """Lighting a button should dirty just that button's rect."""
+        dirty_screen.state = 'showing'
+        dirty_screen.sequence = ['left']
+        dirty_screen._draw_dirty()
+
+        dirty_screen.flash_button = 'left'
+        dirty_screen.flash_state = 'indicated'
+        rects = dirty_screen._draw_dirty()
+
+        assert rects == [dirty_screen.button_rects['left']]
+
+    def test_dirty_regions_are_clipped(self, dirty_screen):
+        """Each dirty rect should be redrawn with the clip set to it."""
+        dirty_screen._draw_dirty()
+
+        dirty_screen.flash_button = 'up'
+        dirty_screen.flash_state = 'pressed'
+        dirty_screen._draw_dirty()
+
+        dirty_screen.screen.set_clip.assert_any_call(dirty_screen.button_rects['up'])
+        dirty_screen.screen.set_clip.assert_called_with(None)
+
+    def test_dirty_rect_blits_only_overlapping_items(self, dirty_screen):
+        """A dirty rect repaints just its own area and the scene items inside it."""
+        dirty_screen._draw_dirty()
+        dirty_screen.screen.reset_mock()
+
+        dirty_screen.flash_button = 'up'
+        dirty_screen.flash_state = 'pressed'
+        dirty_screen._draw_dirty()
+
+        rect = dirty_screen.button_rects['up']
+        dirty_screen.screen.fill.assert_called_once_with((15, 15, 25), rect)
+        (items,), _ = dirty_screen.screen.blits.call_args
+        assert items == [(dirty_screen.scaled['up']['pressed'], rect)]
+
+    def test_score_change_covers_old_and_new_text(self, dirty_screen):
+        """A HUD text change should dirty the union of the old and new text rects."""
+        dirty_screen._draw_dirty()
+
+        dirty_screen.score = 10
+        rects = dirty_screen._draw_dirty()
+
+        assert rects == [FakeRect(20, 20, 90, 20)]  # "Score: 10" is wider than "Score: 0"
+
+    def test_timer_bar_change_marks_timer_track(self, dirty_screen):
+        """A timer bar width change should dirty only the timer track."""
+        dirty_screen.state = 'input'
+        dirty_screen.sequence = ['left']
+        dirty_screen.game_timer.fraction = 1.0
+        dirty_screen._draw_dirty()
+
+        dirty_screen.game_timer.fraction = 0.5
+        rects = dirty_screen._draw_dirty()
+
+        assert rects == [dirty_screen.timer_rect]
+
+    def test_vanished_status_is_erased(self, dirty_screen):
+        """When the status line disappears its old rect should be repainted."""
+        dirty_screen.state = 'showing'
+        dirty_screen._draw_dirty()
+        status_rect = dirty_screen._regions['status'][1]
+
+        dirty_screen.state = 'adding'
+        rects = dirty_screen._draw_dirty()
+
+        assert status_rect in rects
+
+    def test_report_frame_counts_pixels(self, dirty_screen):
+        """The frame report should sum the area of presented rects and emit it."""
+        reports = []
+        dirty_screen._bus.subscribe('frame_presented', reports.append)
+
+        dirty_screen._report_frame([FakeRect(0, 0, 10, 10), FakeRect(5, 5, 20, 2)])
+
+        assert dirty_screen.last_frame == {'rects': 2, 'pixels': 140}
+        assert reports == [{'rects': 2, 'pixels': 140}]
+
+
+class TestGameScreenSetPaused:
+    """Tests for _set_paused, used by the P key and window auto-pause."""
+
+    def test_pause_emits_game_paused(self, game_screen, mock_pygame):
+        """Pausing should set paused and emit game_paused."""
+        events = []
+        game_screen._bus.subscribe('game_paused', events.append)
+
+        game_screen._set_paused(True)
+
+        assert game_screen.paused is True
+        assert len(events) == 1
+
+    def test_resume_emits_game_resumed(self, game_screen, mock_pygame):
+        """Resuming should clear paused and emit game_resumed."""
+        events = []
+        game_screen._bus.subscribe('game_resumed', events.append)
+        game_screen._set_paused(True)
+
+        game_screen._set_paused(False)
+
+        assert game_screen.paused is False
+        assert len(events) == 1
+
+    @pytest.mark.parametrize('should_pause', [True, False])
+    def test_run_starts_paused_when_window_away(self, game_screen, mock_pygame, should_pause):
+        """A screen built while minimized or unfocused should pause before its first update."""
+        mock_pg, _ = mock_pygame
+        mock_pg.event.get.return_value = [Mock(type=mock_pg.QUIT)]
+        events = []
+        game_screen._bus.subscribe('game_paused', events.append)
+
+        with patch('game_screens.display.window_monitor.monitor') as monitor, \
+                patch('game_screens.display.pacing.shared_pacer'):
+            monitor.return_value.should_pause = should_pause
+            assert asyncio.run(game_screen.run()) == 'quit'
+
+        assert game_screen.paused is should_pause
+        assert len(events) == int(should_pause)
+
+
+class TestGameScreenPacing:
+    """Tests for the idle/deadline hints given to the frame pacer."""
+
+    def test_paused_is_idle_without_deadline(self, game_screen):
+        """A paused game only changes on input."""
+        game_screen.paused = True
+        game_screen.state = 'input'
+
+        assert game_screen._pacing() == (True, None)
+
+    def test_input_is_active(self, game_screen):
+        """The timer bar animates during the player's turn."""
+        game_screen.state = 'input'
+
+        assert game_screen._pacing() == (False, None)
+
+    def test_adding_waits_for_next_round(self, game_screen):
+        """Between rounds the scene is static until _next_time."""
+        game_screen.state = 'adding'
+        game_screen._next_time = 5000
+
+        assert game_screen._pacing() == (True, 5000)
+
+    def test_showing_gap_waits_for_next_flash(self, game_screen):
+        """Between flashes the pacer should wake at _next_time."""
+        game_screen.state = 'showing'
+        game_screen.sequence = ['left', 'up']
+        game_screen._show_index = 0
+        game_screen._showing_lit = False
+        game_screen._next_time = 1300
+
+        assert game_screen._pacing() == (True, 1300)
+
+    def test_showing_lit_waits_for_flash_end(self, game_screen):
+        """While a button is lit the pacer should wake at flash_end."""
+        game_screen.state = 'showing'
+        game_screen.sequence = ['left', 'up']
+        game_screen._show_index = 1
+        game_screen._showing_lit = True
+        game_screen.flash_end = 1900
+
+        assert game_screen._pacing() == (True, 1900)
+
+    def test_showing_finished_is_active(self, game_screen):
+        """Once playback ends the next frame switches to input, so don't sleep."""
+        game_screen.state = 'showing'
+        game_screen.sequence = ['left']
+        game_screen._show_index = 1
+
+        assert game_screen._pacing() == (False, None)
+
+    def test_gameover_waits_for_flash_end(self, game_screen):
+        """The wrong-input flash is static until it expires."""
+        game_screen.state = 'gameover'
+        game_screen.flash_end = 2400
+
+        assert game_screen._pacing() == (True, 2400)
+
+
+class TestGameScreenTones:
+    """Tests for the button tones played with each flash."""
+
+    @pytest.fixture
+    def mock_sounds(self):
+        with patch('game_screens.display.sounds') as mock_snd:
+            yield mock_snd
+
+    def test_no_tones_without_synth(self, game_screen, no_tones, mock_sounds):
+        """Without NumPy or a mixer the tone table is empty and nothing plays."""
+        game_screen.sequence = ['left']
+        game_screen._handle_input('left', 1000)
+
+        no_tones.assert_called_once_with(GameScreen.BUTTON_TONES, GameScreen.TONE_MS)
+        mock_sounds.play_sound.assert_not_called()
+
+    def test_every_button_has_a_tone(self):
+        """Each bindable button has its own frequency."""
+        assert set(GameScreen.BUTTON_TONES) == set(GameScreen.BUTTON_KEYS)
+        assert len(set(GameScreen.BUTTON_TONES.values())) == len(GameScreen.BUTTON_TONES)
+
+    def test_press_plays_tone(self, game_screen, mock_sounds):
+        """Pressing a button plays its tone at button priority."""
+        game_screen.tones = {'left': 'left-tone'}
+        game_screen.sequence = ['left']
+
+        game_screen._handle_input('left', 1000)
+        game_screen._flush_tones()
+
+        mock_sounds.play_sound.assert_called_once_with('left-tone', GameScreen.TONE_PRIORITY)
+
+    def test_playback_flash_plays_tone(self, game_screen, mock_sounds):
+        """Each button lit during playback plays its tone as it lights."""
+        game_screen.tones = {'up': 'up-tone'}
+        game_screen.state = 'showing'
+        game_screen.sequence = ['up']
+        game_screen._show_index = 0
+        game_screen._showing_lit = False
+        game_screen._next_time = 1000
+
+        game_screen._update(999)
+        game_screen._flush_tones()
+        mock_sounds.play_sound.assert_not_called()
+        game_screen._update(1000)
+        game_screen._flush_tones()
+        mock_sounds.play_sound.assert_called_once_with('up-tone', GameScreen.TONE_PRIORITY)
+
+    def test_tone_waits_for_present(self, game_screen, mock_sounds):
+        """A queued tone plays only when the frame is flushed, and only once."""
+        game_screen.tones = {'left': 'left-tone'}
+        game_screen.sequence = ['left', 'right']
+
+        game_screen._handle_input('left', 1000)
+        mock_sounds.play_sound.assert_not_called()
+
+        game_screen._flush_tones()
+        game_screen._flush_tones()
+        assert mock_sounds.play_sound.call_count == 1
+
+
 class TestGameScreenIntegration:
     """Integration tests for GameScreen."""
 
@@ -0,0 +1,121 @@
+"""Comprehensive tests for DisplayList."""
+from unittest.mock import Mock
+from game_screens.display_list import DisplayList
+
+
+class TestDisplayList:
+    """Test suite for the DisplayList class."""
+
+    def test_init_creates_empty_list(self):
+        """DisplayList should start empty and unbuilt."""
+        scene = DisplayList()
+
+        assert len(scene) == 0
+        assert scene.rebuilds == 0
+
+    def test_add_without_area(self):
+        """add() without an area should store a (source, dest) pair."""
+        scene = DisplayList()
+        surf = Mock()
+
+        scene.add(surf, (10, 20))
+
+        assert list(scene) == [(surf, (10, 20))]
+
+    def test_add_with_area(self):
+        """add() with an area should store a (source, dest, area) triple."""
+        scene = DisplayList()
+        surf = Mock()
+
+        scene.add(surf, (10, 20), (0, 0, 5, 5))
+
+        assert list(scene) == [(surf, (10, 20), (0, 0, 5, 5))]
+
+    def test_submit_uses_single_blits_call(self):
+        """submit() should hand every item to target.blits at once."""
+        scene = DisplayList()
+        scene.add(Mock(), (0, 0))
+        scene.add(Mock(), (5, 5))
+        target = Mock()
+
+        scene.submit(target)
+
+        target.blits.assert_called_once_with(list(scene), doreturn=False)
+        target.blit.assert_not_called()
+
+    def test_submit_area_blits_only_overlapping_items(self):
+        """With an area, items entirely outside it are skipped."""
+        def sprite(width, height):
+            surf = Mock()
+            surf.get_width.return_value, surf.get_height.return_value = width, height
+            return surf
+
+        scene = DisplayList()
+        inside, edge, outside = sprite(10, 10), sprite(10, 10), sprite(10, 10)
+        scene.add(inside, (25, 25))
+        scene.add(edge, (15, 15))
+        scene.add(outside, (40, 40))
+        scene.add(Mock(), (0, 0), (0, 0, 5, 5))
+        target = Mock()
+
+        scene.submit(target, (20, 20, 20, 20))
+
+        target.blits.assert_called_once_with([(inside, (25, 25)), (edge, (15, 15))], doreturn=False)
+
+    def test_submit_empty_list_does_nothing(self):
+        """An empty list should not call blits at all."""
+        target = Mock()
+
+        DisplayList().submit(target)
+
+        target.blits.assert_not_called()
+
+    def test_rebuild_runs_build_on_first_call(self):
+        """The first rebuild() should always build."""
+        scene = DisplayList()
+        build = Mock(side_effect=lambda s: s.add(Mock(), (0, 0)))
+
+        assert scene.rebuild('a', build) is True
+        build.assert_called_once_with(scene)
+        assert len(scene) == 1
+
+    def test_rebuild_skips_same_key(self):
+        """An unchanged key should keep the retained items."""
+        scene = DisplayList()
+        build = Mock(side_effect=lambda s: s.add(Mock(), (0, 0)))
+        scene.rebuild('a', build)
+
+        assert scene.rebuild('a', build) is False
+        assert build.call_count == 1
+        assert scene.rebuilds == 1
+
+    def test_rebuild_skips_same_key_even_when_empty(self):
+        """A build that produced nothing should still be retained."""
+        scene = DisplayList()
+        build = Mock()
+        scene.rebuild(None, build)
+
+        scene.rebuild(None, build)
+
+        assert build.call_count == 1
+
+    def test_rebuild_replaces_items_on_new_key(self):
+        """A new key should discard the old items before building."""
+        scene = DisplayList()
+        scene.rebuild('a', lambda s: s.add('old', (0, 0)))
+
+        scene.rebuild('b', lambda s: s.add('new', (0, 0)))
+
+        assert list(scene) == [('new', (0, 0))]
+        assert scene.rebuilds == 2
+
+    def test_clear_forces_rebuild(self):
+        """clear() should empty the list and force the next rebuild."""
+        scene = DisplayList()
+        build = Mock()
+        scene.rebuild('a', build)
+
+        scene.clear()
+        scene.rebuild('a', build)
+
+        assert build.call_count == 2
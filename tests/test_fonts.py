@@ -0,0 +1,188 @@
+"""Comprehensive tests for FontRegistry."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.fonts import FontIndex, FontRegistry
+
+
+@pytest.fixture
+def mock_pygame():
+    """Mock pygame so every constructed font is a distinct Mock."""
+    with patch('game_screens.fonts.pygame') as mock_pg:
+        mock_pg.font.Font.side_effect = lambda *args: Mock()
+        mock_pg.font.SysFont.side_effect = lambda *args: Mock()
+        yield mock_pg
+
+
+class TestFontRegistry:
+    """Test suite for the FontRegistry class."""
+
+    def test_init_creates_empty_registry(self, mock_pygame):
+        """FontRegistry should start empty with zeroed stats."""
+        registry = FontRegistry()
+
+        assert registry.stats() == {'fonts': 0, 'hits': 0, 'misses': 0}
+
+    def test_get_default_font_uses_font_constructor(self, mock_pygame):
+        """name=None should use pygame.font.Font(None, size) and skip SysFont."""
+        registry = FontRegistry()
+
+        registry.get(32)
+
+        mock_pygame.font.Font.assert_called_once_with(None, 32)
+        mock_pygame.font.SysFont.assert_not_called()
+
+    def test_get_named_font_uses_sysfont_in_system_mode(self, mock_pygame):
+        """In system mode a font name should go through SysFont with the style flags."""
+        registry = FontRegistry(mode='system')
+
+        registry.get(24, 'arial', bold=True)
+
+        mock_pygame.font.SysFont.assert_called_once_with('arial', 24, True, False)
+
+    def test_get_applies_style_to_default_font(self, mock_pygame):
+        """Bold/italic should be applied to the default font."""
+        registry = FontRegistry()
+
+        font = registry.get(32, bold=True, italic=True)
+
+        font.set_bold.assert_called_once_with(True)
+        font.set_italic.assert_called_once_with(True)
+
+    def test_get_reuses_font(self, mock_pygame):
+        """Repeated lookups should return the same Font and count hits."""
+        registry = FontRegistry()
+
+        first = registry.get(32)
+        second = registry.get(32)
+
+        assert first is second
+        assert mock_pygame.font.Font.call_count == 1
+        assert registry.hits == 1
+        assert registry.misses == 1
+
+    def test_size_and_style_are_part_of_key(self, mock_pygame):
+        """Different sizes or styles should produce different fonts."""
+        registry = FontRegistry()
+
+        fonts = {id(registry.get(32)), id(registry.get(36)), id(registry.get(32, bold=True))}
+
+        assert len(fonts) == 3
+        assert registry.misses == 3
+
+    def test_no_misses_after_warm_up(self, mock_pygame):
+        """Once warmed up, a frame's worth of lookups should all be hits."""
+        registry = FontRegistry()
+        for size in (32, 26, 56, 36):
+            registry.get(size)
+        misses = registry.misses
+
+        for _ in range(60):
+            for size in (32, 26, 56, 36):
+                registry.get(size)
+
+        assert registry.misses == misses
+
+    def test_clear_forgets_fonts(self, mock_pygame):
+        """clear() should force fonts to be created again."""
+        registry = FontRegistry()
+        registry.get(32)
+
+        registry.clear()
+        registry.get(32)
+
+        assert mock_pygame.font.Font.call_count == 2
+
+    def test_invalid_mode_raises(self, mock_pygame):
+        """Unknown modes should be rejected."""
+        with pytest.raises(ValueError):
+            FontRegistry(mode='fontconfig')
+
+    def test_system_mode_uses_sysfont_for_default(self, mock_pygame):
+        """System mode should reproduce the original SysFont(None, size) path."""
+        registry = FontRegistry(mode='system')
+
+        registry.get(32)
+
+        mock_pygame.font.SysFont.assert_called_once_with(None, 32, False, False)
+
+    def test_bundled_mode_loads_indexed_file(self, mock_pygame, tmp_path):
+        """Bundled mode should load a named font from the bundled directory."""
+        (tmp_path / 'PressStart2P-Regular.ttf').write_bytes(b'')
+        registry = FontRegistry(index=FontIndex(str(tmp_path)))
+
+        registry.get(24, 'Press Start 2P')
+
+        mock_pygame.font.Font.assert_called_once_with(str(tmp_path / 'PressStart2P-Regular.ttf'), 24)
+        mock_pygame.font.SysFont.assert_not_called()
+
+    def test_bundled_mode_missing_font_falls_back_to_default(self, mock_pygame, tmp_path):
+        """A name that isn't bundled should use the default font, never SysFont."""
+        registry = FontRegistry(index=FontIndex(str(tmp_path)))
+
+        registry.get(24, 'Comic Sans')
+
+        mock_pygame.font.Font.assert_called_once_with(None, 24)
+        mock_pygame.font.SysFont.assert_not_called()
+
+    def test_set_mode_clears_fonts(self, mock_pygame):
+        """Switching mode should drop cached fonts."""
+        registry = FontRegistry()
+        registry.get(32)
+
+        registry.set_mode('system')
+        registry.get(32)
+
+        mock_pygame.font.SysFont.assert_called_once()
+
+
+class TestFontIndex:
+    """Test suite for the FontIndex class."""
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """A missing font directory should produce an empty index."""
+        index = FontIndex(str(tmp_path / 'nope'))
+
+        assert index.find('Arial') == (None, False)
+        assert index.families() == []
+
+    def test_indexes_styles_from_filenames(self, tmp_path):
+        """Family-Style filenames should map to their style flags."""
+        for name in ('Lato-Regular.ttf', 'Lato-Bold.ttf', 'Lato-BoldItalic.otf', 'notes.txt'):
+            (tmp_path / name).write_bytes(b'')
+        index = FontIndex(str(tmp_path))
+
+        assert index.find('lato') == (str(tmp_path / 'Lato-Regular.ttf'), True)
+        assert index.find('LATO', bold=True) == (str(tmp_path / 'Lato-Bold.ttf'), True)
+        assert index.find('Lato', bold=True, italic=True) == (str(tmp_path / 'Lato-BoldItalic.otf'), True)
+        assert index.families() == ['lato']
+
+    def test_missing_style_falls_back_to_regular(self, tmp_path):
+        """A missing style should return the regular face with exact=False."""
+        (tmp_path / 'Lato-Regular.ttf').write_bytes(b'')
+        index = FontIndex(str(tmp_path))
+
+        assert index.find('Lato', italic=True) == (str(tmp_path / 'Lato-Regular.ttf'), False)
+
+    def test_bare_filename_is_regular(self, tmp_path):
+        """A filename without a style suffix should count as the regular face."""
+        (tmp_path / 'Press-Start.ttf').write_bytes(b'')
+        index = FontIndex(str(tmp_path))
+
+        assert index.find('Press Start') == (str(tmp_path / 'Press-Start.ttf'), True)
+
+    def test_directory_scanned_once(self, tmp_path):
+        """The directory should only be listed once until invalidated."""
+        index = FontIndex(str(tmp_path))
+        with patch('game_screens.fonts.os.listdir', return_value=[]) as listdir:
+            index.find('a')
+            index.find('b')
+            assert listdir.call_count == 1
+
+            index.invalidate()
+            index.find('c')
+            assert listdir.call_count == 2
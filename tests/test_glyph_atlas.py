@@ -0,0 +1,168 @@
+"""Comprehensive tests for GlyphAtlas."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.glyph_atlas import GlyphAtlas
+
+
+@pytest.fixture
+def mock_pygame():
+    """Mock pygame so atlas pages are plain Mocks."""
+    with patch('game_screens.glyph_atlas.pygame') as mock_pg:
+        mock_pg.Surface.side_effect = lambda *args: Mock()
+        yield mock_pg
+
+
+def make_font(width=10, height=20):
+    """Create a mock font whose glyphs are all width x height."""
+    font = Mock()
+
+    def render(char, antialias, color):
+        surf = Mock()
+        surf.get_width.return_value = width
+        surf.get_height.return_value = height
+        return surf
+
+    font.render.side_effect = render
+    font.size.side_effect = lambda char: (width, height)
+    return font
+
+
+class TestGlyphAtlas:
+    """Test suite for the GlyphAtlas class."""
+
+    def test_init_creates_empty_atlas(self, mock_pygame):
+        """GlyphAtlas should start with no pages and zeroed stats."""
+        atlas = GlyphAtlas()
+
+        assert atlas.pages == []
+        assert atlas.hits == 0
+        assert atlas.misses == 0
+
+    def test_glyph_rasterizes_once(self, mock_pygame):
+        """The same (font, color, char) should only be rendered once."""
+        atlas = GlyphAtlas()
+        font = make_font()
+
+        first = atlas.glyph(font, 'A', (255, 255, 255))
+        second = atlas.glyph(font, 'A', (255, 255, 255))
+
+        assert first is second
+        assert font.render.call_count == 1
+        assert atlas.misses == 1
+        assert atlas.hits == 1
+
+    def test_glyph_returns_advance_from_font_size(self, mock_pygame):
+        """The stored advance should come from font.size."""
+        atlas = GlyphAtlas()
+        font = make_font(width=14)
+
+        _, area, advance = atlas.glyph(font, 'W', (255, 255, 255))
+
+        assert advance == 14
+        assert area[2:] == (14, 20)
+
+    def test_color_is_part_of_key(self, mock_pygame):
+        """Different colors should produce separate glyphs."""
+        atlas = GlyphAtlas()
+        font = make_font()
+
+        atlas.glyph(font, 'A', (255, 255, 255))
+        atlas.glyph(font, 'A', (255, 0, 0))
+
+        assert font.render.call_count == 2
+
+    def test_color_lists_and_tuples_share_entries(self, mock_pygame):
+        """A list color should hit the same entry as the equivalent tuple."""
+        atlas = GlyphAtlas()
+        font = make_font()
+
+        atlas.glyph(font, 'A', [255, 255, 255])
+        atlas.glyph(font, 'A', (255, 255, 255))
+
+        assert font.render.call_count == 1
+
+    def test_font_is_part_of_key(self, mock_pygame):
+        """Different fonts (and therefore sizes) should produce separate glyphs."""
+        atlas = GlyphAtlas()
+        small, large = make_font(), make_font(width=30, height=60)
+
+        atlas.glyph(small, 'A', (255, 255, 255))
+        atlas.glyph(large, 'A', (255, 255, 255))
+
+        assert small.render.call_count == 1
+        assert large.render.call_count == 1
+
+    def test_glyphs_share_one_page(self, mock_pygame):
+        """Small glyphs should be packed into the same page."""
+        atlas = GlyphAtlas()
+        font = make_font()
+
+        for char in "GAME OVER":
+            atlas.glyph(font, char, (255, 50, 50))
+
+        assert len(atlas.pages) == 1
+
+    def test_glyphs_do_not_overlap(self, mock_pygame):
+        """Packed glyph areas should never overlap."""
+        atlas = GlyphAtlas(page_size=(64, 64))
+        font = make_font(width=10, height=20)
+
+        areas = [atlas.glyph(font, char, (255, 255, 255))[1] for char in "ABCDEFGHIJ"]
+
+        for i, (x1, y1, w1, h1) in enumerate(areas):
+            for x2, y2, w2, h2 in areas[i + 1:]:
+                assert x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1
+
+    def test_full_page_opens_new_page(self, mock_pygame):
+        """A glyph that does not fit should start a new page."""
+        atlas = GlyphAtlas(page_size=(32, 20))
+        font = make_font(width=10, height=20)
+
+        pages = {id(atlas.glyph(font, char, (255, 255, 255))[0]) for char in "ABCD"}
+
+        assert len(pages) == 2
+        assert len(atlas.pages) == 2
+
+    def test_oversized_glyph_gets_own_page(self, mock_pygame):
+        """A glyph larger than a page should get a dedicated page."""
+        atlas = GlyphAtlas(page_size=(32, 32))
+        font = make_font(width=50, height=60)
+
+        page, area, _ = atlas.glyph(font, 'M', (255, 255, 255))
+
+        mock_pygame.Surface.assert_called_with((50, 60), mock_pygame.SRCALPHA)
+        assert area == (0, 0, 50, 60)
+
+    def test_glyph_blitted_into_page(self, mock_pygame):
+        """Rasterized glyphs should be copied into the page with BLEND_RGBA_MAX."""
+        atlas = GlyphAtlas()
+        font = make_font()
+
+        page, area, _ = atlas.glyph(font, 'A', (255, 255, 255))
+
+        page.blit.assert_called_once()
+        assert page.blit.call_args.kwargs['special_flags'] == mock_pygame.BLEND_RGBA_MAX
+
+    def test_text_width_sums_advances(self, mock_pygame):
+        """text_width should sum the per-character advances."""
+        atlas = GlyphAtlas()
+        font = make_font(width=12)
+
+        assert atlas.text_width(font, "TYP0!", (255, 255, 255)) == 60
+
+    def test_clear_drops_glyphs(self, mock_pygame):
+        """clear() should force glyphs to be rasterized again."""
+        atlas = GlyphAtlas()
+        font = make_font()
+        atlas.glyph(font, 'A', (255, 255, 255))
+
+        atlas.clear()
+        atlas.glyph(font, 'A', (255, 255, 255))
+
+        assert atlas.pages and len(atlas.pages) == 1
+        assert font.render.call_count == 2
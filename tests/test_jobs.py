@@ -0,0 +1,189 @@
+"""Tests for the cooperative JobScheduler."""
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import jobs
+from game_screens.jobs import Job, JobScheduler
+
+
+class FakeClock:
+    """Manual perf_counter stand-in; slices advance it by their cost."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def spend(self, ms):
+        self.now += ms / 1000
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def costly_job(clock, costs_ms, log=None):
+    """A job whose slices take the given times; yields progress after each."""
+    for done, cost in enumerate(costs_ms, start=1):
+        clock.spend(cost)
+        if log is not None:
+            log.append(cost)
+        yield done / len(costs_ms)
+    return 'finished'
+
+
+class TestJob:
+    """Tests for the Job wrapper."""
+
+    def test_progress_follows_yields(self, clock):
+        """Yielded values should become the job's progress."""
+        job = Job(costly_job(clock, [1, 1, 1, 1]))
+
+        job.step()
+        job.step()
+
+        assert job.progress == 0.5
+        assert job.done is False
+
+    def test_result_and_done(self, clock):
+        """Exhausting the generator should finish the job with its return value."""
+        job = Job(costly_job(clock, [1]))
+
+        job.step()
+        job.step()
+
+        assert job.done is True
+        assert job.progress == 1.0
+        assert job.result == 'finished'
+
+    def test_none_keeps_progress(self):
+        """Yielding None should leave progress unchanged."""
+        def steps():
+            yield 0.3
+            yield None
+        job = Job(steps())
+
+        job.step()
+        job.step()
+
+        assert job.progress == 0.3
+
+    def test_error_ends_job(self, capsys):
+        """A slice that raises finishes the job with the exception kept in error."""
+        def broken():
+            yield 0.5
+            raise ValueError('bad asset')
+
+        job = Job(broken(), 'assets')
+        job.step()
+        job.step()
+
+        assert job.done is True
+        assert isinstance(job.error, ValueError)
+        assert job.result is None
+        assert 'assets' in capsys.readouterr().out
+
+
+class TestJobScheduler:
+    """Test suite for the JobScheduler class."""
+
+    def test_runs_slices_within_budget(self, clock):
+        """Slices should stop once the budget is spent."""
+        scheduler = JobScheduler(budget_ms=4, clock=clock)
+        log = []
+        scheduler.submit(costly_job(clock, [1] * 10, log))
+
+        slices = scheduler.run_slices()
+
+        assert slices == 4
+        assert log == [1, 1, 1, 1]
+
+    def test_no_frame_exceeds_budget_plus_one_slice(self, clock):
+        """Over many frames, time spent per frame stays under budget plus the longest slice."""
+        scheduler = JobScheduler(budget_ms=4, clock=clock)
+        costs = [0.5, 3, 1.5, 2.5, 0.2, 3.9, 1, 1, 2, 0.7] * 5
+        scheduler.submit(costly_job(clock, costs[:25]))
+        scheduler.submit(costly_job(clock, costs[25:]))
+
+        frames = []
+        while scheduler.pending:
+            start = clock.now
+            scheduler.run_slices()
+            frames.append((clock.now - start) * 1000)
+
+        assert len(frames) > 1
+        assert max(frames) < 4 + max(costs)
+
+    def test_finishes_jobs_in_order(self, clock):
+        """Jobs should run oldest first."""
+        scheduler = JobScheduler(clock=clock)
+        order = []
+
+        def job(name):
+            order.append(name)
+            yield 1.0
+
+        scheduler.submit(job('first'))
+        scheduler.submit(job('second'))
+        scheduler.run_all()
+
+        assert order == ['first', 'second']
+        assert scheduler.pending is False
+
+    def test_zero_budget_runs_nothing(self, clock):
+        """A frame with no budget should leave the queue alone."""
+        scheduler = JobScheduler(clock=clock)
+        scheduler.submit(costly_job(clock, [1]))
+
+        assert scheduler.run_slices(budget_ms=0) == 0
+
+    def test_progress_averages_batch(self, clock):
+        """progress should average every job submitted since the queue was empty."""
+        scheduler = JobScheduler(budget_ms=1000, clock=clock)
+        first = scheduler.submit(costly_job(clock, [1]))
+        scheduler.submit(costly_job(clock, [1, 1, 1, 1]))
+
+        first.step()
+        first.step()
+
+        assert scheduler.progress == pytest.approx(0.5)
+
+    def test_progress_complete_when_idle(self, clock):
+        """With nothing submitted the bar should read full."""
+        assert JobScheduler(clock=clock).progress == 1.0
+
+    def test_new_batch_after_drain(self, clock):
+        """Jobs submitted after the queue drains should start a fresh progress batch."""
+        scheduler = JobScheduler(clock=clock)
+        scheduler.submit(costly_job(clock, [1]))
+        scheduler.run_all()
+
+        scheduler.submit(costly_job(clock, [1, 1]))
+
+        assert scheduler.progress == 0.0
+
+    def test_failed_job_is_dropped(self, clock, capsys):
+        """A job that raises is popped and the jobs behind it still run."""
+        def broken():
+            raise RuntimeError('boom')
+            yield
+
+        scheduler = JobScheduler(budget_ms=100, clock=clock)
+        failed = scheduler.submit(broken())
+        after = scheduler.submit(costly_job(clock, [1, 1]))
+
+        scheduler.run_slices()
+
+        assert isinstance(failed.error, RuntimeError)
+        assert after.done and after.result == 'finished'
+        assert not scheduler.pending
+
+    def test_shared_scheduler_is_singleton(self):
+        """The pacer and the screens should share one scheduler."""
+        assert jobs.shared_scheduler() is jobs.shared_scheduler()
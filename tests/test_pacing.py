@@ -0,0 +1,247 @@
+"""Tests for FramePacer."""
+import sys
+import asyncio
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import pacing
+from game_screens.pacing import FramePacer
+
+
+class FakeTime:
+    """perf_counter() and asyncio.sleep() driven by a manual clock, in seconds."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time():
+    fake = FakeTime()
+    with patch('game_screens.pacing.time.perf_counter', fake.perf_counter), \
+         patch('game_screens.pacing.asyncio.sleep', fake.sleep), \
+         patch('game_screens.pacing.render_target.take_present_time', return_value=0.0) as present_time:
+        fake.present_time = present_time
+        yield fake
+
+
+@pytest.fixture
+def mock_pygame(fake_time):
+    with patch('game_screens.pacing.pygame') as mock_pg:
+        mock_pg.event.peek.return_value = False
+        mock_pg.time.get_ticks.side_effect = lambda: int(fake_time.now * 1000)
+        yield mock_pg
+
+
+@pytest.fixture
+def mock_jobs():
+    with patch('game_screens.pacing.jobs') as mock_j:
+        mock_j.shared_scheduler.return_value.pending = False
+        yield mock_j
+
+
+@pytest.fixture
+def mock_quality():
+    with patch('game_screens.pacing.quality') as mock_q:
+        yield mock_q
+
+
+def tick(pacer, *args):
+    asyncio.run(pacer.tick(*args))
+
+
+def work(fake_time, ms):
+    """Simulate rendering a frame."""
+    fake_time.now += ms / 1000
+
+
+class TestFramePacerActive:
+    """Tests for active frames."""
+
+    def test_sleeps_remaining_frame_time(self, fake_time, mock_pygame, mock_quality):
+        """After a 5ms frame the pacer should await the rest of the 60 fps slot."""
+        pacer = FramePacer()
+        tick(pacer)
+        fake_time.sleeps.clear()
+
+        work(fake_time, 5)
+        tick(pacer)
+
+        assert fake_time.sleeps == [pytest.approx(1 / 60 - 0.005)]
+
+    def test_keeps_fixed_cadence(self, fake_time, mock_pygame, mock_quality):
+        """Frames should land on a fixed grid regardless of their build time."""
+        pacer = FramePacer()
+        tick(pacer)
+        start = fake_time.now
+
+        for ms in (2, 9, 14, 1):
+            work(fake_time, ms)
+            tick(pacer)
+
+        assert fake_time.now == pytest.approx(start + 4 / 60)
+
+    def test_reports_build_time_to_quality(self, fake_time, mock_pygame, mock_quality):
+        """Each active frame's build time, excluding the sleep, goes to the quality manager."""
+        pacer = FramePacer()
+        tick(pacer)
+
+        work(fake_time, 7)
+        tick(pacer)
+
+        mock_quality.record.assert_called_once()
+        assert mock_quality.record.call_args.args[0] == pytest.approx(7)
+
+    def test_present_time_excluded_from_build_time(self, fake_time, mock_pygame, mock_quality):
+        """Time blocked in present() (e.g. waiting for vblank) isn't counted as rendering."""
+        pacer = FramePacer()
+        tick(pacer)
+
+        work(fake_time, 7)
+        fake_time.present_time.return_value = 0.005
+        tick(pacer)
+
+        assert mock_quality.record.call_args.args[0] == pytest.approx(2)
+
+    def test_on_time_frames_have_no_jitter(self, fake_time, mock_pygame, mock_quality):
+        """With exact sleeps the recorded jitter should be zero."""
+        pacer = FramePacer()
+        for _ in range(5):
+            tick(pacer)
+            work(fake_time, 3)
+
+        assert pacer.stats()['jitter_max_ms'] == 0.0
+
+    def test_late_wakeup_recorded_as_jitter(self, fake_time, mock_pygame, mock_quality):
+        """A wake-up after the deadline should be recorded as jitter."""
+        pacer = FramePacer()
+        tick(pacer)
+
+        # Slow frame: 4ms past the slot, less than a whole frame
+        work(fake_time, 1000 / 60 + 4)
+        tick(pacer)
+
+        assert pacer.stats()['jitter_max_ms'] == pytest.approx(4)
+        assert pacer.missed_frames == 0
+
+    def test_overrun_counts_missed_and_resyncs(self, fake_time, mock_pygame, mock_quality):
+        """A frame more than a slot late should not trigger a catch-up burst."""
+        pacer = FramePacer()
+        tick(pacer)
+
+        work(fake_time, 100)
+        tick(pacer)
+
+        assert pacer.missed_frames == 1
+        assert fake_time.sleeps[-1] == pytest.approx(1 / 60)
+
+    def test_reset_restarts_cadence(self, fake_time, mock_pygame, mock_quality):
+        """After reset a long gap (e.g. building a screen) is neither missed nor reported."""
+        pacer = FramePacer()
+        tick(pacer)
+
+        work(fake_time, 500)
+        pacer.reset()
+        tick(pacer)
+
+        assert pacer.missed_frames == 0
+        mock_quality.record.assert_not_called()
+
+
+class TestFramePacerIdle:
+    """Tests for idle frames."""
+
+    def test_idle_sleeps_in_frame_slices(self, fake_time, mock_pygame, mock_quality):
+        """Idle frames should sleep up to the idle timeout, one frame period at a time."""
+        pacer = FramePacer()
+
+        tick(pacer, True)
+
+        assert sum(fake_time.sleeps) == pytest.approx(FramePacer.IDLE_TIMEOUT_MS / 1000)
+        assert max(fake_time.sleeps) <= 1 / 60 + 1e-9
+        assert pacer.idle_frames == 1
+
+    def test_idle_wakes_on_input(self, fake_time, mock_pygame, mock_quality):
+        """Pending events should end the idle wait immediately."""
+        mock_pygame.event.peek.return_value = True
+        pacer = FramePacer()
+
+        tick(pacer, True)
+
+        assert fake_time.sleeps == []
+
+    def test_deadline_shortens_wait(self, fake_time, mock_pygame, mock_quality):
+        """A scheduled deadline should cut the idle wait short."""
+        pacer = FramePacer()
+        deadline = int(fake_time.now * 1000) + 40
+
+        tick(pacer, True, deadline)
+
+        assert sum(fake_time.sleeps) == pytest.approx(0.040)
+
+    def test_passed_deadline_does_not_wait(self, fake_time, mock_pygame, mock_quality):
+        """A deadline already in the past should not wait at all."""
+        pacer = FramePacer()
+
+        tick(pacer, True, int(fake_time.now * 1000) - 100)
+
+        assert fake_time.sleeps == []
+
+    def test_idle_not_reported_to_quality(self, fake_time, mock_pygame, mock_quality):
+        """Waiting isn't frame work, so idle frames shouldn't affect quality tiers."""
+        pacer = FramePacer()
+        tick(pacer)
+
+        tick(pacer, True)
+
+        mock_quality.record.assert_not_called()
+
+    def test_adaptive_off_ignores_idle(self, fake_time, mock_pygame, mock_quality):
+        """With ADAPTIVE off every frame should keep the active cadence."""
+        pacer = FramePacer()
+        pacer.ADAPTIVE = False
+
+        tick(pacer, True)
+
+        assert fake_time.sleeps == [pytest.approx(1 / 60)]
+        assert pacer.idle_frames == 0
+
+
+class TestFramePacerJobs:
+    """Tests for running background jobs in the frame's spare time."""
+
+    def test_active_frame_runs_job_slices(self, fake_time, mock_pygame, mock_quality, mock_jobs):
+        """Each active frame should give the job scheduler its budget."""
+        tick(FramePacer())
+
+        mock_jobs.shared_scheduler.return_value.run_slices.assert_called_once_with()
+
+    def test_pending_jobs_prevent_idle(self, fake_time, mock_pygame, mock_quality, mock_jobs):
+        """A screen with queued jobs should keep ticking actively so they progress."""
+        scheduler = mock_jobs.shared_scheduler.return_value
+        scheduler.pending = True
+        pacer = FramePacer()
+
+        tick(pacer, True)
+
+        assert pacer.idle_frames == 0
+        scheduler.run_slices.assert_called_once()
+
+
+class TestSharedPacer:
+    """Tests for the process-wide pacer."""
+
+    def test_shared_pacer_is_singleton(self):
+        """Every screen should get the same pacer."""
+        assert pacing.shared_pacer() is pacing.shared_pacer()
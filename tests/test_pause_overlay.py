@@ -23,11 +23,13 @@ def mock_screen():
 @pytest.fixture
 def mock_pygame():
     """Mock pygame modules."""
-    with patch('game_screens.pause_overlay.pygame') as mock_pg:
-        # Mock Font
+    with patch('game_screens.pause_overlay.pygame') as mock_pg, \
+            patch('game_screens.pause_overlay.fonts') as mock_fonts:
+        # Mock the font registry
         mock_font_large = Mock()
         mock_font_small = Mock()
-        mock_pg.font.Font.side_effect = [mock_font_large, mock_font_small]
+        mock_fonts.get_font.side_effect = {96: mock_font_large, 36: mock_font_small}.get
+        mock_pg.fonts = mock_fonts
 
         # Mock Surface
         mock_surface = Mock()
@@ -58,14 +60,14 @@ class TestPauseOverlay:
         assert overlay.visible is False
 
     def test_init_creates_fonts(self, mock_pygame, mock_screen):
-        """PauseOverlay should create large and small fonts."""
+        """PauseOverlay should take its large and small fonts from the font registry."""
         overlay = PauseOverlay(mock_screen)
 
-        assert mock_pygame.font.Font.call_count == 2
+        assert mock_pygame.fonts.get_font.call_count == 2
         # Large font with size 96
-        mock_pygame.font.Font.assert_any_call(None, 96)
+        mock_pygame.fonts.get_font.assert_any_call(96)
         # Small font with size 36
-        mock_pygame.font.Font.assert_any_call(None, 36)
+        mock_pygame.fonts.get_font.assert_any_call(36)
 
     def test_subscribe_registers_callbacks(self, mock_pygame, mock_screen):
         """subscribe() should register callbacks for pause events."""
@@ -440,4 +442,107 @@ class TestPauseOverlay:
 
         overlay.visible = False
         overlay.draw()
-        assert overlay.visible is False
\ No newline at end of file
+        assert overlay.visible is False
+
+@pytest.fixture
+def freeze_screen():
+    """A screen whose copy() returns a distinct snapshot surface."""
+    screen = Mock()
+    screen.get_size.return_value = (800, 600)
+    screen.get_width.return_value = 800
+    screen.get_height.return_value = 600
+
+    def copy():
+        snapshot = Mock()
+        snapshot.get_size.return_value = screen.get_size.return_value
+        snapshot.get_width.return_value = screen.get_size.return_value[0]
+        snapshot.get_height.return_value = screen.get_size.return_value[1]
+        return snapshot
+
+    screen.copy.side_effect = copy
+    return screen
+
+
+class TestPauseOverlayFreezeFrame:
+    """Tests for freeze-frame mode."""
+
+    def test_freeze_is_opt_in(self, mock_pygame, mock_screen):
+        """Overlays should not freeze unless asked to."""
+        overlay = PauseOverlay(mock_screen)
+        overlay.visible = True
+
+        assert overlay.freeze is False
+        assert overlay.frozen is False
+
+    def test_frozen_only_while_visible(self, mock_pygame, freeze_screen):
+        """frozen should track game_paused/game_resumed in freeze mode."""
+        overlay = PauseOverlay(freeze_screen, freeze=True)
+        bus = EventBus()
+        overlay.subscribe(bus)
+
+        assert overlay.frozen is False
+        bus.emit('game_paused', {})
+        assert overlay.frozen is True
+        bus.emit('game_resumed', {})
+        assert overlay.frozen is False
+
+    def test_composes_frame_once(self, mock_pygame, freeze_screen):
+        """The snapshot, dim layer and text should be built once per pause."""
+        overlay = PauseOverlay(freeze_screen, freeze=True)
+        overlay.visible = True
+
+        for _ in range(10):
+            overlay.draw()
+
+        freeze_screen.copy.assert_called_once()
+        assert mock_pygame.Surface.call_count == 1
+        assert overlay.font_large.render.call_count == 1
+        assert overlay.font_small.render.call_count == 1
+
+    def test_draw_is_single_blit_of_frozen_frame(self, mock_pygame, freeze_screen):
+        """Each draw should blit only the cached frame onto the screen."""
+        overlay = PauseOverlay(freeze_screen, freeze=True)
+        overlay.visible = True
+
+        overlay.draw()
+        overlay.draw()
+
+        frame = overlay._frozen
+        assert freeze_screen.blit.call_args_list == [call(frame, (0, 0)), call(frame, (0, 0))]
+
+    def test_dim_and_text_drawn_on_snapshot(self, mock_pygame, freeze_screen):
+        """The dim layer and text should go onto the snapshot, not the screen."""
+        overlay = PauseOverlay(freeze_screen, freeze=True)
+        overlay.visible = True
+
+        overlay.draw()
+
+        frame = overlay._frozen
+        assert frame.blit.call_count == 3
+        assert frame.blit.call_args_list[0] == call(mock_pygame.Surface.return_value, (0, 0))
+
+    def test_resume_discards_frame(self, mock_pygame, freeze_screen):
+        """The next pause should snapshot the game as it is then."""
+        overlay = PauseOverlay(freeze_screen, freeze=True)
+        bus = EventBus()
+        overlay.subscribe(bus)
+
+        bus.emit('game_paused', {})
+        overlay.draw()
+        bus.emit('game_resumed', {})
+        bus.emit('game_paused', {})
+        overlay.draw()
+
+        assert freeze_screen.copy.call_count == 2
+
+    def test_screen_resize_resnapshots(self, mock_pygame, freeze_screen):
+        """A frozen frame of the wrong size should be rebuilt."""
+        overlay = PauseOverlay(freeze_screen, freeze=True)
+        overlay.visible = True
+        overlay.draw()
+
+        freeze_screen.get_size.return_value = (1024, 768)
+        overlay.draw()
+
+        assert freeze_screen.copy.call_count == 2
+        assert overlay._frozen.get_size() == (1024, 768)
@@ -0,0 +1,128 @@
+"""Tests for the asset preloader and the game manifest."""
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import preloader
+from game_screens.display import GameScreen
+from game_screens.gameover import GameOverScreen
+from game_screens.preloader import AssetPreloader, game_manifest
+
+
+@pytest.fixture
+def loaders():
+    """Patch every cache the preloader writes to."""
+    with patch('game_screens.preloader.fonts') as mock_fonts, \
+            patch('game_screens.preloader.animation_utils') as mock_utils, \
+            patch('game_screens.preloader.tones') as mock_tones, \
+            patch.object(GameScreen, 'preload_sprites') as preload_sprites, \
+            patch('game_screens.preloader.pygame') as mock_pg:
+        mock_pg.error = type('error', (Exception,), {})
+        yield {'fonts': mock_fonts, 'utils': mock_utils, 'tones': mock_tones,
+               'preload_sprites': preload_sprites, 'pygame': mock_pg}
+
+
+class TestGameManifest:
+    """Tests for game_manifest()."""
+
+    def test_lists_button_sprites_once(self):
+        """The button sprites are one entry, preloaded as a batch."""
+        manifest = game_manifest((800, 600))
+        assert [entry for entry in manifest if entry[0].startswith('sprite')] == [('sprites',)]
+
+    def test_lists_fonts_gradient_and_audio(self):
+        """Fonts, the game over gradient, button tones and music are all covered."""
+        manifest = game_manifest((800, 600))
+        assert [entry[1] for entry in manifest if entry[0] == 'font'] == list(preloader.FONT_SIZES)
+        assert ('gradient', (800, 600), GameOverScreen.gradient_top, GameOverScreen.gradient_bottom) in manifest
+        assert ('tones', GameScreen.BUTTON_TONES, GameScreen.TONE_MS) in manifest
+        assert ('music', GameOverScreen.MUSIC) in manifest
+
+
+class TestAssetPreloader:
+    """Tests for AssetPreloader.steps()."""
+
+    def test_loads_one_asset_per_slice(self, loaders):
+        """Each slice loads one entry and yields overall progress."""
+        loader = AssetPreloader([('font', 32), ('sound', 'a.ogg'), ('music', 'b.ogg'), ('gradient', (8, 6), (1, 1, 1), (0, 0, 0))])
+        steps = loader.steps()
+
+        assert next(steps) == 0.25
+        loaders['fonts'].get_font.assert_called_once_with(32)
+        loaders['utils'].load_sound.assert_not_called()
+        assert list(steps) == [0.5, 0.75, 1.0]
+        loaders['utils'].load_sound.assert_called_once_with('a.ogg')
+        loaders['utils'].preload_music.assert_called_once_with('b.ogg')
+        loaders['utils'].gradient_steps.assert_called_once_with((8, 6), (1, 1, 1), (0, 0, 0))
+        assert loader.loaded == 4
+
+    def test_tones_go_through_shared_synth(self, loaders):
+        """The tones entry synthesizes the button tones once, up front."""
+        list(AssetPreloader([('tones', {'up': 330.0}, 350)]).steps())
+        loaders['tones'].button_tones.assert_called_once_with({'up': 330.0}, 350)
+
+    def test_sprites_go_through_game_screen(self, loaders):
+        """The sprites entry runs GameScreen's atlas-aware preload job."""
+        loaders['preload_sprites'].return_value = iter([0.5, 1.0])
+        loader = AssetPreloader([('sprites',)])
+        list(loader.steps())
+        loaders['preload_sprites'].assert_called_once_with()
+        assert loader.loaded == 1
+
+    def test_loader_jobs_run_a_slice_at_a_time(self, loaders):
+        """A loader's own job runs within this one, its progress scaled to its entry."""
+        slices = []
+
+        def gradient_steps(size, top, bottom):
+            slices.append('column')
+            yield 0.5
+            slices.append('stretch')
+
+        loaders['utils'].gradient_steps.side_effect = gradient_steps
+        loader = AssetPreloader([('font', 32), ('gradient', (8, 6), (1, 1, 1), (0, 0, 0))])
+        steps = loader.steps()
+
+        assert next(steps) == 0.5
+        assert next(steps) == 0.75
+        assert slices == ['column']
+        assert list(steps) == [1.0]
+        assert slices == ['column', 'stretch']
+        assert loader.loaded == 2
+
+    def test_failing_loader_job_is_recorded(self, loaders):
+        """An error raised partway through a loader's job counts as a failed entry."""
+        def preload_sprites():
+            yield 0.5
+            raise loaders['pygame'].error('bad png')
+
+        loaders['preload_sprites'].side_effect = preload_sprites
+        loader = AssetPreloader([('sprites',), ('font', 36)])
+
+        assert list(loader.steps())[-1] == 1.0
+        assert loader.failed == [('sprites',)]
+        assert loader.loaded == 1
+
+    def test_failures_are_recorded_not_raised(self, loaders):
+        """A missing asset is listed in failed and the rest still load."""
+        loaders['utils'].load_sound.side_effect = OSError('missing')
+        loaders['utils'].preload_music.side_effect = loaders['pygame'].error('bad file')
+        loader = AssetPreloader([('sound', 'a.ogg'), ('music', 'b.ogg'), ('font', 36)])
+
+        assert list(loader.steps())[-1] == 1.0
+        assert loader.failed == [('sound', 'a.ogg'), ('music', 'b.ogg')]
+        assert loader.loaded == 1
+        loaders['fonts'].get_font.assert_called_once_with(36)
+
+    def test_result_is_the_preloader(self, loaders):
+        """The finished job hands back the preloader so callers can inspect failures."""
+        with patch('game_screens.preloader.jobs') as mock_jobs:
+            preloader.preload((800, 600))
+        steps, name = mock_jobs.submit.call_args.args
+        assert name == 'assets'
+        with pytest.raises(StopIteration) as stop:
+            while True:
+                next(steps)
+        assert isinstance(stop.value.value, AssetPreloader)
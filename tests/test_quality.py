@@ -0,0 +1,115 @@
+"""Tests for QualityManager."""
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.event_bus import EventBus
+from game_screens.quality import QualityManager
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+@pytest.fixture
+def changes(bus):
+    """Collect quality_changed events."""
+    events = []
+    bus.subscribe('quality_changed', events.append)
+    return events
+
+
+@pytest.fixture
+def manager(bus):
+    return QualityManager(bus, budget_ms=16, window=10)
+
+
+def feed(manager, frame_ms, frames):
+    for _ in range(frames):
+        manager.record(frame_ms)
+
+
+class TestQualityManager:
+    """Test suite for the QualityManager class."""
+
+    def test_starts_at_best_tier(self, manager):
+        """A new manager should start with every feature on."""
+        assert manager.tier == 'high'
+        assert manager.enabled('wave_text')
+        assert manager.enabled('dim_buttons')
+
+    def test_no_decision_before_full_window(self, manager, changes):
+        """Slow frames shouldn't change tier until the window is full."""
+        feed(manager, 50, 9)
+
+        assert manager.tier == 'high'
+        assert changes == []
+
+    def test_slow_frames_step_down_one_tier(self, manager, changes):
+        """A slow window should drop exactly one tier and emit quality_changed."""
+        feed(manager, 30, 10)
+
+        assert manager.tier == 'medium'
+        assert not manager.enabled('wave_text')
+        assert manager.enabled('dim_buttons')
+        assert changes == [{'tier': 'medium', 'previous': 'high', 'frame_ms': 30}]
+
+    def test_keeps_stepping_down_while_slow(self, manager, changes):
+        """Each further slow window should drop another tier, stopping at the lowest."""
+        feed(manager, 30, 50)
+
+        assert manager.tier == 'low'
+        assert not manager.enabled('dim_buttons')
+        assert [c['tier'] for c in changes] == ['medium', 'low']
+
+    def test_fast_frames_step_back_up(self, manager, changes):
+        """With headroom the manager should upgrade again."""
+        feed(manager, 30, 20)
+        feed(manager, 2, 10)
+
+        assert manager.tier == 'medium'
+        assert changes[-1] == {'tier': 'medium', 'previous': 'low', 'frame_ms': 2}
+
+    def test_within_budget_holds_tier(self, manager, changes):
+        """Frames between the thresholds should not change tier."""
+        feed(manager, 30, 10)
+        feed(manager, 14, 100)
+
+        assert manager.tier == 'medium'
+        assert len(changes) == 1
+
+    def test_never_upgrades_past_best(self, manager, changes):
+        """Fast frames at the best tier should emit nothing."""
+        feed(manager, 1, 100)
+
+        assert manager.tier == 'high'
+        assert changes == []
+
+    def test_samples_reset_after_change(self, manager):
+        """A decision should only use frames rendered at the current tier."""
+        feed(manager, 30, 10)
+        feed(manager, 30, 9)
+
+        assert manager.tier == 'medium'
+
+    def test_set_tier_emits(self, manager, changes):
+        """Forcing a tier should emit with no measured frame time."""
+        manager.set_tier('low')
+
+        assert manager.tier == 'low'
+        assert changes == [{'tier': 'low', 'previous': 'high', 'frame_ms': None}]
+
+    def test_set_tier_same_is_silent(self, manager, changes):
+        """Setting the current tier should not emit."""
+        manager.set_tier('high')
+
+        assert changes == []
+
+    def test_set_tier_rejects_unknown(self, manager):
+        """Unknown tier names should raise ValueError."""
+        with pytest.raises(ValueError):
+            manager.set_tier('ultra')
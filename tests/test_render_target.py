@@ -0,0 +1,266 @@
+"""Tests for RenderTarget."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import render_target
+from game_screens.render_target import RenderTarget
+
+
+class FakeRect(tuple):
+    """Minimal pygame.Rect stand-in: a 4-tuple with .size."""
+
+    def __new__(cls, x, y, w, h):
+        return super().__new__(cls, (x, y, w, h))
+
+    @property
+    def size(self):
+        return (self[2], self[3])
+
+
+def make_window(size, bitsize=32):
+    window = Mock()
+    window.get_size.return_value = size
+    window.get_bitsize.return_value = bitsize
+    return window
+
+
+@pytest.fixture(autouse=True)
+def reset_active():
+    render_target._active = None
+    yield
+    render_target._active = None
+
+
+@pytest.fixture
+def mock_pygame():
+    with patch('game_screens.render_target.pygame') as mock_pg:
+        mock_pg.Rect.side_effect = FakeRect
+        mock_pg.SCALED = 0x200
+        mock_pg.FULLSCREEN = 0x1
+        mock_pg.RESIZABLE = 0x10
+        window = make_window((800, 600))
+        mock_pg.display.set_mode.return_value = window
+        mock_pg.display.get_surface.return_value = window
+        logical = make_window((800, 600))
+        mock_pg.Surface.return_value.convert.return_value = logical
+        yield mock_pg
+
+
+@pytest.fixture
+def mock_caches():
+    """Patch the caches the target keeps in sync with the display format."""
+    with patch('game_screens.render_target.sprite_cache') as mock_sprites, \
+         patch('game_screens.render_target.animation_utils') as mock_utils:
+        yield mock_sprites, mock_utils
+
+
+class TestRenderTargetScaled:
+    """Tests for the SCALED presentation mode."""
+
+    def test_rejects_unknown_mode(self):
+        """An unknown mode should raise ValueError."""
+        with pytest.raises(ValueError):
+            RenderTarget(mode='stretch')
+
+    @pytest.mark.parametrize('platform, fullscreen, mode', [
+        ('linux', False, 'direct'),
+        ('linux', True, 'scaled'),
+        ('emscripten', False, 'direct'),
+        ('emscripten', True, 'direct'),
+    ])
+    def test_default_mode_scales_only_when_needed(self, platform, fullscreen, mode):
+        """Only a desktop fullscreen window differs from the logical size."""
+        with patch('game_screens.render_target.sys.platform', platform):
+            assert RenderTarget(fullscreen=fullscreen).mode == mode
+
+    def test_open_requests_scaled_resizable_window(self, mock_pygame, mock_caches):
+        """SCALED mode should open a resizable logical-size window."""
+        target = RenderTarget(mode='scaled', vsync=True)
+
+        surface = target.open()
+
+        mock_pygame.display.set_mode.assert_called_once_with(
+            (800, 600), mock_pygame.SCALED | mock_pygame.RESIZABLE, vsync=1
+        )
+        assert surface is mock_pygame.display.set_mode.return_value
+
+    def test_fullscreen_flag(self, mock_pygame, mock_caches):
+        """fullscreen should add FULLSCREEN to the SCALED flags."""
+        RenderTarget(mode='scaled', fullscreen=True).open()
+
+        mock_pygame.display.set_mode.assert_called_once_with(
+            (800, 600), mock_pygame.SCALED | mock_pygame.FULLSCREEN, vsync=0
+        )
+
+    def test_present_uploads_whole_frame(self, mock_pygame, mock_caches):
+        """SCALED re-uploads the full texture, so dirty rects are reported as the whole frame."""
+        target = RenderTarget(mode='scaled')
+        surface = target.open()
+
+        assert target.present(['r1']) == [surface.get_rect.return_value]
+        assert target.present() == [surface.get_rect.return_value]
+
+        mock_pygame.display.update.assert_not_called()
+        assert mock_pygame.display.flip.call_count == 2
+        mock_pygame.transform.scale.assert_not_called()
+
+    def test_to_logical_is_identity(self, mock_pygame, mock_caches):
+        """SDL already reports logical mouse coordinates in SCALED mode."""
+        target = RenderTarget(mode='scaled')
+        target.open()
+
+        assert target.to_logical((123, 456)) == (123, 456)
+
+    def test_open_syncs_sprite_cache(self, mock_pygame, mock_caches):
+        """Opening should sync the sprite cache with the drawing surface."""
+        mock_sprites, _ = mock_caches
+        target = RenderTarget(mode='scaled')
+
+        surface = target.open()
+
+        mock_sprites.shared_cache.return_value.sync_display.assert_called_with(surface)
+
+
+class TestRenderTargetDirect:
+    """Tests for the unscaled direct presentation mode."""
+
+    def test_open_requests_plain_window(self, mock_pygame, mock_caches):
+        """Direct mode should open a plain logical-size window and draw into it."""
+        target = RenderTarget(mode='direct')
+
+        surface = target.open()
+
+        mock_pygame.display.set_mode.assert_called_once_with((800, 600), 0)
+        assert surface is mock_pygame.display.set_mode.return_value
+
+    def test_present_uploads_only_rects(self, mock_pygame, mock_caches):
+        """Dirty rects narrow the upload, and are reported as presented."""
+        target = RenderTarget(mode='direct')
+        surface = target.open()
+
+        assert target.present(['r1', 'r2']) == ['r1', 'r2']
+        mock_pygame.display.update.assert_called_once_with(['r1', 'r2'])
+        mock_pygame.display.flip.assert_not_called()
+
+        assert target.present() == [surface.get_rect.return_value]
+        mock_pygame.display.flip.assert_called_once()
+
+    def test_to_logical_is_identity(self, mock_pygame, mock_caches):
+        """The window is the logical surface, so positions need no mapping."""
+        target = RenderTarget(mode='direct')
+        target.open()
+
+        assert target.to_logical((123, 456)) == (123, 456)
+
+
+class TestRenderTargetManual:
+    """Tests for the manual scale-blit presentation mode."""
+
+    def test_draws_into_logical_surface(self, mock_pygame, mock_caches):
+        """Screens should draw into a logical-size surface, not the window."""
+        target = RenderTarget(mode='manual')
+
+        surface = target.open()
+
+        mock_pygame.Surface.assert_called_once_with((800, 600))
+        assert surface is not target.window
+
+    def test_present_scales_into_letterboxed_viewport(self, mock_pygame, mock_caches):
+        """A 4K window should get a centered, aspect-preserving viewport."""
+        target = RenderTarget(mode='manual')
+        surface = target.open()
+        mock_pygame.display.get_surface.return_value = make_window((3840, 2160))
+
+        target.present()
+
+        assert target.viewport == (480, 0, 2880, 2160)
+        window = target.window
+        window.subsurface.assert_called_once_with(target.viewport)
+        mock_pygame.transform.scale.assert_called_once_with(surface, (2880, 2160), window.subsurface.return_value)
+        mock_pygame.display.flip.assert_called_once()
+
+    def test_resize_keeps_logical_size(self, mock_pygame, mock_caches):
+        """Resizing the window should not change what screens draw into."""
+        target = RenderTarget(mode='manual')
+        surface = target.open()
+        mock_pygame.display.get_surface.return_value = make_window((1600, 1200))
+
+        target.present()
+
+        assert target.surface is surface
+        assert target.viewport == (0, 0, 1600, 1200)
+
+    def test_to_logical_maps_through_viewport(self, mock_pygame, mock_caches):
+        """Mouse positions should be mapped back to logical coordinates."""
+        target = RenderTarget(mode='manual')
+        target.open()
+        mock_pygame.display.get_surface.return_value = make_window((3840, 2160))
+        target.present()
+
+        assert target.to_logical((480, 0)) == (0, 0)
+        assert target.to_logical((480 + 1440, 1080)) == (400, 300)
+
+
+class TestRenderTargetCaches:
+    """Tests for cache invalidation on display changes."""
+
+    def test_resize_keeps_gradients(self, mock_pygame, mock_caches):
+        """A window resize alone should not drop cached gradients."""
+        _, mock_utils = mock_caches
+        target = RenderTarget(mode='manual')
+        target.open()
+        mock_pygame.display.get_surface.return_value = make_window((1920, 1080))
+
+        target.present()
+
+        mock_utils.gradient_cache.return_value.clear.assert_not_called()
+
+    def test_format_change_drops_gradients(self, mock_pygame, mock_caches):
+        """A new pixel format should clear the converted gradients."""
+        _, mock_utils = mock_caches
+        target = RenderTarget(mode='manual')
+        target.open()
+        mock_pygame.display.get_surface.return_value = make_window((800, 600), bitsize=16)
+
+        target.present()
+
+        mock_utils.gradient_cache.return_value.clear.assert_called_once()
+
+
+class TestModuleFunctions:
+    """Tests for the process-wide helpers screens call."""
+
+    def test_present_without_target_uses_display(self, mock_pygame):
+        """present() should fall back to flip/update when no target was created."""
+        full = render_target.present()
+        partial = render_target.present(['r'])
+
+        mock_pygame.display.flip.assert_called_once()
+        mock_pygame.display.update.assert_called_once_with(['r'])
+        assert full == [mock_pygame.display.get_surface.return_value.get_rect.return_value]
+        assert partial == ['r']
+
+    def test_present_time_is_accumulated_and_reset(self, mock_pygame):
+        """take_present_time() returns the time spent presenting since the last call."""
+        clock = iter([1.0, 1.004, 2.0, 2.002])
+        render_target.take_present_time()
+        with patch('game_screens.render_target.time.perf_counter', lambda: next(clock)):
+            render_target.present()
+            render_target.present(['r'])
+
+        assert render_target.take_present_time() == pytest.approx(0.006)
+        assert render_target.take_present_time() == 0.0
+
+    def test_to_logical_without_target(self):
+        """to_logical() should pass positions through when no target was created."""
+        assert render_target.to_logical((5, 7)) == (5, 7)
+
+    def test_create_sets_active(self, mock_pygame, mock_caches):
+        """create() should open the target and make it the active one."""
+        surface = render_target.create((800, 600))
+
+        assert render_target.active().surface is surface
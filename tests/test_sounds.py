@@ -0,0 +1,157 @@
+"""Tests for the SoundManager sound cache and channel pool."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.sounds import SoundManager, sound_bytes
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture
+def mock_pygame():
+    """A mixer with 8 idle channels whose Sounds last one second."""
+    with patch('game_screens.sounds.pygame') as mock_pg:
+        mock_pg.mixer.get_init.return_value = (44100, -16, 2)
+        mock_pg.mixer.get_num_channels.return_value = 8
+        mock_pg.channels = {}
+
+        def channel(index):
+            ch = Mock()
+            ch.get_busy.return_value = False
+            mock_pg.channels[index] = ch
+            return ch
+
+        def sound(file):
+            snd = Mock()
+            snd.file = file
+            snd.get_length.return_value = 1.0
+            return snd
+
+        mock_pg.mixer.Channel.side_effect = channel
+        mock_pg.mixer.Sound.side_effect = sound
+        yield mock_pg
+
+
+def make_manager(channels=2, **kwargs):
+    return SoundManager(channels=channels, clock=FakeClock(), **kwargs)
+
+
+def busy(mock_pg, *indices):
+    for index in indices:
+        mock_pg.channels[index].get_busy.return_value = True
+
+
+class TestSoundCache:
+    """Tests for decoding and caching."""
+
+    def test_sound_decoded_once(self, mock_pygame):
+        """Repeated plays reuse the decoded Sound."""
+        manager = make_manager()
+        manager.play('correct.ogg')
+        manager.play('correct.ogg')
+
+        mock_pygame.mixer.Sound.assert_called_once_with('correct.ogg')
+
+    def test_cache_bounded_by_pcm_bytes(self, mock_pygame):
+        """The least recently used sound is evicted once the budget is exceeded."""
+        one_second = 44100 * 2 * 2
+        manager = make_manager(budget=one_second * 2)
+        for name in ('a.ogg', 'b.ogg', 'c.ogg'):
+            manager.load(name)
+
+        assert 'a.ogg' not in manager.cache
+        assert manager.stats()['bytes'] == one_second * 2
+
+    def test_sound_bytes_without_mixer(self, mock_pygame):
+        """Without an initialized mixer a Sound is counted as free."""
+        mock_pygame.mixer.get_init.return_value = None
+        assert sound_bytes(Mock()) == 0
+
+
+class TestChannelPool:
+    """Tests for channel reservation and the steal policy."""
+
+    def test_pool_reserved_on_first_play(self, mock_pygame):
+        """The pool's channels are reserved so Sound.play() can't take them."""
+        manager = make_manager(channels=3)
+        manager.play('a.ogg')
+
+        mock_pygame.mixer.set_reserved.assert_called_once_with(3)
+        assert sorted(mock_pygame.channels) == [0, 1, 2]
+
+    def test_grows_mixer_channels_if_needed(self, mock_pygame):
+        """A pool bigger than the mixer's channel count raises the count first."""
+        mock_pygame.mixer.get_num_channels.return_value = 2
+        make_manager(channels=4).play('a.ogg')
+
+        mock_pygame.mixer.set_num_channels.assert_called_once_with(4)
+
+    def test_plays_on_free_channel(self, mock_pygame):
+        """An idle pool channel is used before stealing."""
+        manager = make_manager()
+        manager.play('a.ogg')
+        busy(mock_pygame, 0)
+
+        channel = manager.play('b.ogg')
+
+        assert channel is mock_pygame.channels[1]
+        assert channel.play.call_args.args[0].file == 'b.ogg'
+        assert manager.stolen == 0
+
+    def test_steals_lowest_priority(self, mock_pygame):
+        """With every channel busy, the lowest-priority sound is cut off."""
+        manager = make_manager()
+        manager.play('music-sting.ogg', priority=5)
+        busy(mock_pygame, 0)
+        manager.play('tick.ogg', priority=0)
+        busy(mock_pygame, 1)
+
+        assert manager.play('correct.ogg', priority=3) is mock_pygame.channels[1]
+        assert manager.stolen == 1
+
+    def test_equal_priority_steals_oldest(self, mock_pygame):
+        """Among equal priorities the longest-playing sound gives way."""
+        manager = make_manager()
+        manager.play('a.ogg')
+        busy(mock_pygame, 0)
+        manager.play('b.ogg')
+        busy(mock_pygame, 1)
+
+        assert manager.play('c.ogg') is mock_pygame.channels[0]
+        assert manager.play('d.ogg') is mock_pygame.channels[1]
+
+    def test_lower_priority_is_dropped(self, mock_pygame):
+        """A play that outranks nothing busy doesn't interrupt anything."""
+        manager = make_manager(channels=1)
+        manager.play('gameover.ogg', priority=9)
+        busy(mock_pygame, 0)
+
+        assert manager.play('tick.ogg', priority=1) is None
+        assert manager.dropped == 1
+        assert mock_pygame.channels[0].play.call_count == 1
+
+    def test_no_mixer_plays_nothing(self, mock_pygame):
+        """Without an initialized mixer, play is a no-op."""
+        mock_pygame.mixer.get_init.return_value = None
+
+        assert make_manager().play('a.ogg') is None
+        mock_pygame.mixer.set_reserved.assert_not_called()
+
+    def test_stop_silences_pool(self, mock_pygame):
+        """stop() stops every reserved channel."""
+        manager = make_manager()
+        manager.play('a.ogg')
+        manager.stop()
+
+        assert all(ch.stop.called for ch in mock_pygame.channels.values())
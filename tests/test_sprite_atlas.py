@@ -0,0 +1,107 @@
+"""Comprehensive tests for the sprite atlas loader."""
+import json
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import sprite_atlas
+from game_screens.sprite_atlas import SpriteAtlas, load_atlas
+
+
+@pytest.fixture(autouse=True)
+def clear_manifests():
+    """Each test parses its manifest afresh."""
+    sprite_atlas._manifests.clear()
+    yield
+    sprite_atlas._manifests.clear()
+
+
+@pytest.fixture
+def mock_sprite_cache():
+    """Mock the shared sprite cache the atlas image is loaded through."""
+    with patch('game_screens.sprite_atlas.sprite_cache') as mock_cache:
+        yield mock_cache
+
+
+def write_manifest(tmp_path, **overrides):
+    manifest = {
+        'version': sprite_atlas.MANIFEST_VERSION,
+        'image': 'atlas.png',
+        'sprites': {
+            'up':    {'normal': [0, 0, 90, 90], 'pressed': [91, 0, 90, 90]},
+            'space': {'normal': [0, 91, 220, 55]},
+        },
+    }
+    manifest.update(overrides)
+    path = tmp_path / sprite_atlas.MANIFEST_NAME
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+class TestSpriteAtlas:
+    """Test suite for SpriteAtlas and load_atlas."""
+
+    def test_get_returns_subsurface(self):
+        """get() should slice the atlas image at the manifest rect."""
+        image = Mock()
+        atlas = SpriteAtlas(image, {'up': {'normal': [0, 0, 90, 90]}})
+
+        sprite = atlas.get('up', 'normal', (90, 90))
+
+        image.subsurface.assert_called_once_with([0, 0, 90, 90])
+        assert sprite is image.subsurface.return_value
+
+    def test_get_missing_sprite_returns_none(self):
+        """Unknown buttons or states should return None."""
+        atlas = SpriteAtlas(Mock(), {'up': {'normal': [0, 0, 90, 90]}})
+
+        assert atlas.get('down', 'normal') is None
+        assert atlas.get('up', 'indicated') is None
+
+    def test_get_size_mismatch_returns_none(self):
+        """A sprite baked at a different size should be treated as stale."""
+        image = Mock()
+        atlas = SpriteAtlas(image, {'up': {'normal': [0, 0, 90, 90]}})
+
+        assert atlas.get('up', 'normal', (120, 120)) is None
+        image.subsurface.assert_not_called()
+
+    def test_load_atlas_missing_manifest(self, tmp_path, mock_sprite_cache):
+        """No manifest means no atlas and no image load."""
+        assert load_atlas(str(tmp_path / 'atlas.json')) is None
+        mock_sprite_cache.load.assert_not_called()
+
+    def test_load_atlas_reads_manifest(self, tmp_path, mock_sprite_cache):
+        """load_atlas should load the image next to the manifest through the sprite cache."""
+        path = write_manifest(tmp_path)
+
+        atlas = load_atlas(path)
+
+        mock_sprite_cache.load.assert_called_once_with(str(tmp_path / 'atlas.png'))
+        assert atlas.image is mock_sprite_cache.load.return_value
+        assert atlas.rects['space']['normal'] == [0, 91, 220, 55]
+
+    def test_load_atlas_parses_manifest_once(self, tmp_path, mock_sprite_cache):
+        """The manifest should only be read from disk once per process."""
+        path = write_manifest(tmp_path)
+        load_atlas(path)
+
+        with patch('builtins.open') as mock_open:
+            load_atlas(path)
+            mock_open.assert_not_called()
+
+    def test_load_atlas_rejects_other_versions(self, tmp_path, mock_sprite_cache):
+        """A manifest from an incompatible builder should be ignored."""
+        path = write_manifest(tmp_path, version=sprite_atlas.MANIFEST_VERSION + 1)
+
+        assert load_atlas(path) is None
+
+    def test_load_atlas_rejects_corrupt_manifest(self, tmp_path, mock_sprite_cache):
+        """Invalid JSON should be ignored rather than crash startup."""
+        path = tmp_path / 'atlas.json'
+        path.write_text('{not json')
+
+        assert load_atlas(str(path)) is None
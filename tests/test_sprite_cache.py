@@ -0,0 +1,350 @@
+"""Comprehensive tests for SpriteCache."""
+import sys
+import threading
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from concurrent.futures import ThreadPoolExecutor
+
+from game_screens import sprite_cache
+from game_screens.sprite_cache import SpriteCache
+
+
+@pytest.fixture
+def mock_pygame():
+    """Mock pygame so each decode and scale produces a distinct surface."""
+    with patch('game_screens.sprite_cache.pygame') as mock_pg:
+        mock_pg.loaded = []
+
+        def load(path):
+            image = Mock()
+            mock_pg.loaded.append(image)
+            return image
+
+        mock_pg.image.load.side_effect = load
+        mock_pg.transform.smoothscale.side_effect = lambda surf, size: Mock()
+        yield mock_pg
+
+
+def make_display(size=(800, 600), bitsize=32):
+    display = Mock()
+    display.get_size.return_value = size
+    display.get_bitsize.return_value = bitsize
+    return display
+
+
+class TestSpriteCache:
+    """Test suite for the SpriteCache class."""
+
+    def test_load_decodes_converts_and_scales(self, mock_pygame):
+        """A scaled load should decode, convert_alpha and smoothscale once."""
+        cache = SpriteCache()
+
+        sprite = cache.load('up.png', (90, 90))
+
+        mock_pygame.image.load.assert_called_once_with('up.png')
+        converted = mock_pygame.loaded[0].convert_alpha.return_value
+        mock_pygame.transform.smoothscale.assert_called_once_with(converted, (90, 90))
+        assert sprite is not converted
+
+    def test_load_is_cached(self, mock_pygame):
+        """Loading the same (path, size) again should not touch disk or rescale."""
+        cache = SpriteCache()
+
+        first = cache.load('up.png', (90, 90))
+        second = cache.load('up.png', (90, 90))
+
+        assert first is second
+        assert mock_pygame.image.load.call_count == 1
+        assert mock_pygame.transform.smoothscale.call_count == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_size_is_part_of_key(self, mock_pygame):
+        """Different target sizes should produce separate sprites."""
+        cache = SpriteCache()
+
+        small = cache.load('up.png', (90, 90))
+        large = cache.load('up.png', (180, 180))
+
+        assert small is not large
+        assert mock_pygame.transform.smoothscale.call_count == 2
+
+    def test_scaled_load_does_not_keep_source(self, mock_pygame):
+        """The decoded source should be released once the scaled sprite exists."""
+        cache = SpriteCache()
+
+        cache.load('up.png', (90, 90))
+
+        assert cache.stats()['sprites'] == 1
+
+    def test_unscaled_load_skips_smoothscale(self, mock_pygame):
+        """size=None should return the converted image as decoded."""
+        cache = SpriteCache()
+
+        sprite = cache.load('up.png')
+
+        mock_pygame.transform.smoothscale.assert_not_called()
+        assert sprite is mock_pygame.loaded[0].convert_alpha.return_value
+
+    def test_cached_source_is_reused_for_scaling(self, mock_pygame):
+        """An already cached source should be rescaled without decoding again."""
+        cache = SpriteCache()
+        cache.load('up.png')
+
+        cache.load('up.png', (90, 90))
+
+        assert mock_pygame.image.load.call_count == 1
+
+    def test_opaque_mode_uses_convert(self, mock_pygame):
+        """alpha=False should convert without per-pixel alpha."""
+        cache = SpriteCache()
+
+        sprite = cache.load('bg.png', alpha=False)
+
+        assert sprite is mock_pygame.loaded[0].convert.return_value
+
+    def test_invalidate_forces_reload(self, mock_pygame):
+        """invalidate() should make the next load decode again."""
+        cache = SpriteCache()
+        cache.load('up.png', (90, 90))
+
+        cache.invalidate()
+        cache.load('up.png', (90, 90))
+
+        assert mock_pygame.image.load.call_count == 2
+
+    def test_sync_display_keeps_cache_for_same_mode(self, mock_pygame):
+        """Syncing against an unchanged display mode should keep sprites."""
+        cache = SpriteCache()
+        cache.sync_display(make_display())
+        cache.load('up.png', (90, 90))
+
+        cache.sync_display(make_display())
+
+        assert cache.stats()['sprites'] == 1
+
+    def test_sync_display_invalidates_on_mode_change(self, mock_pygame):
+        """A display size or depth change should drop every sprite."""
+        cache = SpriteCache()
+        cache.sync_display(make_display())
+        cache.load('up.png', (90, 90))
+
+        cache.sync_display(make_display(size=(1920, 1080)))
+
+        assert cache.stats()['sprites'] == 0
+
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+REQUESTS = [('up.png', (90, 90), True), ('down.png', (90, 90), True), ('space.png', (220, 55), True)]
+
+
+class TestSpriteCacheLoadMany:
+    """Tests for load_many(), sequential and on a thread pool."""
+
+    def test_sequential_matches_load(self, mock_pygame):
+        """Without an executor load_many is load() per request."""
+        cache = SpriteCache()
+
+        sprites = cache.load_many(REQUESTS)
+
+        assert sprites == [cache.load(*request) for request in REQUESTS]
+        assert mock_pygame.image.load.call_count == 3
+
+    def test_threaded_returns_sprites_in_order(self, mock_pygame, executor):
+        """Results should line up with the requests."""
+        cache = SpriteCache()
+
+        sprites = cache.load_many(REQUESTS, executor)
+
+        assert sprites == [cache.load(*request) for request in REQUESTS]
+
+    def test_threaded_converts_after_scaling(self, mock_pygame, executor):
+        """Decode and scale on the pool; only convert_alpha happens afterwards."""
+        scaled = Mock()
+        mock_pygame.transform.smoothscale.side_effect = lambda surf, size: scaled
+        cache = SpriteCache()
+
+        sprites = cache.load_many(REQUESTS[:1], executor)
+
+        image = mock_pygame.loaded[0]
+        mock_pygame.transform.smoothscale.assert_called_once_with(image, (90, 90))
+        image.convert_alpha.assert_not_called()
+        assert sprites[0] is scaled.convert_alpha.return_value
+
+    def test_threaded_runs_on_pool(self, mock_pygame, executor):
+        """Decoding should run off the calling thread."""
+        threads = set()
+
+        def load(path):
+            threads.add(threading.current_thread().name)
+            return Mock()
+
+        mock_pygame.image.load.side_effect = load
+        SpriteCache().load_many(REQUESTS, executor)
+
+        assert threading.current_thread().name not in threads
+
+    def test_threaded_skips_cached(self, mock_pygame, executor):
+        """Sprites already cached should not be decoded again."""
+        cache = SpriteCache()
+        cache.load(*REQUESTS[0])
+
+        cache.load_many(REQUESTS, executor)
+
+        assert mock_pygame.image.load.call_count == 3
+        assert cache.hits == 1
+        assert cache.misses == 3
+
+    def test_threaded_deduplicates(self, mock_pygame, executor):
+        """A sprite requested twice should be decoded once."""
+        cache = SpriteCache()
+
+        first, second = cache.load_many([REQUESTS[0], REQUESTS[0]], executor)
+
+        assert first is second
+        assert mock_pygame.image.load.call_count == 1
+
+    def test_decode_executor_unavailable_on_web(self):
+        """pygbag has no threads, so load_many must fall back to sequential."""
+        with patch('game_screens.sprite_cache.sys.platform', 'emscripten'):
+            assert sprite_cache.decode_executor() is None
+
+
+class TestSpriteCachePrefetch:
+    """Tests for the prefetch() job, sequential and on a thread pool."""
+
+    def test_sequential_loads_one_per_slice(self, mock_pygame):
+        """Without an executor each slice loads one sprite."""
+        cache = SpriteCache()
+        steps = cache.prefetch(REQUESTS)
+
+        assert next(steps) == pytest.approx(1 / 3)
+        assert mock_pygame.image.load.call_count == 1
+        assert list(steps) == [pytest.approx(2 / 3), 1.0]
+        assert cache.stats()['sprites'] == 3
+
+    def test_threaded_submits_in_first_slice(self, mock_pygame):
+        """The first slice hands every decode to the pool and returns."""
+        executor = Mock()
+        executor.submit.side_effect = lambda fn, *args: Mock()
+
+        progress = next(SpriteCache().prefetch(REQUESTS, executor))
+
+        assert progress == 0.0
+        assert [call.args[1:] for call in executor.submit.call_args_list] == [
+            (path, size) for path, size, _ in REQUESTS
+        ]
+        mock_pygame.image.load.assert_not_called()
+
+    def test_threaded_fills_cache(self, mock_pygame, executor):
+        """Once the job finishes every sprite is served from the cache."""
+        cache = SpriteCache()
+
+        progress = list(cache.prefetch(REQUESTS, executor))
+        loads = mock_pygame.image.load.call_count
+        sprites = [cache.load(*request) for request in REQUESTS]
+
+        assert progress[-1] == 1.0
+        assert progress == sorted(progress)
+        assert loads == 3
+        assert mock_pygame.image.load.call_count == 3
+        assert cache.hits == 3
+        assert len(set(map(id, sprites))) == 3
+
+    def test_threaded_converts_on_calling_thread(self, mock_pygame, executor):
+        """Decodes run on the pool; converting happens in the job's slices."""
+        threads = {}
+
+        def smoothscale(surf, size):
+            threads['decode'] = threading.current_thread().name
+            scaled = Mock()
+            scaled.convert_alpha.side_effect = lambda: threads.setdefault('convert', threading.current_thread().name)
+            return scaled
+
+        mock_pygame.transform.smoothscale.side_effect = smoothscale
+        list(SpriteCache().prefetch(REQUESTS[:1], executor))
+
+        assert threads['decode'] != threading.current_thread().name
+        assert threads['convert'] == threading.current_thread().name
+
+    def test_threaded_skips_cached(self, mock_pygame, executor):
+        """Sprites already cached aren't submitted again."""
+        cache = SpriteCache()
+        cache.load(*REQUESTS[0])
+
+        list(cache.prefetch(REQUESTS, executor))
+
+        assert mock_pygame.image.load.call_count == 3
+        assert cache.hits == 1
+        assert cache.misses == 3
+
+    def test_threaded_deduplicates(self, mock_pygame, executor):
+        """A sprite listed twice is decoded once."""
+        list(SpriteCache().prefetch([REQUESTS[0], REQUESTS[0]], executor))
+
+        assert mock_pygame.image.load.call_count == 1
+
+
+class TestSpriteCacheDiskCache:
+    """Tests for sprites restored from the on-disk surface cache."""
+
+    @pytest.fixture
+    def stored(self):
+        """A disk cache whose entries are keyed by name and source digest."""
+        with patch('game_screens.sprite_cache.disk_cache') as mock_disk:
+            mock_disk.enabled.return_value = True
+            mock_disk.file_digest.side_effect = lambda path: f'digest:{path}'
+            mock_disk.load.return_value = None
+            yield mock_disk
+
+    def test_stored_sprite_skips_decode(self, mock_pygame, stored):
+        """A hit is converted for the display without decoding or scaling."""
+        image = Mock()
+        stored.load.return_value = image
+
+        sprite = SpriteCache().load('up.png', (90, 90))
+
+        assert sprite is image.convert_alpha.return_value
+        stored.load.assert_called_once_with(('sprite', 'up.png', (90, 90), True), ('digest:up.png',))
+        mock_pygame.image.load.assert_not_called()
+        mock_pygame.transform.smoothscale.assert_not_called()
+
+    def test_miss_stores_scaled_sprite(self, mock_pygame, stored):
+        """A decoded sprite is written back keyed by its source digest."""
+        sprite = SpriteCache().load('up.png', (90, 90), alpha=False)
+
+        stored.store.assert_called_once_with(('sprite', 'up.png', (90, 90), False), sprite, ('digest:up.png',), False)
+
+    def test_threaded_uses_stored_sprites(self, mock_pygame, stored, executor):
+        """load_many only sends sprites missing from disk to the pool."""
+        image = Mock()
+        stored.load.side_effect = lambda name, inputs: image if name[1] == 'up.png' else None
+
+        sprites = SpriteCache().load_many([('up.png', (90, 90), True), ('down.png', (90, 90), True)], executor)
+
+        assert sprites[0] is image.convert_alpha.return_value
+        mock_pygame.image.load.assert_called_once_with('down.png')
+        assert stored.store.call_count == 1
+
+    def test_prefetch_uses_stored_sprites(self, mock_pygame, stored, executor):
+        """prefetch restores disk hits in its first slice and decodes only the rest."""
+        image = Mock()
+        stored.load.side_effect = lambda name, inputs: image if name[1] == 'up.png' else None
+        cache = SpriteCache()
+
+        progress = list(cache.prefetch([('up.png', (90, 90), True), ('down.png', (90, 90), True)], executor))
+
+        assert progress[0] == 0.5
+        assert cache.load('up.png', (90, 90)) is image.convert_alpha.return_value
+        mock_pygame.image.load.assert_called_once_with('down.png')
+        assert stored.store.call_count == 1
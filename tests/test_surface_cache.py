@@ -0,0 +1,150 @@
+"""Comprehensive tests for SurfaceCache."""
+from unittest.mock import Mock
+from game_screens.surface_cache import ByteBudgetLRU, SurfaceCache, surface_bytes
+
+
+def make_surface(width=10, height=10, bytesize=4):
+    """Create a mock surface with a known pixel footprint."""
+    surf = Mock()
+    surf.get_width.return_value = width
+    surf.get_height.return_value = height
+    surf.get_bytesize.return_value = bytesize
+    return surf
+
+
+class TestSurfaceCache:
+    """Test suite for the SurfaceCache class."""
+
+    def test_surface_bytes(self):
+        """surface_bytes should multiply width, height and bytes per pixel."""
+        assert surface_bytes(make_surface(20, 10, 4)) == 800
+
+    def test_init_creates_empty_cache(self):
+        """SurfaceCache should start empty with zeroed stats."""
+        cache = SurfaceCache(1000)
+
+        assert len(cache) == 0
+        assert cache.bytes_used == 0
+        assert cache.stats() == {
+            'entries': 0, 'bytes': 0, 'max_bytes': 1000,
+            'hits': 0, 'misses': 0, 'evictions': 0,
+        }
+
+    def test_put_and_get(self):
+        """get() should return a stored value and count a hit."""
+        cache = SurfaceCache(1000)
+        surf = make_surface()
+
+        cache.put('a', surf)
+
+        assert cache.get('a') is surf
+        assert cache.hits == 1
+        assert cache.bytes_used == 400
+
+    def test_get_missing_counts_miss(self):
+        """get() on a missing key should return the default and count a miss."""
+        cache = SurfaceCache(1000)
+
+        assert cache.get('missing') is None
+        assert cache.misses == 1
+
+    def test_put_replaces_existing_entry(self):
+        """Replacing an entry should not double-count its bytes."""
+        cache = SurfaceCache(1000)
+        cache.put('a', make_surface())
+        cache.put('a', make_surface(5, 5))
+
+        assert len(cache) == 1
+        assert cache.bytes_used == 100
+
+    def test_put_with_explicit_size(self):
+        """put() should accept an explicit byte size for non-surface values."""
+        cache = SurfaceCache(1000)
+
+        cache.put('pair', (make_surface(), make_surface()), 800)
+
+        assert cache.bytes_used == 800
+
+    def test_evicts_least_recently_used(self):
+        """Exceeding the budget should evict the least recently used entry."""
+        cache = SurfaceCache(1000)
+        cache.put('a', make_surface())
+        cache.put('b', make_surface())
+        cache.get('a')  # 'b' is now the oldest
+
+        cache.put('c', make_surface())
+
+        assert 'a' in cache
+        assert 'c' in cache
+        assert 'b' not in cache
+        assert cache.evictions == 1
+        assert cache.bytes_used <= 1000
+
+    def test_oversized_entry_is_kept(self):
+        """A single entry larger than the budget should still be cached."""
+        cache = SurfaceCache(100)
+        cache.put('small', make_surface(2, 2))
+        cache.put('huge', make_surface(100, 100))
+
+        assert 'huge' in cache
+        assert 'small' not in cache
+
+    def test_get_or_create_builds_once(self):
+        """get_or_create should only call the factory on a miss."""
+        cache = SurfaceCache(1000)
+        factory = Mock(return_value=make_surface())
+
+        first = cache.get_or_create('a', factory)
+        second = cache.get_or_create('a', factory)
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_set_budget_evicts(self):
+        """Shrinking the budget should evict immediately."""
+        cache = SurfaceCache(1000)
+        cache.put('a', make_surface())
+        cache.put('b', make_surface())
+
+        cache.set_budget(500)
+
+        assert len(cache) == 1
+        assert 'b' in cache
+
+    def test_clear(self):
+        """clear() should drop all entries and reset byte usage."""
+        cache = SurfaceCache(1000)
+        cache.put('a', make_surface())
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.bytes_used == 0
+
+
+class TestByteBudgetLRU:
+    """Test suite for the generic ByteBudgetLRU base."""
+
+    def test_sizes_values_with_sizeof(self):
+        """Without nbytes, put() should size values with the cache's sizeof."""
+        cache = ByteBudgetLRU(100, len)
+        cache.put('a', 'x' * 60)
+        cache.put('b', 'y' * 60)
+
+        assert cache.bytes_used == 60
+        assert 'a' not in cache
+
+    def test_explicit_nbytes_wins(self):
+        """An explicit nbytes should override sizeof."""
+        cache = ByteBudgetLRU(100, len)
+        cache.put('a', 'x' * 60, nbytes=5)
+
+        assert cache.bytes_used == 5
+
+    def test_surface_cache_sizes_surfaces(self):
+        """SurfaceCache is a ByteBudgetLRU sized by pixel memory."""
+        cache = SurfaceCache(1000)
+        cache.put('a', make_surface(10, 10, 4))
+
+        assert isinstance(cache, ByteBudgetLRU)
+        assert cache.bytes_used == 400
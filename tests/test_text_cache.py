@@ -0,0 +1,83 @@
+"""Comprehensive tests for TextCache."""
+import pytest
+from unittest.mock import Mock, call
+from game_screens.text_cache import TextCache
+
+
+@pytest.fixture
+def font():
+    """Create a mock font whose rendered surfaces have a known size."""
+    def render(text, antialias, color):
+        surf = Mock()
+        surf.get_width.return_value = 10 * len(text)
+        surf.get_height.return_value = 20
+        surf.get_bytesize.return_value = 4
+        return surf
+
+    mock_font = Mock()
+    mock_font.render.side_effect = render
+    return mock_font
+
+
+class TestTextCache:
+    """Test suite for the TextCache class."""
+
+    def test_render_calls_font_once(self, font):
+        """Repeated renders of the same text should hit the cache."""
+        cache = TextCache()
+
+        first = cache.render(font, "Score: 1", (200, 200, 200))
+        second = cache.render(font, "Score: 1", (200, 200, 200))
+
+        assert first is second
+        font.render.assert_called_once_with("Score: 1", True, (200, 200, 200))
+
+    def test_render_changed_text_renders_again(self, font):
+        """A different string should trigger a new render."""
+        cache = TextCache()
+
+        cache.render(font, "Score: 1", (200, 200, 200))
+        cache.render(font, "Score: 2", (200, 200, 200))
+
+        assert font.render.call_count == 2
+
+    def test_color_and_antialias_are_part_of_key(self, font):
+        """Color and antialias should produce separate entries."""
+        cache = TextCache()
+
+        cache.render(font, "Hi", (255, 255, 255))
+        cache.render(font, "Hi", (100, 100, 100))
+        cache.render(font, "Hi", (255, 255, 255), antialias=False)
+
+        assert font.render.call_count == 3
+
+    def test_render_shadowed_returns_pair(self, font):
+        """render_shadowed should render the shadow and the text once each."""
+        cache = TextCache()
+
+        shadow, text = cache.render_shadowed(font, "W", (255, 255, 255), (0, 0, 0))
+        cache.render_shadowed(font, "W", (255, 255, 255), (0, 0, 0))
+
+        assert font.render.call_args_list == [
+            call("W", True, (0, 0, 0)),
+            call("W", True, (255, 255, 255)),
+        ]
+        assert shadow is not text
+
+    def test_render_shadowed_counts_both_surfaces(self, font):
+        """A shadowed entry should account for both surfaces in the budget."""
+        cache = TextCache()
+
+        cache.render_shadowed(font, "W", (255, 255, 255), (0, 0, 0))
+
+        assert cache.bytes_used == 2 * 10 * 20 * 4
+
+    def test_budget_is_enforced(self, font):
+        """The cache should evict old strings once over budget."""
+        cache = TextCache(max_bytes=2000)
+
+        for i in range(10):
+            cache.render(font, f"{i}", (255, 255, 255))
+
+        assert cache.bytes_used <= 2000
+        assert cache.evictions > 0
@@ -0,0 +1,94 @@
+"""Tests for the procedural button tone synthesizer."""
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens import tones
+from game_screens.tones import ToneSynth
+
+
+@pytest.fixture
+def mock_pygame():
+    """A 44.1kHz 16-bit stereo mixer whose make_sound records the PCM it was given."""
+    with patch('game_screens.tones.pygame') as mock_pg:
+        mock_pg.mixer.get_init.return_value = (44100, -16, 2)
+        mock_pg.sndarray.make_sound.side_effect = lambda pcm: MagicMock(pcm=pcm)
+        yield mock_pg
+
+
+class TestWithoutNumpy:
+    """The synth degrades to silence when NumPy is missing."""
+
+    def test_unavailable_without_numpy(self, mock_pygame):
+        """No NumPy means no tones, and no attempt to build any."""
+        with patch.object(tones, 'numpy', None):
+            synth = ToneSynth()
+            assert not synth.available
+            assert synth.tone(440.0, 100) is None
+            assert synth.button_tones({'up': 440.0}, 100) == {}
+        mock_pygame.sndarray.make_sound.assert_not_called()
+
+    def test_unavailable_without_mixer(self, mock_pygame):
+        """An uninitialized mixer also means no tones."""
+        mock_pygame.mixer.get_init.return_value = None
+        assert not ToneSynth().available
+
+
+class TestSynthesis:
+    """Tests that need NumPy to generate samples."""
+
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip('numpy')
+
+    def test_envelope_shape(self, numpy):
+        """The gain ramps up, settles at the sustain level and ends silent."""
+        gain = tones.envelope_gain((10, 10, 0.5, 10), 100, 1000)
+
+        assert len(gain) == 100
+        assert gain[0] == 0.0
+        assert gain[10] == pytest.approx(1.0)
+        assert gain[50] == pytest.approx(0.5)
+        assert gain[-1] == 0.0
+
+    def test_envelope_fits_short_tones(self, numpy):
+        """A tone shorter than the envelope still gets one gain per sample."""
+        assert len(tones.envelope_gain((50, 50, 0.5, 50), 30, 1000)) == 30
+
+    def test_pcm_matches_mixer_format(self, mock_pygame, numpy):
+        """Samples are int16, one column per mixer channel, within the volume."""
+        sound = ToneSynth(volume=0.5).tone(440.0, 100)
+
+        pcm = sound.pcm
+        assert pcm.dtype == numpy.int16
+        assert pcm.shape == (4410, 2)
+        assert numpy.array_equal(pcm[:, 0], pcm[:, 1])
+        assert numpy.abs(pcm).max() <= 32767 * 0.5 + 1
+
+    def test_unsigned_formats_are_centred(self, mock_pygame, numpy):
+        """8-bit unsigned PCM is silent at 128, not 0."""
+        mock_pygame.mixer.get_init.return_value = (22050, 8, 1)
+        pcm = ToneSynth().tone(440.0, 50).pcm
+
+        assert pcm.dtype == numpy.uint8
+        assert pcm.ndim == 1
+        assert pcm[0] == 128
+
+    def test_tones_cached_by_parameters(self, mock_pygame, numpy):
+        """The same frequency, duration and envelope reuse one Sound."""
+        synth = ToneSynth()
+        first = synth.tone(440.0, 100)
+
+        assert synth.tone(440.0, 100) is first
+        assert synth.tone(440.0, 200) is not first
+        assert synth.tone(440.0, 100, (1, 1, 1.0, 1)) is not first
+        assert mock_pygame.sndarray.make_sound.call_count == 3
+
+    def test_button_tones(self, mock_pygame, numpy):
+        """Every button gets its own tone."""
+        table = ToneSynth().button_tones({'up': 330.0, 'down': 440.0}, 100)
+        assert set(table) == {'up', 'down'}
+        assert table['up'] is not table['down']
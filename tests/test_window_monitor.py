@@ -0,0 +1,85 @@
+"""Tests for WindowMonitor."""
+import sys
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock pygame before importing modules that depend on it
+sys.modules['pygame'] = MagicMock()
+
+from game_screens.window_monitor import WindowMonitor
+
+WINDOW_EVENTS = ('WINDOWHIDDEN', 'WINDOWSHOWN', 'WINDOWMINIMIZED', 'WINDOWRESTORED',
+                 'WINDOWMAXIMIZED', 'WINDOWEXPOSED', 'WINDOWFOCUSLOST', 'WINDOWFOCUSGAINED')
+
+
+@pytest.fixture
+def mock_pygame():
+    """Give each window event type a distinct integer."""
+    with patch('game_screens.window_monitor.pygame') as mock_pg:
+        for number, name in enumerate(WINDOW_EVENTS, start=100):
+            setattr(mock_pg, name, number)
+        yield mock_pg
+
+
+def event(mock_pg, name):
+    return Mock(type=getattr(mock_pg, name))
+
+
+class TestWindowMonitor:
+    """Test suite for the WindowMonitor class."""
+
+    def test_starts_visible_and_focused(self, mock_pygame):
+        """A new monitor should assume the window is up front."""
+        monitor = WindowMonitor()
+
+        assert monitor.suspended is False
+        assert monitor.should_pause is False
+
+    @pytest.mark.parametrize('name', ['WINDOWHIDDEN', 'WINDOWMINIMIZED'])
+    def test_hidden_suspends(self, mock_pygame, name):
+        """Hiding or minimizing the window should suspend rendering and pause."""
+        monitor = WindowMonitor()
+
+        assert monitor.handle_event(event(mock_pygame, name)) is True
+        assert monitor.suspended is True
+        assert monitor.should_pause is True
+
+    @pytest.mark.parametrize('hide, show', [
+        ('WINDOWHIDDEN', 'WINDOWSHOWN'),
+        ('WINDOWMINIMIZED', 'WINDOWRESTORED'),
+        ('WINDOWMINIMIZED', 'WINDOWMAXIMIZED'),
+        ('WINDOWMINIMIZED', 'WINDOWEXPOSED'),
+    ])
+    def test_shown_resumes_rendering(self, mock_pygame, hide, show):
+        """Showing or restoring the window should end the suspension."""
+        monitor = WindowMonitor()
+        monitor.handle_event(event(mock_pygame, hide))
+
+        monitor.handle_event(event(mock_pygame, show))
+
+        assert monitor.suspended is False
+
+    def test_focus_loss_pauses_without_suspending(self, mock_pygame):
+        """An unfocused but visible window should pause but keep drawing."""
+        monitor = WindowMonitor()
+
+        monitor.handle_event(event(mock_pygame, 'WINDOWFOCUSLOST'))
+
+        assert monitor.should_pause is True
+        assert monitor.suspended is False
+
+    def test_focus_gained(self, mock_pygame):
+        """Regaining focus should clear should_pause."""
+        monitor = WindowMonitor()
+        monitor.handle_event(event(mock_pygame, 'WINDOWFOCUSLOST'))
+
+        monitor.handle_event(event(mock_pygame, 'WINDOWFOCUSGAINED'))
+
+        assert monitor.should_pause is False
+
+    def test_other_events_ignored(self, mock_pygame):
+        """Non-window events should be left for the screen."""
+        monitor = WindowMonitor()
+
+        assert monitor.handle_event(Mock(type=2)) is False
+        assert monitor.should_pause is False
@@ -0,0 +1,79 @@
+"""Pack every button sprite state into one pre-scaled atlas image plus a manifest.
+
+Usage:
+    python tools/build_sprite_atlas.py
+
+Writes assets/Typo-buttons/atlas.png and assets/Typo-buttons/atlas.json.
+Each state is smoothscaled once, here, to the size GameScreen draws it at,
+so the game slices the atlas with subsurface() instead of decoding and
+resampling 15 PNGs at startup.  Re-run after changing a button PNG or
+GameScreen.ARROW_SIZE / SPACE_SIZE; a stale atlas is detected by size and
+the game falls back to the individual PNGs.
+"""
+import json
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import pygame
+from game_screens.display import GameScreen
+from game_screens.sprite_atlas import MANIFEST_NAME, MANIFEST_VERSION
+
+ASSET_DIR = os.path.join(ROOT, 'assets', 'Typo-buttons')
+ATLAS_IMAGE = 'atlas.png'
+MAX_WIDTH = 1024
+PADDING = 1  # transparent gutter so smoothscaled edges never bleed into neighbours
+
+
+def scaled_sprites():
+    """Yield (name, state, surface) for every button state at its on-screen size."""
+    for name, files in GameScreen.BUTTON_FILES.items():
+        size = GameScreen.button_size(name)
+        for state, filename in zip(GameScreen.BUTTON_STATES, files):
+            source = pygame.image.load(os.path.join(ASSET_DIR, filename)).convert_alpha()
+            yield name, state, pygame.transform.smoothscale(source, size)
+
+
+def pack(sprites):
+    """Shelf-pack sprites tallest first; return ({name: {state: rect}}, (width, height))."""
+    rects = {}
+    x = y = shelf_h = width = 0
+    for name, state, surf in sorted(sprites, key=lambda item: -item[2].get_height()):
+        w, h = surf.get_size()
+        if x and x + w > MAX_WIDTH:
+            x, y, shelf_h = 0, y + shelf_h + PADDING, 0
+        rects.setdefault(name, {})[state] = [x, y, w, h]
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+        width = max(width, x - PADDING)
+    return rects, (width, y + shelf_h)
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    sprites = list(scaled_sprites())
+    rects, size = pack(sprites)
+
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    for name, state, surf in sprites:
+        # BLEND_RGBA_MAX onto the zeroed atlas copies pixels verbatim, alpha included
+        atlas.blit(surf, rects[name][state][:2], special_flags=pygame.BLEND_RGBA_MAX)
+
+    pygame.image.save(atlas, os.path.join(ASSET_DIR, ATLAS_IMAGE))
+    manifest = {'version': MANIFEST_VERSION, 'image': ATLAS_IMAGE, 'sprites': rects}
+    with open(os.path.join(ASSET_DIR, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"Packed {len(sprites)} sprites into {size[0]}x{size[1]} {ATLAS_IMAGE}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()